@@ -31,6 +31,16 @@ class NotFound(NoSuccess):
     http_code = 404
 
 
+class CircuitOpen(PyCamundaException):
+    """Exception that is raised when requests to an engine are not sent because it kept
+    failing.
+    """
+
+
+class DeadlineExceeded(PyCamundaException):
+    """Exception that is raised when the deadline of a request passed."""
+
+
 class InternalServerError(PyCamundaException):
     """Exception that is raised when there occurred an error on Camunda server side."""
     http_code = 500
@@ -6,6 +6,7 @@ from __future__ import annotations
 import dataclasses
 import typing
 
+import pycamunda.base
 import pycamunda.incident
 
 
@@ -42,6 +43,7 @@ class TransitionInstance:
         )
 
 
+@pycamunda.base._slotted
 @dataclasses.dataclass
 class ActivityInstance:
     """Data class of activity instance as returned by the REST api of Camunda."""
@@ -64,11 +66,11 @@ class ActivityInstance:
         activity_instance = cls(
             id_=data['id'],
             parent_activity_instance_id=data['parentActivityInstanceId'],
-            activity_id=data['activityId'],
-            activity_name=data['activityName'],
-            activity_type=data['activityType'],
+            activity_id=pycamunda.base._intern(data['activityId']),
+            activity_name=pycamunda.base._intern(data['activityName']),
+            activity_type=pycamunda.base._intern(data['activityType']),
             process_instance_id=data['processInstanceId'],
-            process_definition_id=data['processDefinitionId'],
+            process_definition_id=pycamunda.base._intern(data['processDefinitionId']),
             child_activity_instances=tuple(
                 cls.load(activity_json) for activity_json in data['childActivityInstances']
             ),
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides an asyncio client for sending requests with `CamundaRequest.acall`."""
+
+from __future__ import annotations
+import asyncio
+import typing
+import urllib.parse
+
+import requests
+import requests.auth
+import requests.structures
+import requests.utils
+
+import pycamunda
+import pycamunda.client
+import pycamunda.codec
+import pycamunda.limit
+import pycamunda.retry
+
+if typing.TYPE_CHECKING:
+    import aiohttp
+
+
+__all__ = ['AsyncClient']
+
+
+class AsyncClient:
+
+    def __init__(
+        self,
+        url: str = None,
+        auth: typing.Any = None,
+        pool_maxsize: int = 100,
+        keep_alive: bool = True,
+        timeout: float = None,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        retry: pycamunda.retry.RetryPolicy = None,
+        circuit_breaker: pycamunda.retry.CircuitBreaker = None,
+        rate_limiter: pycamunda.limit.RateLimiter = None,
+        concurrency_limit: pycamunda.limit.ConcurrencyLimit = None,
+        keep_cookies: bool = False
+    ):
+        """Asyncio client with its own connection pool. Requests are sent with it by awaiting
+        `acall` of the request object. Requires `aiohttp`.
+
+        :param url: Camunda Rest engine URL. Relative urls of requests sent with this client are
+                    resolved against it.
+        :param auth: Authentication used for all requests sent with this client. Accepts the same
+                     authentication objects as `requests`.
+        :param pool_maxsize: Maximum number of simultaneously open connections.
+        :param keep_alive: Whether connections are kept open and reused between requests.
+        :param timeout: Default total timeout in seconds for requests that do not set one
+                        explicitly.
+        :param connect_timeout: Default time in seconds to wait for a connection to Camunda.
+        :param read_timeout: Default time in seconds to wait for data from Camunda.
+        :param retry: Policy for retrying failed requests. If `None`, requests are not retried.
+        :param circuit_breaker: Circuit breaker that stops sending requests to failing engines.
+        :param rate_limiter: Rate limits of endpoint families like external tasks.
+        :param concurrency_limit: Adaptive limit of the number of concurrent requests.
+        :param keep_cookies: Whether cookies set by responses are stored and sent with later
+                             requests.
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:  # pragma: no cover
+            raise ImportError(
+                'AsyncClient requires aiohttp. Install it with "pip install pycamunda[async]".'
+            ) from None
+        self.url = url.rstrip('/') if url is not None else None
+        self.auth = auth
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.concurrency_limit = concurrency_limit
+        self.keep_cookies = keep_cookies
+        self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The underlying `aiohttp` session. It is created on first use inside the running event
+        loop.
+        """
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize, force_close=not self.keep_alive
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=(
+                    aiohttp.CookieJar(unsafe=True) if self.keep_cookies
+                    else aiohttp.DummyCookieJar()
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=self.timeout, connect=self.connect_timeout, sock_read=self.read_timeout
+                )
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: typing.Mapping[str, typing.Any] = None,
+        json: typing.Any = None,
+        data: typing.Any = None,
+        files: typing.Mapping[str, typing.Any] = None,
+        auth: typing.Any = None,
+        timeout: typing.Union[float, typing.Tuple[float, float]] = None
+    ) -> requests.Response:
+        """Send a http request.
+
+        :param method: Http method of the request.
+        :param url: Url to send the request to.
+        :param params: Query parameters.
+        :param json: JSON-serializable body.
+        :param data: Form-encoded body.
+        :param files: Files to attach as multipart form data.
+        :param auth: Authentication overriding the one of the client.
+        :param timeout: Total timeout in seconds overriding the one of the client. Can be a tuple
+                        of connect and read timeout instead.
+        :return: The response with its content already read.
+        """
+        import aiohttp
+
+        url = pycamunda.client._resolve(self.url, url)
+        kwargs = {}
+        if params:
+            kwargs['params'] = urllib.parse.urlencode(params, doseq=True)
+        if files:
+            kwargs['data'] = _form_data(data=data, files=files)
+        elif json is not None:
+            kwargs['data'] = pycamunda.codec.get_codec().dumps(json)
+            kwargs['headers'] = {'Content-Type': 'application/json'}
+        elif data is not None:
+            kwargs['data'] = data
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            kwargs['timeout'] = aiohttp.ClientTimeout(
+                total=self.timeout,
+                connect=connect if connect is not None else self.connect_timeout,
+                sock_read=read if read is not None else self.read_timeout
+            )
+        elif timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+        auth = auth if auth is not None else self.auth
+        if auth is not None:
+            kwargs['headers'] = {
+                **kwargs.get('headers', {}), **_auth_headers(auth=auth, method=method, url=url)
+            }
+
+        try:
+            async with self.session.request(method=method, url=url, **kwargs) as resp:
+                content = await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            raise pycamunda.PyCamundaException(exc) from exc
+
+        response = pycamunda.client.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.url = str(resp.url)
+        response.headers = requests.structures.CaseInsensitiveDict(resp.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = content
+        return response
+
+    async def close(self) -> None:
+        """Close all connections of the client."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(url={self.url!r})'
+
+
+def _auth_headers(auth: typing.Any, method: str, url: str) -> typing.Mapping[str, str]:
+    """Get the headers a `requests` authentication object would add to a request.
+
+    :param auth: Authentication object or tuple of username and password.
+    :param method: Http method of the request.
+    :param url: Url of the request.
+    :return: The headers to send.
+    """
+    if isinstance(auth, tuple):
+        auth = requests.auth.HTTPBasicAuth(*auth)
+    prepared = requests.PreparedRequest()
+    prepared.prepare(method=method, url=url)
+    headers = dict(prepared.headers)
+    prepared = auth(prepared)
+    return {key: value for key, value in prepared.headers.items() if headers.get(key) != value}
+
+
+def _form_data(
+    data: typing.Mapping[str, typing.Any], files: typing.Mapping[str, typing.Any]
+) -> aiohttp.FormData:
+    """Build multipart form data the same way `requests` does for `data` and `files`.
+
+    :param data: Form fields.
+    :param files: Files as file objects, bytes or tuples of file name, content and content type.
+    :return: The form data.
+    """
+    import aiohttp
+
+    form = aiohttp.FormData()
+    for key, value in (data or {}).items():
+        if value is not None:
+            form.add_field(key, value if isinstance(value, bytes) else str(value))
+    for key, value in files.items():
+        content_type = None
+        if isinstance(value, tuple):
+            if len(value) > 2:
+                filename, value, content_type = value[:3]
+            else:
+                filename, value = value
+        else:
+            filename = requests.utils.guess_filename(value) or key
+        form.add_field(key, value, filename=filename, content_type=content_type)
+    return form
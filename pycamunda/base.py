@@ -1,17 +1,39 @@
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
+import asyncio
+import concurrent.futures
+import contextvars
+import copy
+import dataclasses
 import enum
 import datetime as dt
+import functools
+import re
+import sys
+import threading
+import time
 import typing
 import json
 
 import requests
 
+import pycamunda.client
+import pycamunda.deadline
+import pycamunda.limit
 import pycamunda.request
+import pycamunda.retry
+
+if typing.TYPE_CHECKING:
+    import pycamunda.asyncclient
 
 
 __all__ = ['isoformat', 'from_isoformat']
 
+Timeout = typing.Optional[
+    typing.Union[float, typing.Tuple[typing.Optional[float], typing.Optional[float]]]
+]
+
 
 def value_is_true(self, obj: typing.Any, obj_type: typing.Any) -> bool:
     return bool(obj.__dict__[self.name])
@@ -27,47 +49,261 @@ class RequestMethod(enum.Enum):
     HEAD = 'HEAD'
 
 
+class _PendingRequest(Exception):
+
+    def __init__(self, *requests):
+        """Exception that is raised while replaying a request whose responses are not available yet.
+
+        :param requests: Keyword arguments of each http request that has to be sent.
+        """
+        super().__init__()
+        self.requests = requests
+
+
+class _Replay:
+
+    def __init__(self):
+        """Responses that were received for a request object that is called repeatedly until all
+        the http requests it sends are answered.
+        """
+        self.responses = []
+        self.index = 0
+
+    def next(self, *requests) -> typing.List[requests.Response]:
+        if self.index + len(requests) <= len(self.responses):
+            self.index += len(requests)
+            return self.responses[self.index - len(requests):self.index]
+        raise _PendingRequest(*requests)
+
+
 class CamundaRequest(pycamunda.request.Request):
 
+    retry_safe = False
+    long_polling = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.auth = None
         self.session = None
+        self.timeout = None
         self._files = None
+        self._replay = None
+        self._retried = False
 
     @property
     def files(self):
         return self._files
 
-    def __call__(self, method: RequestMethod, *args, **kwargs) -> requests.Response:
+    @property
+    def client(self) -> requests.Session:
+        """Session the request is sent with. Falls back to the shared default client."""
+        if self.session is not None:
+            return self.session
+        return pycamunda.client.default_client()
+
+    def _send(
+        self,
+        method: RequestMethod,
+        url: str,
+        params: typing.Mapping[str, typing.Any] = None,
+        json: typing.Any = None,
+        data: typing.Any = None,
+        files: typing.Any = None
+    ) -> requests.Response:
+        """Send a http request using the client of this request.
+
+        :param method: Http method of the request.
+        :param url: Url to send the request to.
+        :param params: Query parameters.
+        :param json: JSON-serializable body.
+        :param data: Form-encoded body.
+        :param files: Files to attach.
+        :return: The successful response.
+        """
+        return self._send_all([
+            dict(method=method, url=url, params=params, json=json, data=data, files=files)
+        ])[0]
+
+    def _send_all(
+        self, requests_: typing.Sequence[typing.Mapping[str, typing.Any]], max_workers: int = None
+    ) -> typing.List[requests.Response]:
+        """Send multiple http requests concurrently using the client of this request.
+
+        :param requests_: Keyword arguments of `_send` for each http request.
+        :param max_workers: Maximum number of requests sent at the same time. Defaults to the
+                            connection pool size of the client.
+        :return: The successful responses in the order of the requests.
+        """
+        kwargs = {}
+        if self.auth is not None:
+            kwargs['auth'] = self.auth
+        requests_ = [
+            {**request, 'method': request['method'].value, **kwargs} for request in requests_
+        ]
+
+        if self._replay is not None:
+            responses = self._replay.next(*requests_)
+        elif len(requests_) <= 1:
+            responses = [self._request(**request) for request in requests_]
+        else:
+            if max_workers is None:
+                max_workers = getattr(self.client, 'pool_maxsize', 10)
+            contexts = [contextvars.copy_context() for _ in requests_]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(
+                    lambda context, request: context.run(self._request, **request),
+                    contexts,
+                    requests_
+                ))
+
+        for response in responses:
+            if not response:
+                pycamunda.base._raise_for_status(response)
+        return responses
+
+    def _flight_key(self) -> typing.Hashable:
+        """Key of the in-flight request that identical concurrent calls share."""
+        auth = self.auth
         try:
-            if self.session is not None:
-                kwargs = {}
-                if self.auth is not None:
-                    kwargs['auth'] = self.auth
-                response = self.session.request(
-                    method=method.value,
-                    url=self.url,
-                    params=self.query_parameters(),
-                    json=self.body_parameters(),
-                    files=self.files,
-                    **kwargs
-                )
+            hash(auth)
+        except TypeError:
+            auth = id(auth)
+        query = json.dumps(self.query_parameters(), sort_keys=True, default=str)
+        return 'GET', self.url, query, id(self.client), auth
+
+    def _retrying(self, client: typing.Any, method: str, url: str) -> pycamunda.retry.Retrying:
+        return pycamunda.retry.Retrying(
+            method=method,
+            url=url,
+            safe=self.retry_safe,
+            retry=getattr(client, 'retry', None),
+            circuit_breaker=getattr(client, 'circuit_breaker', None)
+        )
+
+    def _limiting(self, client: typing.Any, method: str, url: str) -> pycamunda.limit.Limiting:
+        concurrency_limit = None
+        if not self.long_polling:
+            concurrency_limit = getattr(client, 'concurrency_limit', None)
+        return pycamunda.limit.Limiting(
+            method=method,
+            url=url,
+            rate_limiter=getattr(client, 'rate_limiter', None),
+            concurrency_limit=concurrency_limit,
+            kind=f'{type(self).__module__}.{type(self).__qualname__}'
+        )
+
+    def _default_timeout(self) -> Timeout:
+        """Timeout of the http requests if `timeout` is not set. If `None`, the timeout of the
+        client is used.
+        """
+        return None
+
+    def _timeout(self, remaining: typing.Optional[float]) -> Timeout:
+        """Get the timeout of the next http request shortened to the time remaining until the
+        deadline.
+
+        :param remaining: Time in seconds remaining until the deadline.
+        """
+        timeout = self.timeout if self.timeout is not None else self._default_timeout()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if part is None else min(part, remaining) for part in timeout)
+        return min(timeout, remaining)
+
+    def _request(self, **kwargs) -> requests.Response:
+        client = self.client
+        retrying = self._retrying(client, method=kwargs['method'], url=kwargs['url'])
+        limiting = self._limiting(client, method=kwargs['method'], url=kwargs['url'])
+        while True:
+            timeout = self._timeout(limiting.acquire(retrying.before()))
+            try:
+                if timeout is not None:
+                    response = client.request(**kwargs, timeout=timeout)
+                else:
+                    response = client.request(**kwargs)
+            except requests.exceptions.RequestException as exc:
+                limiting.release(exc=exc)
+                delay = retrying.after(exc=exc)
+                if delay is None:
+                    raise pycamunda.PyCamundaException(exc)
+                reached = not pycamunda.retry._is_connect_error(exc)
+            except BaseException:
+                limiting.release()
+                raise
             else:
-                response = requests.request(
-                    method=method.value,
-                    url=self.url,
-                    params=self.query_parameters(),
-                    json=self.body_parameters(),
-                    auth=self.auth,
-                    files=self.files
-                )
-        except requests.exceptions.RequestException as exc:
-            raise pycamunda.PyCamundaException(exc)
-        if not response:
-            pycamunda.base._raise_for_status(response)
+                limiting.release(response=response)
+                delay = retrying.after(response=response)
+                if delay is None:
+                    return response
+                reached = True
+            if reached:
+                self._retried = True
+            time.sleep(delay)
+
+    async def _arequest(
+        self, client: pycamunda.asyncclient.AsyncClient, **kwargs
+    ) -> requests.Response:
+        retrying = self._retrying(client, method=kwargs['method'], url=kwargs['url'])
+        limiting = self._limiting(client, method=kwargs['method'], url=kwargs['url'])
+        while True:
+            timeout = self._timeout(await limiting.aacquire(retrying.before()))
+            try:
+                if timeout is not None:
+                    response = await client.request(**kwargs, timeout=timeout)
+                else:
+                    response = await client.request(**kwargs)
+            except pycamunda.PyCamundaException as exc:
+                limiting.release(exc=exc.__cause__ or exc)
+                delay = retrying.after(exc=exc.__cause__ or exc)
+                if delay is None:
+                    raise
+                reached = not pycamunda.retry._is_connect_error(exc.__cause__ or exc)
+            except BaseException:
+                limiting.release()
+                raise
+            else:
+                limiting.release(response=response)
+                delay = retrying.after(response=response)
+                if delay is None:
+                    return response
+                reached = True
+            if reached:
+                self._retried = True
+            await asyncio.sleep(delay)
 
-        return response
+    def __call__(self, method: RequestMethod, *args, **kwargs) -> requests.Response:
+        return self._send(
+            method=method,
+            url=self.url,
+            params=self.query_parameters(),
+            json=self.body_parameters(),
+            files=self.files
+        )
+
+    async def acall(self, client: pycamunda.asyncclient.AsyncClient, *args, **kwargs) -> typing.Any:
+        """Send the request asynchronously. The result is the same as calling the request object.
+
+        The request object is called and every http request it sends is awaited with `client`.
+        Afterwards the call is repeated with the received responses until it completes.
+
+        :param client: Asyncio client to send the request with.
+        """
+        replay = _Replay()
+        while True:
+            replay.index = 0
+            self._replay = replay
+            try:
+                return self(*args, **kwargs)
+            except _PendingRequest as pending:
+                requests_ = pending.requests
+            finally:
+                self._replay = None
+            replay.responses.extend(
+                await asyncio.gather(*(self._arequest(client, **request) for request in requests_))
+            )
 
     def body_parameters(self, apply: typing.Callable = ...):
         if apply is Ellipsis:
@@ -88,13 +324,12 @@ def isoformat(datetime_: typing.Union[dt.date, dt.datetime]) -> str:
     :return: Isoformat datetime or date string.
     """
     if isinstance(datetime_, dt.datetime):
-        dt_str = datetime_.strftime('%Y-%m-%dT%H:%M:%S.{ms}%z')
-        ms = datetime_.microsecond // 1000
-        dt_str = dt_str.format(ms=str(ms).zfill(3))
-    else:
-        dt_str = datetime_.strftime('%Y-%m-%d')
-
-    return dt_str
+        dt_str = datetime_.isoformat(timespec='milliseconds')
+        offset = datetime_.utcoffset()
+        if offset is None:
+            return dt_str
+        return dt_str[:23] + _format_utcoffset(offset)
+    return datetime_.isoformat()
 
 
 def from_isoformat(datetime_str: str) -> dt.datetime:
@@ -103,7 +338,114 @@ def from_isoformat(datetime_str: str) -> dt.datetime:
     :param datetime_str: String to convert.
     :return: Converted datetime.
     """
-    return dt.datetime.strptime(datetime_str, '%Y-%m-%dT%H:%M:%S.%f%z')
+    try:
+        if len(datetime_str) > 5 and datetime_str[-5] in '+-':
+            # the timezones of Camunda's +HHMM offsets are shared between all parsed datetimes
+            local = dt.datetime.fromisoformat(datetime_str[:-5])
+            return dt.datetime(
+                local.year,
+                local.month,
+                local.day,
+                local.hour,
+                local.minute,
+                local.second,
+                local.microsecond,
+                _parse_utcoffset(datetime_str[-5:])
+            )
+        return dt.datetime.fromisoformat(datetime_str)
+    except ValueError:
+        return _parse_isoformat(datetime_str)
+
+
+_ISOFORMAT_PATTERN = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:?\d{2})?$'
+)
+
+
+def _parse_isoformat(datetime_str: str) -> dt.datetime:
+    """Convert isoformat strings `datetime.fromisoformat` does not support to a datetime object.
+
+    :param datetime_str: String to convert.
+    :return: Converted datetime.
+    """
+    match = _ISOFORMAT_PATTERN.match(datetime_str)
+    if match is None:
+        return dt.datetime.strptime(datetime_str, '%Y-%m-%dT%H:%M:%S.%f%z')
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    return dt.datetime(
+        year=int(year),
+        month=int(month),
+        day=int(day),
+        hour=int(hour),
+        minute=int(minute),
+        second=int(second),
+        microsecond=int(fraction.ljust(6, '0')) if fraction is not None else 0,
+        tzinfo=_parse_utcoffset(offset) if offset is not None else None
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_utcoffset(offset: str) -> dt.timezone:
+    """Get the timezone of an UTC offset string like `+0100`, `-01:00` or `Z`.
+
+    :param offset: UTC offset string.
+    :return: Timezone, shared between all calls with the same offset.
+    """
+    if offset == 'Z':
+        return dt.timezone.utc
+    minutes = int(offset[1:3]) * 60 + int(offset[-2:])
+    return dt.timezone(dt.timedelta(minutes=-minutes if offset[0] == '-' else minutes))
+
+
+@functools.lru_cache(maxsize=64)
+def _format_utcoffset(offset: dt.timedelta) -> str:
+    """Format an UTC offset like `strftime` does for `%z`.
+
+    :param offset: UTC offset.
+    :return: UTC offset string like `+0100`.
+    """
+    sign = '-' if offset < dt.timedelta(0) else '+'
+    hours, rest = divmod(abs(offset), dt.timedelta(hours=1))
+    minutes, rest = divmod(rest, dt.timedelta(minutes=1))
+    offset_str = f'{sign}{hours:02d}{minutes:02d}'
+    if rest:
+        offset_str += f'{rest.seconds:02d}'
+        if rest.microseconds:
+            offset_str += f'.{rest.microseconds:06d}'
+    return offset_str
+
+
+def _slotted(cls: type) -> type:
+    """Recreate a dataclass with `__slots__` so that its instances have no `__dict__`. This does
+    the same as `dataclasses.dataclass(slots=True, weakref_slot=True)` of Python 3.11, so
+    instances can still be weakly referenced.
+
+    :param cls: Dataclass to recreate.
+    :return: The dataclass with slots.
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in field_names + ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = field_names
+    if not any(hasattr(base, '__weakref__') for base in cls.__bases__):
+        namespace['__slots__'] += ('__weakref__',)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+def _intern(value: typing.Any) -> typing.Any:
+    """Intern strings that are repeated across many objects, like definition ids or topic names,
+    so that all objects share one instance.
+
+    :param value: String to intern. Other values are returned unchanged.
+    :return: The interned string.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
 
 
 def prepare(value: typing.Any) -> typing.Any:
@@ -157,6 +499,46 @@ def _raise_for_status(response: requests.Response) -> None:
     raise pycamunda.NoSuccess(response.text)
 
 
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def _coalescing(call: typing.Callable) -> typing.Callable:
+    """Decorator for the `__call__` method of GET requests that lets concurrent identical calls
+    share one in-flight request and its parsed result. Calls are identical if they send the same
+    url and query parameters with the same client and authentication. Calls that start after the
+    shared request finished send a new request.
+    """
+    @functools.wraps(call)
+    def wrapper(self, *args, **kwargs):
+        if self._replay is not None or args or kwargs:
+            return call(self, *args, **kwargs)
+        key = self._flight_key()
+        with _flights_lock:
+            future = _flights.get(key)
+            leader = future is None
+            if leader:
+                future = _flights[key] = concurrent.futures.Future()
+        if not leader:
+            try:
+                return future.result(timeout=pycamunda.deadline.remaining())
+            except concurrent.futures.TimeoutError:
+                raise pycamunda.DeadlineExceeded('The deadline of the request passed.') from None
+        try:
+            result = call(self)
+        except BaseException as exc:
+            with _flights_lock:
+                del _flights[key]
+            future.set_exception(exc)
+            raise
+        with _flights_lock:
+            del _flights[key]
+        future.set_result(result)
+        return result
+
+    return wrapper
+
+
 class _PathMixin:
     @property
     def url(self):
@@ -165,3 +547,117 @@ class _PathMixin:
         if self.tenant_id is not None:
             return self._url.format(path=f'key/{self.key}/tenant-id/{self.tenant_id}')
         return self._url.format(path=f'key/{self.key}')
+
+
+class _PaginationMixin:
+
+    def _get_page(self, first_result: int, max_results: int) -> typing.Tuple[typing.Any]:
+        page = copy.copy(self)
+        page.first_result = first_result
+        page.max_results = max_results
+        return page()
+
+    def iter_pages(
+        self, page_size: int = 100, prefetch: bool = False
+    ) -> typing.Iterator[typing.Tuple[typing.Any]]:
+        """Send the request page by page and yield the result of each page lazily. Pagination
+        starts at `first_result` and stops after `max_results` results if they are set.
+
+        To get stable pages the results should be sorted using `sort_by`.
+
+        :param page_size: Maximum number of results per page.
+        :param prefetch: Whether to request the next page in a background thread while the current
+                         page is consumed.
+        """
+        assert page_size > 0, '\'page_size\' has to be positive.'
+        first_result = self.first_result or 0
+        remaining = self.max_results
+        executor = None
+        if prefetch:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            size = page_size if remaining is None else min(page_size, remaining)
+            if executor is not None and size > 0:
+                future = executor.submit(
+                    contextvars.copy_context().run, self._get_page, first_result, size
+                )
+            while size > 0:
+                if executor is not None:
+                    page = future.result()
+                else:
+                    page = self._get_page(first_result, size)
+
+                first_result += size
+                if remaining is not None:
+                    remaining -= size
+                last_page = len(page) < size
+                size = page_size if remaining is None else min(page_size, remaining)
+                if last_page:
+                    size = 0
+                if executor is not None and size > 0:
+                    future = executor.submit(
+                        contextvars.copy_context().run, self._get_page, first_result, size
+                    )
+
+                if page:
+                    yield page
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def iter_all(self, page_size: int = 100, prefetch: bool = False) -> typing.Iterator[typing.Any]:
+        """Send the request page by page and yield the results one by one lazily.
+
+        :param page_size: Maximum number of results requested per page.
+        :param prefetch: Whether to request the next page in a background thread while the current
+                         page is consumed.
+        """
+        for page in self.iter_pages(page_size=page_size, prefetch=prefetch):
+            yield from page
+
+    def count(self) -> int:
+        """Send the count request of this request. Pagination and sorting parameters are ignored.
+
+        :return: Number of results this request returns without pagination.
+        """
+        ignored_keys = {
+            self._parameters[name].key
+            for name in ('first_result', 'max_results', 'sort_by', 'ascending')
+            if name in self._parameters
+        }
+        params = {
+            key: value for key, value in self.query_parameters().items() if key not in ignored_keys
+        }
+        response = self._send(method=RequestMethod.GET, url=self.url + '/count', params=params)
+
+        return int(response.json()['count'])
+
+    def get_all(self, page_size: int = 1000, max_workers: int = 4) -> typing.Tuple[typing.Any]:
+        """Send the request for all results in parallel pages. The number of results is requested
+        first, afterwards the pages are requested concurrently and joined in the order of the
+        results. Pagination starts at `first_result` and stops after `max_results` results if
+        they are set.
+
+        To get consistent pages the results should be sorted using `sort_by`.
+
+        :param page_size: Maximum number of results per page.
+        :param max_workers: Maximum number of pages that are requested at the same time.
+        :return: All results.
+        """
+        assert page_size > 0, '\'page_size\' has to be positive.'
+        first_result = self.first_result or 0
+        last_result = self.count()
+        if self.max_results is not None:
+            last_result = min(last_result, first_result + self.max_results)
+
+        starts = range(first_result, last_result, page_size)
+        sizes = [min(page_size, last_result - start) for start in starts]
+        contexts = [contextvars.copy_context() for _ in starts]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = executor.map(
+                lambda context, start, size: context.run(self._get_page, start, size),
+                contexts,
+                starts,
+                sizes
+            )
+            return tuple(result for page in pages for result in page)
@@ -89,7 +89,7 @@ class BatchStats:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     batch_id = QueryParameter('batchId')
     type_ = QueryParameter('type')
@@ -273,7 +273,7 @@ class Delete(pycamunda.base.CamundaRequest):
         super().__call__(pycamunda.base.RequestMethod.DELETE, *args, **kwargs)
 
 
-class GetStats(pycamunda.base.CamundaRequest):
+class GetStats(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     batch_id = QueryParameter('batchId')
     type_ = QueryParameter('type')
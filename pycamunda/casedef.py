@@ -47,7 +47,7 @@ class CaseDefinition:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('caseDefinitionId')
     id_in = QueryParameter('caseDefinitionIdIn')
@@ -44,7 +44,7 @@ class CaseInstance:
         return case_instance
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     case_instance_id = QueryParameter('caseInstanceId')
     business_key = QueryParameter('businessKey')
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides a pooled client that can be shared by all requests."""
+
+from __future__ import annotations
+import http.cookiejar
+import threading
+import typing
+import urllib.parse
+
+import requests
+import requests.adapters
+
+import pycamunda.codec
+import pycamunda.limit
+import pycamunda.retry
+
+
+__all__ = ['Client', 'Response', 'default_client']
+
+_REJECT_COOKIES = http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+
+
+class Response(requests.Response):
+    """Response that decodes its JSON content with the codec set in `pycamunda.codec`."""
+
+    def json(self, **kwargs) -> typing.Any:
+        if kwargs:
+            return super().json(**kwargs)
+        return pycamunda.codec.get_codec().loads(self.content)
+
+
+class HTTPAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter that returns `Response` objects."""
+
+    def build_response(self, req: requests.PreparedRequest, resp: typing.Any) -> Response:
+        response = super().build_response(req, resp)
+        response.__class__ = Response
+        return response
+
+
+class Client(requests.Session):
+
+    def __init__(
+        self,
+        url: str = None,
+        auth: typing.Any = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: typing.Union[float, typing.Tuple[float, float]] = None,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        retry: pycamunda.retry.RetryPolicy = None,
+        circuit_breaker: pycamunda.retry.CircuitBreaker = None,
+        rate_limiter: pycamunda.limit.RateLimiter = None,
+        concurrency_limit: pycamunda.limit.ConcurrencyLimit = None,
+        keep_cookies: bool = False
+    ):
+        """Session that keeps a bounded pool of connections to the Camunda REST api. Requests are
+        bound to a client by setting their `session` attribute.
+
+        Cookies set by responses are rejected unless `keep_cookies` is set, so requests sent with
+        different authentication cannot pick up each other's session cookies.
+
+        :param url: Camunda Rest engine URL. Relative urls of requests sent with this client are
+                    resolved against it.
+        :param auth: Authentication used for all requests sent with this client.
+        :param pool_connections: Number of connection pools to cache, one per host.
+        :param pool_maxsize: Maximum number of connections kept open per host.
+        :param pool_block: Whether to wait for a free connection when the pool is exhausted instead
+                           of opening a connection that is discarded afterwards.
+        :param keep_alive: Whether connections are kept open and reused between requests.
+        :param timeout: Default timeout in seconds for requests that do not set one explicitly.
+                        Can be a tuple of connect and read timeout. Overrides `connect_timeout`
+                        and `read_timeout`.
+        :param connect_timeout: Default time in seconds to wait for a connection to Camunda.
+        :param read_timeout: Default time in seconds to wait for data from Camunda.
+        :param retry: Policy for retrying failed requests. If `None`, requests are not retried.
+        :param circuit_breaker: Circuit breaker that stops sending requests to failing engines.
+        :param rate_limiter: Rate limits of endpoint families like external tasks.
+        :param concurrency_limit: Adaptive limit of the number of concurrent requests.
+        :param keep_cookies: Whether cookies set by responses are stored and sent with later
+                             requests.
+        """
+        super().__init__()
+        self.url = url.rstrip('/') if url is not None else None
+        self.auth = auth
+        self.timeout = timeout if timeout is not None else (connect_timeout, read_timeout)
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.concurrency_limit = concurrency_limit
+        self.keep_alive = keep_alive
+        self.pool_maxsize = pool_maxsize
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
+        if not keep_cookies:
+            self.cookies.set_policy(_REJECT_COOKIES)
+
+    def resolve(self, url: str) -> str:
+        """Resolve a url relative to the engine url of the client.
+
+        :param url: Absolute url or path relative to `url`.
+        :return: The absolute url.
+        """
+        return _resolve(self.url, url)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        url = self.resolve(url)
+        timeout = kwargs.get('timeout', None)
+        if timeout is None:
+            kwargs['timeout'] = self.timeout
+        elif isinstance(timeout, tuple):
+            defaults = self.timeout if isinstance(self.timeout, tuple) else (self.timeout,) * 2
+            kwargs['timeout'] = tuple(
+                default if part is None else part for part, default in zip(timeout, defaults)
+            )
+        return super().request(method=method, url=url, **kwargs)
+
+    def prepare_request(self, request: requests.Request) -> requests.PreparedRequest:
+        if request.json is not None and not request.data and not request.files:
+            request.data = pycamunda.codec.get_codec().dumps(request.json)
+            request.json = None
+            request.headers = {**(request.headers or {}), 'Content-Type': 'application/json'}
+        return super().prepare_request(request)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(url={self.url!r})'
+
+
+def _resolve(base: typing.Optional[str], url: str) -> str:
+    if base is None or urllib.parse.urlsplit(url).scheme:
+        return url
+    return f'{base}/{url.lstrip("/")}'
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def default_client() -> Client:
+    """Get the client that is used by requests without a session. It is created on first use and
+    shared afterwards.
+
+    :return: The shared default client.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
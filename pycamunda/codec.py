@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides the JSON codec used for request bodies and responses."""
+
+from __future__ import annotations
+import json
+import typing
+
+
+__all__ = ['Codec', 'get_codec', 'set_codec']
+
+
+class Codec:
+
+    def __init__(
+        self,
+        name: str,
+        dumps: typing.Callable[[typing.Any], bytes],
+        loads: typing.Callable[[typing.Union[bytes, str]], typing.Any]
+    ):
+        """JSON codec that encodes directly to bytes and decodes bytes or strings.
+
+        :param name: Name of the codec.
+        :param dumps: Callable that encodes an object to JSON bytes.
+        :param loads: Callable that decodes JSON bytes or strings.
+        """
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        """Encode an object to JSON.
+
+        :param obj: Object to encode.
+        :return: UTF-8 encoded JSON.
+        """
+        return self._dumps(obj)
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        """Decode JSON.
+
+        :param data: JSON bytes or string.
+        :return: The decoded object.
+        """
+        try:
+            return self._loads(data)
+        except json.JSONDecodeError:
+            raise
+        except ValueError as exc:
+            doc = data.decode('utf-8', 'replace') if isinstance(data, bytes) else data
+            raise json.JSONDecodeError(str(exc), doc, 0) from exc
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(name={self.name!r})'
+
+
+def _stdlib_codec() -> Codec:
+    return Codec(
+        name='json',
+        dumps=lambda obj: json.dumps(obj, allow_nan=False).encode('utf-8'),
+        loads=json.loads
+    )
+
+
+def _orjson_codec() -> Codec:
+    import orjson
+    return Codec(name='orjson', dumps=orjson.dumps, loads=orjson.loads)
+
+
+def _ujson_codec() -> Codec:
+    import ujson
+    return Codec(
+        name='ujson', dumps=lambda obj: ujson.dumps(obj).encode('utf-8'), loads=ujson.loads
+    )
+
+
+_factories = {'orjson': _orjson_codec, 'ujson': _ujson_codec, 'json': _stdlib_codec}
+_codec = None
+
+
+def set_codec(codec: typing.Union[str, Codec] = None) -> Codec:
+    """Set the JSON codec used by PyCamunda.
+
+    :param codec: Name of the codec (`orjson`, `ujson` or `json`) or a `Codec` instance. If `None`,
+                  the fastest installed codec is used.
+    :return: The codec that is set.
+    """
+    global _codec
+    if isinstance(codec, Codec):
+        _codec = codec
+    elif codec is not None:
+        try:
+            factory = _factories[codec]
+        except KeyError:
+            raise ValueError(f'Unknown JSON codec "{codec}".')
+        _codec = factory()
+    else:
+        for factory in _factories.values():
+            try:
+                _codec = factory()
+            except ImportError:
+                continue
+            break
+    return _codec
+
+
+def get_codec() -> Codec:
+    """Get the JSON codec used by PyCamunda.
+
+    :return: The codec that is set or, if none is set, the fastest installed one.
+    """
+    if _codec is None:
+        return set_codec()
+    return _codec
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides deadlines that bound the time requests sent to Camunda may take."""
+
+from __future__ import annotations
+import contextlib
+import contextvars
+import time
+import typing
+
+import pycamunda
+
+
+__all__ = ['deadline', 'remaining', 'check']
+
+_deadline = contextvars.ContextVar('deadline', default=None)
+
+
+@contextlib.contextmanager
+def deadline(timeout: float) -> typing.Iterator[None]:
+    """Context manager that sets a deadline for all requests sent inside of it, including their
+    retries and the concurrent requests some request objects send. Timeouts of the http requests
+    are shortened to the time remaining until the deadline. If the deadline passed, no further
+    http requests are sent and `pycamunda.DeadlineExceeded` is raised. Nested deadlines can only
+    shorten the time available.
+
+    The deadline is stored in a context variable, so it applies to the current thread or asyncio
+    task.
+
+    :param timeout: Time in seconds from now until the deadline.
+    """
+    due = time.monotonic() + timeout
+    current = _deadline.get()
+    if current is not None:
+        due = min(due, current)
+    token = _deadline.set(due)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> typing.Optional[float]:
+    """Get the time remaining until the current deadline.
+
+    :return: Time in seconds, which is negative if the deadline passed, or `None` if no deadline
+             is set.
+    """
+    due = _deadline.get()
+    if due is None:
+        return None
+    return due - time.monotonic()
+
+
+def check() -> typing.Optional[float]:
+    """Check that the current deadline did not pass.
+
+    :return: Time in seconds remaining until the deadline or `None` if no deadline is set.
+    :raises pycamunda.DeadlineExceeded: If the deadline passed.
+    """
+    remaining_ = remaining()
+    if remaining_ is not None and remaining_ <= 0:
+        raise pycamunda.DeadlineExceeded('The deadline of the request passed.')
+    return remaining_
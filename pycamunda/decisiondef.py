@@ -51,7 +51,7 @@ class DecisionDefinition:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('decisionDefinitionId')
     id_in = QueryParameter('decisionDefinitionIdIn')
@@ -286,6 +286,7 @@ class Get(pycamunda.base._PathMixin, pycamunda.base.CamundaRequest):
         self.key = key
         self.tenant_id = tenant_id
 
+    @pycamunda.base._coalescing
     def __call__(self, *args, **kwargs) -> DecisionDefinition:
         """Send the request."""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
@@ -352,6 +353,8 @@ class GetDiagram(pycamunda.base._PathMixin, pycamunda.base.CamundaRequest):
 
 class Evaluate(pycamunda.base._PathMixin, pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     id_ = PathParameter('id')
     key = PathParameter('key')
     tenant_id = PathParameter('tenant-id')
@@ -7,8 +7,6 @@ import datetime as dt
 import dataclasses
 import typing
 
-import requests
-
 import pycamunda.variable
 import pycamunda.base
 import pycamunda.resource
@@ -123,7 +121,7 @@ class DeploymentWithDefinitions:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('id')
     name = QueryParameter('name')
@@ -286,19 +284,13 @@ class Create(pycamunda.base.CamundaRequest):
     def __call__(self, *args, **kwargs) -> DeploymentWithDefinitions:
         """Send the request."""
         assert bool(self.files), 'Cannot create deployment without resources.'
-        try:
-            response = requests.request(
-                method=pycamunda.base.RequestMethod.POST.value,
-                url=self.url,
-                params=self.query_parameters(),
-                data=self.body_parameters(),
-                auth=self.auth,
-                files=self.files
-            )
-        except requests.exceptions.RequestException as exc:
-            raise pycamunda.PyCamundaException(exc)
-        if not response:
-            pycamunda.base._raise_for_status(response)
+        response = self._send(
+            method=pycamunda.base.RequestMethod.POST,
+            url=self.url,
+            params=self.query_parameters(),
+            data=self.body_parameters(),
+            files=self.files
+        )
 
         return DeploymentWithDefinitions.load(data=response.json())
 
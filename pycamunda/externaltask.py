@@ -7,8 +7,6 @@ import datetime as dt
 import dataclasses
 import typing
 
-import requests
-
 import pycamunda
 import pycamunda.base
 import pycamunda.variable
@@ -24,6 +22,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base._slotted
 @dataclasses.dataclass
 class ExternalTask:
     """Data class of external task as returned by the REST api of Camunda."""
@@ -49,19 +48,19 @@ class ExternalTask:
     @classmethod
     def load(cls, data: typing.Mapping[str, typing.Any]) -> ExternalTask:
         external_task = cls(
-            activity_id=data['activityId'],
+            activity_id=pycamunda.base._intern(data['activityId']),
             activity_instance_id=data['activityInstanceId'],
             error_message=data['errorMessage'],
             execution_id=data['executionId'],
             id_=data['id'],
-            process_definition_id=data['processDefinitionId'],
-            process_definition_key=data['processDefinitionKey'],
+            process_definition_id=pycamunda.base._intern(data['processDefinitionId']),
+            process_definition_key=pycamunda.base._intern(data['processDefinitionKey']),
             process_instance_id=data['processInstanceId'],
-            tenant_id=data['tenantId'],
+            tenant_id=pycamunda.base._intern(data['tenantId']),
             retries=data['retries'],
-            worker_id=data['workerId'],
+            worker_id=pycamunda.base._intern(data['workerId']),
             priority=data['priority'],
-            topic_name=data['topicName']
+            topic_name=pycamunda.base._intern(data['topicName'])
         )
         if data['lockExpirationTime'] is not None:
             external_task.lock_expiration_time = pycamunda.base.from_isoformat(
@@ -116,18 +115,15 @@ class Get(pycamunda.base.CamundaRequest):
 
         if self.request_error_details:
             if external_task.error_details is None:
-                try:
-                    response = requests.get(self.url + '/errorDetails')
-                except requests.exceptions.RequestException:
-                    raise pycamunda.PyCamundaException()
-                if not response:
-                    pycamunda.base._raise_for_status(response)
+                response = self._send(
+                    method=pycamunda.base.RequestMethod.GET, url=self.url + '/errorDetails'
+                )
                 external_task.error_details = response.text
 
         return external_task
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class _Query(pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('externalTaskId')
     topic_name = QueryParameter('topicName')
@@ -188,15 +184,9 @@ class GetList(pycamunda.base.CamundaRequest):
         active: bool = False,
         priority_higher_equals: int = None,
         priority_lower_equals: int = None,
-        suspended: bool = False,
-        sort_by: str = None,
-        ascending: bool = True,
-        first_result: int = None,
-        max_results: int = None,
-        request_error_details: bool = True
+        suspended: bool = False
     ):
-        """Query for a list of external tasks using a list of parameters. The size of the result set
-        can be retrieved by using the Get Count request.
+        """Filters of the external task queries.
 
         :param url: Camunda Rest engine URL.
         :param id_: Filter by the id of the external task.
@@ -223,13 +213,6 @@ class GetList(pycamunda.base.CamundaRequest):
         :param priority_lower_equals: Include only external tasks with a priority lower than or
                                       equals to the given value.
         :param suspended: Include only external tasks that are suspended.
-        :param sort_by: Sort the results by `id_`, `lock_expiration_time, `process_instance_id`,
-                        `process_definition_key`, `tenant_id` or `task_priority`.
-        :param ascending: Sort order.
-        :param first_result: Pagination of results. Index of the first result to return.
-        :param max_results: Pagination of results. Maximum number of results to return.
-        :param request_error_details: Whether to request error details for tasks. Requires
-                                      additional requests.
         """
         super().__init__(url=url + URL_SUFFIX)
         self.id_ = id_
@@ -251,6 +234,36 @@ class GetList(pycamunda.base.CamundaRequest):
         self.priority_higher_equals = priority_higher_equals
         self.priority_lower_equals = priority_lower_equals
         self.suspended = suspended
+
+
+class GetList(pycamunda.base._PaginationMixin, _Query):
+
+    def __init__(
+        self,
+        url: str,
+        *args,
+        sort_by: str = None,
+        ascending: bool = True,
+        first_result: int = None,
+        max_results: int = None,
+        request_error_details: bool = True,
+        **kwargs
+    ):
+        """Query for a list of external tasks using a list of parameters. The size of the result set
+        can be retrieved by using the Get Count request.
+
+        :param url: Camunda Rest engine URL.
+        :param args: Positional arguments of `pycamunda.externaltask._Query`.
+        :param sort_by: Sort the results by `id_`, `lock_expiration_time, `process_instance_id`,
+                        `process_definition_key`, `tenant_id` or `task_priority`.
+        :param ascending: Sort order.
+        :param first_result: Pagination of results. Index of the first result to return.
+        :param max_results: Pagination of results. Maximum number of results to return.
+        :param request_error_details: Whether to request error details for tasks. Requires
+                                      additional requests which are sent concurrently.
+        :param kwargs: Filters of the external tasks, see `pycamunda.externaltask._Query`.
+        """
+        super().__init__(url, *args, **kwargs)
         self.sort_by = sort_by
         self.ascending = ascending
         self.first_result = first_result
@@ -263,107 +276,51 @@ class GetList(pycamunda.base.CamundaRequest):
         external_tasks = tuple(ExternalTask.load(task_json) for task_json in response.json())
 
         if self.request_error_details:
-            for external_task in external_tasks:
-                if external_task.error_details is None:
-                    try:
-                        response = requests.get(self.url + f'/{external_task.id_}/errorDetails')
-                    except requests.exceptions.RequestException:
-                        raise pycamunda.PyCamundaException()
-                    if not response:
-                        pycamunda.base._raise_for_status(response)
-                    external_task.error_details = response.text
+            external_tasks_without_details = [
+                external_task for external_task in external_tasks
+                if external_task.error_details is None
+            ]
+            responses = self._send_all([
+                dict(
+                    method=pycamunda.base.RequestMethod.GET,
+                    url=self.url + f'/{external_task.id_}/errorDetails'
+                )
+                for external_task in external_tasks_without_details
+            ])
+            for external_task, response in zip(external_tasks_without_details, responses):
+                external_task.error_details = response.text
 
         return external_tasks
 
 
-class Count(GetList):
+class Count(_Query):
 
     def __init__(
         self,
         url: str,
-        id_: str = None,
-        topic_name: str = None,
-        worker_id: str = None,
-        locked: bool = False,
-        not_locked: bool = False,
-        with_retries_left: bool = False,
-        no_retries_left: bool = False,
-        lock_expiration_after: dt.datetime = None,
-        lock_expiration_before: dt.datetime = None,
-        activity_id: str = None,
-        activity_id_in: typing.Iterable[str] = None,
-        execution_id: str = None,
-        process_instance_id: str = None,
-        process_definition_id: str = None,
-        tenant_id_in: typing.Iterable[str] = None,
-        active: bool = False,
-        priority_higher_equals: int = None,
-        priority_lower_equals: int = None,
-        suspended: bool = False,
+        *args,
         sort_by: str = None,
         ascending: bool = True,
         first_result: int = None,
-        max_results: int = None
+        max_results: int = None,
+        **kwargs
     ):
         """Get the size of the result returned by the Get List request.
 
         :param url: Camunda Rest engine URL.
-        :param id_: Filter by the id of the external task.
-        :param topic_name: Filter by the topic name of the external task.
-        :param worker_id: Filter by the id of the worker the task was locked by last.
-        :param locked: Include only locked external tasks.
-        :param not_locked: Include only unlocked tasks.
-        :param with_retries_left: Include only external tasks that have retries left.
-        :param no_retries_left: Include only external tasks that have no retries left.
-        :param lock_expiration_after: Include only external tasks with a lock that expires after a
-                                      date.
-        :param lock_expiration_before: Include only external tasks with a lock that expires before a
-                                       date.
-        :param activity_id: Filter by activity id the external task is created for.
-        :param activity_id_in: Filter whether activity id is one of multiple ones.
-        :param execution_id: Filter by the execution id the external task belongs to.
-        :param process_instance_id: Filter by the process instance id the external task belongs to.
-        :param process_definition_id: Filter by the process definition id the external task belongs
-                                      to.
-        :param tenant_id_in: Filter whether the tenant id is one of multiple ones.
-        :param active: Include only external tasks that are active.
-        :param priority_higher_equals: Include only external tasks with a priority higher than or
-                                       equals to the given value.
-        :param priority_lower_equals: Include only external tasks with a priority lower than or
-                                      equals to the given value.
-        :param suspended: Include only external tasks that are suspended.
+        :param args: Positional arguments of `pycamunda.externaltask._Query`.
         :param sort_by: Sort the results by `id_`, `lock_expiration_time, `process_instance_id`,
                         `process_definition_key`, `tenant_id` or `task_priority`.
         :param ascending: Sort order.
         :param first_result: Pagination of results. Index of the first result to return.
         :param max_results: Pagination of results. Maximum number of results to return.
+        :param kwargs: Filters of the external tasks, see `pycamunda.externaltask._Query`.
         """
-        super().__init__(
-            url=url,
-            id_=id_,
-            topic_name=topic_name,
-            worker_id=worker_id,
-            locked=locked,
-            not_locked=not_locked,
-            with_retries_left=with_retries_left,
-            no_retries_left=no_retries_left,
-            lock_expiration_after=lock_expiration_after,
-            lock_expiration_before=lock_expiration_before,
-            activity_id=activity_id,
-            activity_id_in=activity_id_in,
-            execution_id=execution_id,
-            process_instance_id=process_instance_id,
-            process_definition_id=process_definition_id,
-            tenant_id_in=tenant_id_in,
-            active=active,
-            priority_higher_equals=priority_higher_equals,
-            priority_lower_equals=priority_lower_equals,
-            suspended=suspended,
-            sort_by=sort_by,
-            ascending=ascending,
-            first_result=first_result,
-            max_results=max_results
-        )
+        super().__init__(url, *args, **kwargs)
+        self.sort_by = sort_by
+        self.ascending = ascending
+        self.first_result = first_result
+        self.max_results = max_results
         self._url += '/count'
 
     def query_parameters(self, apply: typing.Callable = ...):
@@ -375,22 +332,19 @@ class Count(GetList):
 
     def __call__(self, *args, **kwargs) -> int:
         """Send the request."""
-        try:
-            response = requests.request(
-                method=pycamunda.base.RequestMethod.GET.value,
-                url=self.url,
-                params=self.query_parameters()
-            )
-        except requests.exceptions.RequestException:
-            raise pycamunda.PyCamundaException()
-        if not response:
-            pycamunda.base._raise_for_status(response)
+        response = self._send(
+            method=pycamunda.base.RequestMethod.GET,
+            url=self.url,
+            params=self.query_parameters()
+        )
 
         return int(response.json()['count'])
 
 
 class FetchAndLock(pycamunda.base.CamundaRequest):
 
+    timeout_margin = 5.0
+
     worker_id = BodyParameter('workerId')
     max_tasks = BodyParameter('maxTasks')
     use_priority = BodyParameter('usePriority')
@@ -406,7 +360,8 @@ class FetchAndLock(pycamunda.base.CamundaRequest):
         use_priority: bool = False
     ):
         """Fetch and lock external tasks for a specific worker. Only external tasks with topics that
-        are added to this request are fetched.
+        are added to this request are fetched. Unless `timeout` is set, the read timeout is the
+        long polling timeout plus `timeout_margin` seconds.
 
         :param url: Camunda Rest engine URL.
         :param worker_id: Id of the worker the external tasks are locked for.
@@ -427,7 +382,14 @@ class FetchAndLock(pycamunda.base.CamundaRequest):
         name: str,
         lock_duration: int,
         variables: typing.Iterable[str] = None,
-        deserialize_values: bool = False
+        deserialize_values: bool = False,
+        business_key: str = None,
+        process_definition_id: str = None,
+        process_definition_id_in: typing.Iterable[str] = None,
+        process_definition_key: str = None,
+        process_definition_key_in: typing.Iterable[str] = None,
+        tenant_id_in: typing.Iterable[str] = None,
+        without_tenant_id: bool = None
     ) -> None:
         """Add a topic to this request.
 
@@ -437,6 +399,15 @@ class FetchAndLock(pycamunda.base.CamundaRequest):
                           to. If set to `None` all variables are requested.
         :param deserialize_values: Whether serializable variable values are deserialized on server
                                    side.
+        :param business_key: Filter by the business key of the process instance.
+        :param process_definition_id: Filter by process definition id.
+        :param process_definition_id_in: Filter whether the process definition id is one of
+                                         multiple ones.
+        :param process_definition_key: Filter by process definition key.
+        :param process_definition_key_in: Filter whether the process definition key is one of
+                                          multiple ones.
+        :param tenant_id_in: Filter whether the tenant id is one of multiple ones.
+        :param without_tenant_id: Whether to include only external tasks without tenant id.
         """
         topic = {
             'topicName': name,
@@ -445,8 +416,27 @@ class FetchAndLock(pycamunda.base.CamundaRequest):
         }
         if variables is not None:
             topic['variables'] = variables
+        filters = {
+            'businessKey': business_key,
+            'processDefinitionId': process_definition_id,
+            'processDefinitionIdIn': process_definition_id_in,
+            'processDefinitionKey': process_definition_key,
+            'processDefinitionKeyIn': process_definition_key_in,
+            'tenantIdIn': tenant_id_in,
+            'withoutTenantId': without_tenant_id
+        }
+        topic.update({key: value for key, value in filters.items() if value is not None})
         self.topics.append(topic)
 
+    @property
+    def long_polling(self) -> bool:
+        return bool(self.async_response_timeout)
+
+    def _default_timeout(self) -> pycamunda.base.Timeout:
+        if self.async_response_timeout is None:
+            return None
+        return None, self.async_response_timeout / 1000 + self.timeout_margin
+
     def __call__(self, *args, **kwargs) -> typing.Tuple[ExternalTask]:
         """Send the request"""
         response = super().__call__(pycamunda.base.RequestMethod.POST, *args, **kwargs)
@@ -601,6 +591,8 @@ class HandleFailure(pycamunda.base.CamundaRequest):
 
 class Unlock(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     id_ = PathParameter('id')
 
     def __init__(self, url: str, id_: str):
@@ -619,6 +611,8 @@ class Unlock(pycamunda.base.CamundaRequest):
 
 class ExtendLock(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     id_ = PathParameter('id')
     new_duration = BodyParameter('newDuration')
     worker_id = BodyParameter('workerId')
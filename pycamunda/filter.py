@@ -68,7 +68,7 @@ class Filter:
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('filterId')
     resource_type = QueryParameter('resourceType')
@@ -633,6 +633,8 @@ class Delete(pycamunda.base.CamundaRequest):
 
 class Execute(_Criteria):
 
+    retry_safe = True
+
     id_ = PathParameter('id')
 
     def __init__(self, url: str, id_: str, single_result: bool = False):
@@ -63,7 +63,7 @@ class Get(pycamunda.base.CamundaRequest):
         return Group.load(response.json())
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('id')
     id_in = QueryParameter('idIn')
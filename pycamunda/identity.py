@@ -88,6 +88,7 @@ class GetGroups(pycamunda.base.CamundaRequest):
         super().__init__(url=url + URL_SUFFIX + '/groups')
         self.user_id = user_id
 
+    @pycamunda.base._coalescing
     def __call__(self, *args, **kwargs) -> UsersGroups:
         """Send the request."""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
@@ -97,6 +98,8 @@ class GetGroups(pycamunda.base.CamundaRequest):
 
 class VerifyUser(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     username = BodyParameter('username')
     password = BodyParameter('password')
 
@@ -136,6 +139,8 @@ class GetPasswordPolicy(pycamunda.base.CamundaRequest):
 
 class ValidatePassword(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     password = BodyParameter('password')
 
     def __init__(self, url: str, password: str):
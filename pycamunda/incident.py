@@ -37,6 +37,7 @@ class IncidentTypeCount:
         )
 
 
+@pycamunda.base._slotted
 @dataclasses.dataclass
 class Incident:
     """Data class of incident as returned by the REST api of Camunda."""
@@ -58,15 +59,15 @@ class Incident:
     def load(cls, data: typing.Mapping[str, typing.Any]) -> Incident:
         incident = cls(
             id_=data['id'],
-            process_definition_id=data['processDefinitionId'],
+            process_definition_id=pycamunda.base._intern(data['processDefinitionId']),
             process_instance_id=data['processInstanceId'],
             execution_id=data['executionId'],
             incident_type=IncidentType(data['incidentType']),
-            activity_id=data['activityId'],
+            activity_id=pycamunda.base._intern(data['activityId']),
             cause_incident_id=data['causeIncidentId'],
             root_cause_incident_id=data['rootCauseIncidentId'],
             configuration=data['configuration'],
-            tenant_id=data['tenantId'],
+            tenant_id=pycamunda.base._intern(data['tenantId']),
             incident_message=data['incidentMessage'],
             job_definition_id=data['jobDefinitionId']
         )
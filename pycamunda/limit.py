@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides rate limits and adaptive concurrency limits for the requests sent to
+Camunda.
+"""
+
+from __future__ import annotations
+import asyncio
+import re
+import threading
+import time
+import typing
+import urllib.parse
+
+import requests
+
+import pycamunda
+import pycamunda.deadline
+import pycamunda.retry
+
+
+__all__ = ['RateLimit', 'RateLimiter', 'ConcurrencyLimit', 'Limiting', 'family']
+
+FAMILIES = {
+    'external-task': re.compile(r'/external-task(/|$)'),
+    'message': re.compile(r'/message(/|$)'),
+    'process-instance-start': re.compile(r'/process-definition/.+/(start|submit-form)$')
+}
+
+
+def family(method: str, url: str) -> typing.Optional[str]:
+    """Get the endpoint family of a request.
+
+    :param method: Http method of the request.
+    :param url: Url of the request.
+    :return: `external-task`, `message`, `process-instance-start` or `None` if the request belongs
+             to no endpoint family.
+    """
+    path = urllib.parse.urlsplit(url).path
+    for name, pattern in FAMILIES.items():
+        if pattern.search(path):
+            if name == 'process-instance-start' and method.upper() != 'POST':
+                return None
+            return name
+    return None
+
+
+class RateLimit:
+
+    def __init__(self, rate: float, burst: float = None):
+        """Token bucket that limits the number of requests per second. The bucket holds up to
+        `burst` tokens and is refilled with `rate` tokens per second. Every request takes a token
+        and waits until one is available.
+
+        :param rate: Number of requests per second.
+        :param burst: Number of requests that can be sent at once after a quiet period. Defaults
+                      to the requests of one second, but at least 1.
+        """
+        assert rate > 0, '\'rate\' has to be positive.'
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_delay: float = None) -> typing.Optional[float]:
+        """Take a token for a request.
+
+        :param max_delay: Maximum time in seconds the request may wait for its token.
+        :return: Time in seconds to wait before the request is sent or `None` if the request would
+                 have to wait longer than `max_delay`. In this case no token is taken.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            if max_delay is not None and delay > max_delay:
+                return None
+            self._tokens -= 1
+            return delay
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(rate={self.rate!r}, burst={self.burst!r})'
+
+
+class RateLimiter:
+
+    def __init__(self, limits: typing.Mapping[str, RateLimit]):
+        """Rate limits of endpoint families. Requests that belong to no limited family are not
+        limited.
+
+        The endpoint families are `external-task` for all external task requests, `message` for
+        message correlation and `process-instance-start` for starting process instances.
+
+        :param limits: Rate limit of each endpoint family.
+        """
+        unknown = set(limits) - set(FAMILIES)
+        if unknown:
+            raise ValueError(f'Unknown endpoint families {sorted(unknown)}.')
+        self.limits = dict(limits)
+
+    def reserve(self, method: str, url: str, max_delay: float = None) -> typing.Optional[float]:
+        """Take a token for a request from the rate limit of its endpoint family.
+
+        :param method: Http method of the request.
+        :param url: Url of the request.
+        :param max_delay: Maximum time in seconds the request may wait for its token.
+        :return: Time in seconds to wait before the request is sent or `None` if the request would
+                 have to wait longer than `max_delay`.
+        """
+        limit = self.limits.get(family(method, url))
+        if limit is None:
+            return 0.0
+        return limit.reserve(max_delay=max_delay)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(limits={self.limits!r})'
+
+
+class ConcurrencyLimit:
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff: float = 0.75,
+        tolerance: float = 2.0
+    ):
+        """Limit of the number of concurrent requests that adapts to the load of the engine. The
+        limit grows by one for every limit's worth of fast, successful requests as long as the
+        requests use at least half of it. It is multiplied by `backoff` if a request fails with a
+        connection error, a timeout, a server error or `429 Too Many Requests`, or if it takes
+        longer than `tolerance` times the lowest latency observed for the same kind of request.
+        Requests that started before the last decrease do not decrease the limit again. Requests
+        wait for a free slot.
+
+        Every kind of request, like completing external tasks or querying process instances, has
+        its own lowest latency, so slow queries do not count as slow next to fast commands. The
+        lowest latencies slowly rise with every request, so the limit recovers if the engine stays
+        slower for a long time.
+
+        :param initial: Initial limit.
+        :param min_limit: Lowest limit.
+        :param max_limit: Highest limit.
+        :param backoff: Factor the limit is multiplied with on failures and slow requests.
+        :param tolerance: Factor of the lowest latency a request may take before it is slow.
+        """
+        assert 1 <= min_limit <= initial <= max_limit, \
+            'The limits have to satisfy 1 <= min_limit <= initial <= max_limit.'
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+
+        self._inflight = 0
+        self._min_latencies = {}
+        self._decreased_at = float('-inf')
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters = []
+
+    @property
+    def inflight(self) -> int:
+        """Number of requests currently sent."""
+        return self._inflight
+
+    def acquire(self, timeout: float = None) -> bool:
+        """Wait for a free slot and take it.
+
+        :param timeout: Maximum time in seconds to wait.
+        :return: Whether a slot was taken.
+        """
+        with self._condition:
+            if not self._condition.wait_for(self._has_slot, timeout=timeout):
+                return False
+            self._inflight += 1
+            return True
+
+    async def aacquire(self, timeout: float = None) -> bool:
+        """Wait for a free slot without blocking the event loop and take it.
+
+        :param timeout: Maximum time in seconds to wait.
+        :return: Whether a slot was taken.
+        """
+        loop = asyncio.get_running_loop()
+        due = loop.time() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                if self._has_slot():
+                    self._inflight += 1
+                    return True
+                waiter = (loop, loop.create_future())
+                self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter[1], due - loop.time() if due is not None else None)
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+
+    def release(
+        self, started: float, failure: bool = False, measure: bool = True, kind: str = None
+    ) -> None:
+        """Free the slot of a finished request and adapt the limit.
+
+        :param started: Time of `time.monotonic` when the request was sent.
+        :param failure: Whether the request failed.
+        :param measure: Whether the request finished, so its latency and failure adapt the limit.
+        :param kind: Kind of the request its latency is compared with, like the name of the
+                     request class.
+        """
+        now = time.monotonic()
+        latency = now - started
+        with self._condition:
+            self._inflight -= 1
+            if measure:
+                min_latency = min(self._min_latencies.get(kind, latency), latency)
+                slow = latency > self.tolerance * min_latency
+                self._min_latencies[kind] = min_latency * 1.01
+                if failure or slow:
+                    if started > self._decreased_at:
+                        self.limit = max(self.min_limit, self.limit * self.backoff)
+                        self._decreased_at = now
+                elif self._inflight + 1 >= self.limit / 2:
+                    self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+    def _has_slot(self) -> bool:
+        return self._inflight < max(1, int(self.limit))
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__qualname__}(limit={self.limit!r}, min_limit={self.min_limit!r}, '
+            f'max_limit={self.max_limit!r})'
+        )
+
+
+class Limiting:
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        rate_limiter: RateLimiter = None,
+        concurrency_limit: ConcurrencyLimit = None,
+        kind: str = None
+    ):
+        """Attempts of sending one http request with rate limits and a concurrency limit. Call
+        `acquire` before every attempt and `release` with its outcome.
+
+        :param method: Http method of the request.
+        :param url: Url of the request.
+        :param rate_limiter: Rate limits of the endpoint families.
+        :param concurrency_limit: Limit of the number of concurrent requests.
+        :param kind: Kind of the request its latency is compared with. Defaults to the http
+                     method and endpoint family.
+        """
+        self.method = method
+        self.url = url
+        self.kind = kind if kind is not None else f'{method.upper()} {family(method, url)}'
+        self.rate_limiter = rate_limiter
+        self.concurrency_limit = concurrency_limit
+        self._started = None
+
+    def acquire(self, remaining: typing.Optional[float]) -> typing.Optional[float]:
+        """Wait until the next attempt may be sent.
+
+        :param remaining: Time in seconds remaining until the deadline of the request.
+        :return: Time in seconds remaining until the deadline after waiting.
+        :raises pycamunda.DeadlineExceeded: If the attempt cannot be sent before the deadline.
+        """
+        delay = self._reserve(remaining)
+        if delay:
+            time.sleep(delay)
+            remaining = pycamunda.deadline.check()
+        if self.concurrency_limit is not None:
+            if not self.concurrency_limit.acquire(timeout=remaining):
+                raise pycamunda.DeadlineExceeded('The deadline of the request passed.')
+            remaining = pycamunda.deadline.remaining()
+            self._started = time.monotonic()
+        return remaining
+
+    async def aacquire(self, remaining: typing.Optional[float]) -> typing.Optional[float]:
+        """Wait until the next attempt may be sent without blocking the event loop.
+
+        :param remaining: Time in seconds remaining until the deadline of the request.
+        :return: Time in seconds remaining until the deadline after waiting.
+        :raises pycamunda.DeadlineExceeded: If the attempt cannot be sent before the deadline.
+        """
+        delay = self._reserve(remaining)
+        if delay:
+            await asyncio.sleep(delay)
+            remaining = pycamunda.deadline.check()
+        if self.concurrency_limit is not None:
+            if not await self.concurrency_limit.aacquire(timeout=remaining):
+                raise pycamunda.DeadlineExceeded('The deadline of the request passed.')
+            remaining = pycamunda.deadline.remaining()
+            self._started = time.monotonic()
+        return remaining
+
+    def release(self, response: requests.Response = None, exc: BaseException = None) -> None:
+        """Record the outcome of an attempt. If neither `response` nor `exc` is passed, the attempt
+        was aborted and does not adapt the concurrency limit.
+
+        :param response: Response of the attempt.
+        :param exc: Exception the attempt raised.
+        """
+        if self._started is None:
+            return
+        measure = response is not None or exc is not None
+        self.concurrency_limit.release(
+            self._started,
+            failure=measure and pycamunda.retry._is_failure(response, exc),
+            measure=measure,
+            kind=self.kind
+        )
+        self._started = None
+
+    def _reserve(self, remaining: typing.Optional[float]) -> typing.Optional[float]:
+        if self.rate_limiter is None:
+            return None
+        delay = self.rate_limiter.reserve(self.method, self.url, max_delay=remaining)
+        if delay is None:
+            raise pycamunda.DeadlineExceeded('The deadline of the request passed.')
+        return delay
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides metrics of workers and their export in the Prometheus text format."""
+
+from __future__ import annotations
+import bisect
+import dataclasses
+import http.server
+import math
+import threading
+import typing
+
+
+__all__ = ['MetricsSink', 'Registry', 'PrometheusExporter']
+
+Labels = typing.Optional[typing.Mapping[str, str]]
+
+DESCRIPTIONS = {
+    'fetches_total': 'Number of FetchAndLock round trips.',
+    'empty_fetches_total': 'Number of FetchAndLock round trips that returned no external task.',
+    'fetch_errors_total': 'Number of FetchAndLock round trips that failed.',
+    'fetch_duration_seconds': 'Duration of FetchAndLock round trips including long polling.',
+    'fetched_tasks_total': 'Number of fetched external tasks.',
+    'handler_duration_seconds': 'Duration of handlers.',
+    'completion_latency_seconds': 'Time from fetching an external task until its result was '
+                                  'reported.',
+    'lock_extensions_total': 'Number of extended locks.',
+    'lock_extension_errors_total': 'Number of locks that could not be extended.',
+    'missed_lock_expirations_total': 'Number of locks that expired before they were extended or '
+                                     'the handler finished.'
+}
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0
+)
+
+
+class MetricsSink:
+    """Sink that receives the metrics of a worker. This sink discards them. Subclasses forward
+    them to a metrics library or collect them like `Registry`.
+    """
+
+    def increment(self, name: str, value: float = 1.0, labels: Labels = None) -> None:
+        """Increment a counter.
+
+        :param name: Name of the counter.
+        :param value: Amount to increment the counter by.
+        :param labels: Labels of the counter.
+        """
+
+    def observe(self, name: str, value: float, labels: Labels = None) -> None:
+        """Record a value of a histogram.
+
+        :param name: Name of the histogram.
+        :param value: The observed value.
+        :param labels: Labels of the histogram.
+        """
+
+
+@dataclasses.dataclass
+class _Histogram:
+    """Bucket counts, sum and count of the observations of a histogram."""
+    counts: typing.List[int]
+    sum: float = 0.0
+    count: int = 0
+
+
+class Registry(MetricsSink):
+
+    def __init__(self, namespace: str = 'pycamunda_worker', buckets: typing.Sequence[float] = None):
+        """Sink that keeps counters and histograms in memory and renders them in the Prometheus
+        text format. It can be shared by multiple workers in the same process.
+
+        :param namespace: Prefix of the metric names.
+        :param buckets: Upper bounds of the histogram buckets in seconds.
+        """
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets if buckets is not None else DEFAULT_BUCKETS))
+
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1.0, labels: Labels = None) -> None:
+        key = _key(labels)
+        with self._lock:
+            counters = self._counters.setdefault(name, {})
+            counters[key] = counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, labels: Labels = None) -> None:
+        key = _key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            histograms = self._histograms.setdefault(name, {})
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = _Histogram(counts=[0] * len(self.buckets))
+            if index < len(self.buckets):
+                histogram.counts[index] += 1
+            histogram.sum += value
+            histogram.count += 1
+
+    def value(self, name: str, labels: Labels = None) -> float:
+        """Get the value of a counter.
+
+        :param name: Name of the counter.
+        :param labels: Labels of the counter.
+        :return: The value of the counter.
+        """
+        with self._lock:
+            return self._counters.get(name, {}).get(_key(labels), 0.0)
+
+    def count(self, name: str, labels: Labels = None) -> int:
+        """Get the number of observations of a histogram.
+
+        :param name: Name of the histogram.
+        :param labels: Labels of the histogram.
+        :return: The number of observations.
+        """
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(_key(labels))
+            return histogram.count if histogram is not None else 0
+
+    def exposition(self) -> str:
+        """Render all metrics in the Prometheus text format.
+
+        :return: The rendered metrics.
+        """
+        lines = []
+        with self._lock:
+            for name, counters in sorted(self._counters.items()):
+                name = self._name(name, lines, 'counter')
+                for key, value in sorted(counters.items()):
+                    lines.append(f'{name}{_labels(key)} {_number(value)}')
+            for name, histograms in sorted(self._histograms.items()):
+                name = self._name(name, lines, 'histogram')
+                for key, histogram in sorted(histograms.items()):
+                    cumulative = 0
+                    for bound, count in zip(self.buckets, histogram.counts):
+                        cumulative += count
+                        le = (('le', _number(bound)),)
+                        lines.append(f'{name}_bucket{_labels(key + le)} {cumulative}')
+                    inf = (('le', '+Inf'),)
+                    lines.append(f'{name}_bucket{_labels(key + inf)} {histogram.count}')
+                    lines.append(f'{name}_sum{_labels(key)} {_number(histogram.sum)}')
+                    lines.append(f'{name}_count{_labels(key)} {histogram.count}')
+        return ''.join(f'{line}\n' for line in lines)
+
+    def _name(self, name: str, lines: typing.List[str], type_: str) -> str:
+        full_name = f'{self.namespace}_{name}' if self.namespace else name
+        if name in DESCRIPTIONS:
+            lines.append(f'# HELP {full_name} {DESCRIPTIONS[name]}')
+        lines.append(f'# TYPE {full_name} {type_}')
+        return full_name
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(namespace={self.namespace!r})'
+
+
+class PrometheusExporter:
+
+    def __init__(self, registry: Registry, port: int = 9464, host: str = ''):
+        """HTTP server that serves the metrics of a registry in the Prometheus text format to
+        scrapers. It runs in a background thread.
+
+        :param registry: The registry to export.
+        :param port: Port to listen on. If 0, a free port is chosen.
+        :param host: Host to listen on. Defaults to all interfaces.
+        """
+        self.registry = registry
+        self.port = port
+        self.host = host
+
+        self._server = None
+        self._thread = None
+
+    def start(self) -> None:
+        """Start serving the metrics."""
+        registry = self.registry
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                content = registry.exposition().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name='prometheus-exporter', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving the metrics."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(host={self.host!r}, port={self.port!r})'
+
+
+def _key(labels: Labels) -> typing.Tuple[typing.Tuple[str, str], ...]:
+    return tuple(sorted((labels or {}).items()))
+
+
+def _labels(key: typing.Tuple[typing.Tuple[str, str], ...]) -> str:
+    if not key:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in key) + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
@@ -67,6 +67,8 @@ class InstructionReport:
 
 class Generate(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     source_process_definition_id = BodyParameter('sourceProcessDefinitionId')
     target_process_definition_id = BodyParameter('targetProcessDefinitionId')
     update_event_triggers = BodyParameter('updateEventTriggers')
@@ -101,6 +103,8 @@ class Generate(pycamunda.base.CamundaRequest):
 
 class Validate(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     source_process_definition_id = BodyParameter('sourceProcessDefinitionId')
     target_process_definition_id = BodyParameter('targetProcessDefinitionId')
     instructions = BodyParameter('instructions')
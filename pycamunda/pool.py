@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides a client that spreads requests across multiple Camunda REST nodes."""
+
+from __future__ import annotations
+import dataclasses
+import itertools
+import logging
+import threading
+import time
+import typing
+
+import requests
+
+import pycamunda
+import pycamunda.client
+import pycamunda.retry
+import pycamunda.version
+
+
+__all__ = ['EnginePool', 'Node']
+
+logger = logging.getLogger(__name__)
+
+BALANCING = ('least_outstanding', 'round_robin')
+
+
+@dataclasses.dataclass
+class Node:
+    """Camunda REST node of an `EnginePool`."""
+    url: str
+    outstanding: int = 0
+    failures: int = 0
+    ejected_until: float = 0.0
+
+    def is_available(self, now: float) -> bool:
+        return self.ejected_until <= now
+
+
+class EnginePool(pycamunda.client.Client):
+
+    def __init__(
+        self,
+        urls: typing.Sequence[str],
+        balancing: str = 'least_outstanding',
+        max_failures: int = 3,
+        ejection_time: float = 30.0,
+        health_interval: float = 10.0,
+        health_timeout: float = 2.0,
+        circuit_breaker: pycamunda.retry.CircuitBreaker = None,
+        **kwargs
+    ):
+        """Client that spreads requests across multiple Camunda REST nodes sharing one database.
+        Request objects are created with the url of the pool, `urls[0]`, and sent with the pool
+        by setting their `session` attribute. The pool replaces the engine url of each request with
+        the url of the node it picks.
+
+        Nodes are picked with the least outstanding requests or round robin. A node is ejected for
+        `ejection_time` seconds after `max_failures` consecutive connection errors, timeouts or
+        server errors. If `start` is called, the health of all nodes is additionally checked every
+        `health_interval` seconds with `version.Get`. Failing nodes are ejected and ejected nodes
+        that are healthy again are readmitted right away. If all nodes are ejected, requests are
+        spread across all nodes.
+
+        With a `circuit_breaker`, every node has its own circuit. Nodes with an open circuit are
+        skipped when picking a node. `pycamunda.CircuitOpen` is raised only if the circuits of
+        all nodes are open.
+
+        :param urls: Camunda Rest engine URLs of the nodes.
+        :param balancing: How the node of a request is picked. One of `least_outstanding` and
+                          `round_robin`.
+        :param max_failures: Number of consecutive failures after which a node is ejected.
+        :param ejection_time: Time in seconds a failing node is ejected for.
+        :param health_interval: Time in seconds between two health checks of the nodes.
+        :param health_timeout: Timeout in seconds of a health check.
+        :param circuit_breaker: Circuit breaker with a circuit for each node.
+        :param kwargs: Keyword arguments of `pycamunda.client.Client`.
+        """
+        assert urls, 'An engine pool requires at least one url.'
+        if balancing not in BALANCING:
+            raise ValueError(f'Unknown balancing "{balancing}".')
+        super().__init__(url=urls[0], **kwargs)
+        self.nodes = [Node(url=url.rstrip('/')) for url in urls]
+        self.balancing = balancing
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.node_circuit_breaker = circuit_breaker
+
+        self._health_client = pycamunda.client.Client(timeout=health_timeout)
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        node, path = self._route(self.resolve(url))
+        if node is None:
+            return super().request(method=method, url=url, **kwargs)
+        with self._lock:
+            node.outstanding += 1
+        try:
+            response = super().request(method=method, url=node.url + path, **kwargs)
+        except requests.exceptions.RequestException as exc:
+            self._record(node, success=False, exc=exc)
+            raise
+        finally:
+            with self._lock:
+                node.outstanding -= 1
+        self._record(node, success=response.status_code < 500, response=response)
+        return response
+
+    def pick(self, exclude: typing.Collection[Node] = ()) -> Node:
+        """Pick the node of the next request.
+
+        :param exclude: Nodes that must not be picked.
+        :return: The picked node.
+        """
+        now = time.monotonic()
+        with self._lock:
+            nodes = [node for node in self.nodes if node not in exclude]
+            nodes = [node for node in nodes if node.is_available(now)] or nodes
+            offset = next(self._counter)
+            nodes = [nodes[(offset + index) % len(nodes)] for index in range(len(nodes))]
+            if self.balancing == 'round_robin':
+                return nodes[0]
+            return min(nodes, key=lambda node: node.outstanding)
+
+    def check_health(self) -> None:
+        """Check the health of all nodes with `version.Get`. Failing nodes are ejected and healthy
+        nodes are readmitted.
+        """
+        for node in self.nodes:
+            get_version = pycamunda.version.Get(url=node.url)
+            get_version.auth = self.auth
+            get_version.session = self._health_client
+            try:
+                get_version()
+            except pycamunda.PyCamundaException:
+                logger.warning('Health check of engine node %s failed.', node.url)
+                self._eject(node)
+            else:
+                with self._lock:
+                    if not node.is_available(time.monotonic()):
+                        logger.info('Readmitting engine node %s.', node.url)
+                    node.failures = 0
+                    node.ejected_until = 0.0
+
+    def start(self) -> None:
+        """Start checking the health of the nodes in a background thread."""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='engine-pool-health', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop checking the health of the nodes."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        self.stop()
+        self._health_client.close()
+        super().close()
+
+    def _route(self, url: str) -> typing.Tuple[typing.Optional[Node], str]:
+        """Pick a node for a request url of one of the nodes.
+
+        :return: The node and the path of the request relative to the engine url.
+        """
+        for node in self.nodes:
+            path = url[len(node.url):]
+            if url.startswith(node.url) and path[:1] in ('', '/', '?'):
+                return self._pick_closed(), path
+        return None, url
+
+    def _pick_closed(self) -> Node:
+        """Pick a node whose circuit is not open.
+
+        :raises pycamunda.CircuitOpen: If the circuits of all nodes are open.
+        """
+        if self.node_circuit_breaker is None:
+            return self.pick()
+        excluded = []
+        while True:
+            node = self.pick(exclude=excluded)
+            try:
+                self.node_circuit_breaker.allow(node.url)
+            except pycamunda.CircuitOpen:
+                excluded.append(node)
+                if len(excluded) == len(self.nodes):
+                    raise
+            else:
+                return node
+
+    def _record(
+        self,
+        node: Node,
+        success: bool,
+        response: requests.Response = None,
+        exc: BaseException = None
+    ) -> None:
+        if self.node_circuit_breaker is not None:
+            self.node_circuit_breaker.record(
+                node.url, success=not pycamunda.retry._is_failure(response, exc)
+            )
+        if success:
+            with self._lock:
+                node.failures = 0
+            return
+        with self._lock:
+            node.failures += 1
+            failures = node.failures
+        if failures >= self.max_failures:
+            self._eject(node)
+
+    def _eject(self, node: Node) -> None:
+        now = time.monotonic()
+        with self._lock:
+            available = node.is_available(now)
+            node.ejected_until = now + self.ejection_time
+            node.failures = 0
+        if available:
+            logger.warning('Ejecting engine node %s for %s seconds.', node.url, self.ejection_time)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self.check_health()
+            self._stopped.wait(self.health_interval)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__qualname__}(urls={[node.url for node in self.nodes]!r}, '
+            f'balancing={self.balancing!r})'
+        )
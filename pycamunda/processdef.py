@@ -337,7 +337,7 @@ class Count(pycamunda.base.CamundaRequest):
         return response.json()['count']
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('processDefinitionId')
     id_in = QueryParameter('processDefinitionIdIn')
@@ -588,6 +588,7 @@ class GetXML(pycamunda.base._PathMixin, pycamunda.base.CamundaRequest):
         self.key = key
         self.tenant_id = tenant_id
 
+    @pycamunda.base._coalescing
     def __call__(self, *args, **kwargs) -> str:
         """Send the request."""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
@@ -615,6 +616,7 @@ class Get(pycamunda.base._PathMixin, pycamunda.base.CamundaRequest):
         self.key = key
         self.tenant_id = tenant_id
 
+    @pycamunda.base._coalescing
     def __call__(self, *args, **kwargs) -> ProcessDefinition:
         """Send the request."""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
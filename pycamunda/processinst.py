@@ -24,6 +24,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base._slotted
 @dataclasses.dataclass
 class ProcessInstance:
     """Data class of process instance as returned by the REST api of Camunda."""
@@ -40,10 +41,10 @@ class ProcessInstance:
     def load(cls, data: typing.Mapping[str, typing.Any]) -> ProcessInstance:
         process_instance = cls(
             id_=data['id'],
-            definition_id=data['definitionId'],
+            definition_id=pycamunda.base._intern(data['definitionId']),
             business_key=data['businessKey'],
             case_instance_id=data['caseInstanceId'],
-            tenant_id=data['tenantId'],
+            tenant_id=pycamunda.base._intern(data['tenantId']),
             suspended=data['suspended'],
             links=tuple(pycamunda.resource.Link.load(link_json) for link_json in data['links']),
         )
@@ -116,7 +117,7 @@ class GetActivityInstance(pycamunda.base.CamundaRequest):
         return pycamunda.activityinst.ActivityInstance.load(response.json())
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     process_instance_ids = QueryParameter('processInstanceIds')
     business_key = QueryParameter('businessKey')
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import abc
+import functools
+import string
 import typing
 
 
@@ -87,6 +89,43 @@ class BodyParameterContainer:
                f'{", ".join(k+"="+str(v) for k, v in self.parameters.items())})'
 
 
+def _plan(
+    parameters: typing.Iterable[RequestParameter]
+) -> typing.Tuple[typing.Tuple[str, str, typing.Optional[RequestParameter]]]:
+    """Build the serialization plan of request parameters.
+
+    :param parameters: Parameters in the order they are sent.
+    :return: Tuples of attribute name, api key and the parameter itself. The parameter is `None`
+             when its value can be read from the instance dictionary without calling the descriptor.
+    """
+    return tuple(
+        (
+            parameter.name,
+            parameter.key,
+            None if parameter.mapping is None and parameter.provide is None else parameter
+        )
+        for parameter in parameters
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(
+    template: str, cls: type
+) -> typing.Tuple[typing.Tuple[str, typing.Optional[str], str]]:
+    """Compile an url template with the path parameters of a request class.
+
+    :param template: Url with the api keys of the path parameters in braces.
+    :param cls: Request class the path parameters belong to.
+    :return: Tuples of the literal text, the attribute name of the following path parameter and
+             its format spec.
+    """
+    names = {key: name for name, key, attribute in cls._path_plan}
+    return tuple(
+        (literal, names[key] if key is not None else None, spec or '')
+        for literal, key, spec, conversion in string.Formatter().parse(template)
+    )
+
+
 class RequestMeta(abc.ABCMeta):
 
     def __init__(cls, name: str, bases: typing.Any, attr_dict: typing.Dict[str, typing.Any]):
@@ -109,6 +148,13 @@ class RequestMeta(abc.ABCMeta):
             elif isinstance(attr, BodyParameterContainer):
                 cls._containers[key] = attr
 
+        parameters = cls._parameters.values()
+        cls._path_plan = _plan(attr for attr in parameters if isinstance(attr, PathParameter))
+        cls._query_plan = _plan(attr for attr in parameters if isinstance(attr, QueryParameter))
+        cls._body_plan = _plan(
+            attr for attr in parameters if isinstance(attr, BodyParameter) and not attr.hidden
+        )
+
 
 class Request(metaclass=RequestMeta):
 
@@ -123,31 +169,48 @@ class Request(metaclass=RequestMeta):
 
     @property
     def url(self) -> str:
-        params = {}
-        missing_params = {}
-        for name, attribute in self._parameters.items():
-            if isinstance(attribute, PathParameter):
+        if not self._path_plan:
+            return self._url.rstrip('/')
+        parts = []
+        for literal, name, spec in _compile(self._url, type(self)):
+            parts.append(literal)
+            if name is not None:
                 try:
-                    params[attribute.key] = getattr(self, attribute.name)
+                    parts.append(format(getattr(self, name), spec))
                 except AttributeError:
-                    missing_params[attribute.key] = ''
-        return self._url.format(**{**params, **missing_params}).rstrip('/')
+                    pass
+        return ''.join(parts).rstrip('/')
 
     @abc.abstractmethod
     def __call__(self, *args, **kwargs):
         return NotImplementedError
 
-    def query_parameters(self, apply: typing.Callable = None) -> typing.Dict[str, typing.Any]:
+    def _collect(
+        self, plan: typing.Tuple[typing.Tuple[str, str, typing.Optional[RequestParameter]]]
+    ) -> typing.Dict[str, typing.Any]:
+        """Collect the values of the parameters in a serialization plan that are set.
+
+        :param plan: Serialization plan as built by the metaclass.
+        :return: Mapping from api keys to values.
+        """
+        values = vars(self)
         query = {}
-        for name, attribute in self._parameters.items():
-            if isinstance(attribute, QueryParameter):
+        for name, key, attribute in plan:
+            value = values.get(name, None)
+            if value is None:
+                continue
+            if attribute is not None:
                 try:
-                    value = getattr(self, attribute.name)
+                    value = attribute.__get__(self, type(self))
                 except KeyError:
-                    pass
-                else:
-                    if value is not None:
-                        query[attribute.key] = value
+                    continue
+                if value is None:
+                    continue
+            query[key] = value
+        return query
+
+    def query_parameters(self, apply: typing.Callable = None) -> typing.Dict[str, typing.Any]:
+        query = self._collect(self._query_plan)
 
         if apply is None:
             return query
@@ -174,17 +237,8 @@ class Request(metaclass=RequestMeta):
     def body_parameters(self, apply: typing.Callable = None) -> typing.Dict[str, typing.Any]:
         query = {}
         for name, attribute in self._containers.items():
-            if isinstance(attribute, BodyParameterContainer):
-                query[attribute.key] = self._traverse(attribute)
-        for name, attribute in self._parameters.items():
-            if isinstance(attribute, BodyParameter) and not attribute.hidden:
-                try:
-                    value = getattr(self, attribute.name)
-                except KeyError:
-                    pass
-                else:
-                    if value is not None:
-                        query[attribute.key] = value
+            query[attribute.key] = self._traverse(attribute)
+        query.update(self._collect(self._body_plan))
 
         if apply is None:
             return query
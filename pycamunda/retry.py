@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides retry policies and circuit breakers for the requests sent to Camunda."""
+
+from __future__ import annotations
+import random
+import sys
+import threading
+import time
+import typing
+import urllib.parse
+
+import requests
+
+import pycamunda
+import pycamunda.deadline
+
+
+__all__ = ['RetryPolicy', 'CircuitBreaker', 'Retrying']
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class RetryPolicy:
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        jitter: bool = True,
+        statuses: typing.Iterable[int] = (429, 502, 503, 504)
+    ):
+        """Policy that decides which failed http requests are retried and how long to wait before
+        the next attempt. Requests with an idempotent http method like GET are always retried.
+        Other requests, like POST, are only retried if the request is marked as `retry_safe` or if
+        the connection could not be established, so the request never reached the engine.
+
+        The time to wait grows exponentially with every attempt. With `jitter` a random time up to
+        that value is waited instead, so clients that failed at the same time do not retry at the
+        same time. A `Retry-After` header of the response is respected.
+
+        :param retries: Maximum number of retries after the first attempt.
+        :param backoff: Time in seconds to wait before the first retry.
+        :param max_backoff: Maximum time in seconds to wait before a retry.
+        :param jitter: Whether a random time up to the exponential backoff is waited.
+        :param statuses: Http status codes of responses that are retried.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+
+    def is_retryable(
+        self,
+        method: str,
+        safe: bool = False,
+        response: requests.Response = None,
+        exc: BaseException = None
+    ) -> bool:
+        """Whether a failed attempt can be retried.
+
+        :param method: Http method of the request.
+        :param safe: Whether the request is marked as safe to retry regardless of its method.
+        :param response: Response of the attempt.
+        :param exc: Exception the attempt raised.
+        :return: Whether the attempt can be retried.
+        """
+        if exc is not None:
+            if _is_connect_error(exc):
+                return True
+        elif response is None or response.status_code not in self.statuses:
+            return False
+        return safe or method.upper() in IDEMPOTENT_METHODS
+
+    def delay(self, attempt: int, response: requests.Response = None) -> float:
+        """Get the time to wait before the next attempt.
+
+        :param attempt: Number of the failed attempt starting with 0.
+        :param response: Response of the failed attempt.
+        :return: Time to wait in seconds.
+        """
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        delay = min(self.backoff * 2 ** attempt, self.max_backoff)
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(retries={self.retries!r})'
+
+
+class CircuitBreaker:
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """Circuit breaker that stops sending requests to an engine that keeps failing. Every
+        engine, identified by the scheme, host and port of the request url, has its own circuit.
+
+        After `failure_threshold` consecutive failures the circuit opens and requests fail
+        right away with `pycamunda.CircuitOpen`. After `recovery_timeout` seconds a single trial
+        request is let through. If it succeeds, the circuit closes again, otherwise it stays open
+        for another `recovery_timeout`. Connection errors, timeouts, server errors and
+        `429 Too Many Requests` count as failures.
+
+        :param failure_threshold: Number of consecutive failures that open the circuit.
+        :param recovery_timeout: Time in seconds the circuit stays open before a trial request.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def allow(self, url: str) -> None:
+        """Check whether a request to an engine may be sent.
+
+        :param url: Url of the request.
+        :raises pycamunda.CircuitOpen: If the circuit of the engine is open.
+        """
+        key = _engine(url)
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            if now < circuit.opened_at + self.recovery_timeout:
+                raise pycamunda.CircuitOpen(f'The circuit of {key} is open.')
+            circuit.state = HALF_OPEN
+            circuit.opened_at = now
+
+    def record(self, url: str, success: bool) -> None:
+        """Record the outcome of a request to an engine.
+
+        :param url: Url of the request.
+        :param success: Whether the engine answered the request without failure.
+        """
+        key = _engine(url)
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if success:
+                circuit.state = CLOSED
+                circuit.failures = 0
+                return
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+
+    def state(self, url: str) -> str:
+        """Get the state of the circuit of an engine.
+
+        :param url: Url of the engine or of a request to it.
+        :return: `closed`, `open` or `half-open`.
+        """
+        with self._lock:
+            circuit = self._circuits.get(_engine(url))
+            return circuit.state if circuit is not None else CLOSED
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__qualname__}(failure_threshold={self.failure_threshold!r}, '
+            f'recovery_timeout={self.recovery_timeout!r})'
+        )
+
+
+class _Circuit:
+    """State of the circuit of an engine."""
+
+    __slots__ = ('state', 'failures', 'opened_at')
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+
+class Retrying:
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        safe: bool = False,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None
+    ):
+        """Attempts of sending one http request with a retry policy and a circuit breaker. Call
+        `before` before every attempt and `after` with its outcome.
+
+        :param method: Http method of the request.
+        :param url: Url of the request.
+        :param safe: Whether the request is safe to retry regardless of its method.
+        :param retry: Retry policy. If `None`, failed requests are not retried.
+        :param circuit_breaker: Circuit breaker of the engines.
+        """
+        self.method = method
+        self.url = url
+        self.safe = safe
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.attempt = 0
+
+    def before(self) -> typing.Optional[float]:
+        """Prepare the next attempt.
+
+        :return: Time in seconds remaining until the deadline of the request or `None` if no
+                 deadline is set.
+        :raises pycamunda.DeadlineExceeded: If the deadline of the request passed.
+        :raises pycamunda.CircuitOpen: If the circuit of the engine is open.
+        """
+        remaining = pycamunda.deadline.check()
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.allow(self.url)
+        return remaining
+
+    def after(
+        self, response: requests.Response = None, exc: BaseException = None
+    ) -> typing.Optional[float]:
+        """Record the outcome of an attempt.
+
+        :param response: Response of the attempt.
+        :param exc: Exception the attempt raised.
+        :return: Time in seconds to wait before the next attempt or `None` if the attempt is not
+                 retried. Attempts are not retried if the deadline of the request passes before
+                 the next attempt.
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(self.url, success=not _is_failure(response, exc))
+        if (
+            self.retry is None
+            or self.attempt >= self.retry.retries
+            or not self.retry.is_retryable(self.method, self.safe, response=response, exc=exc)
+        ):
+            return None
+        delay = self.retry.delay(self.attempt, response=response)
+        remaining = pycamunda.deadline.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        self.attempt += 1
+        return delay
+
+
+def _engine(url: str) -> str:
+    parts = urllib.parse.urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'
+
+
+def _is_failure(response: typing.Optional[requests.Response], exc: typing.Optional[BaseException]):
+    if exc is not None:
+        return True
+    return response.status_code >= 500 or response.status_code == 429
+
+
+def _is_connect_error(exc: BaseException) -> bool:
+    """Whether the connection could not be established, so the request was not sent."""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    aiohttp = sys.modules.get('aiohttp')  # only aiohttp itself raises its errors
+    if aiohttp is not None and isinstance(exc, aiohttp.ClientConnectorError):
+        return True
+    return False
+
+
+def _retry_after(response: typing.Optional[requests.Response]) -> typing.Optional[float]:
+    if response is None:
+        return None
+    try:
+        return max(float(response.headers['Retry-After']), 0.0)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
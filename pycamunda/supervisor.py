@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides a supervisor that runs workers in multiple processes."""
+
+from __future__ import annotations
+import collections
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import threading
+import time
+import typing
+
+import pycamunda.worker
+
+
+__all__ = ['Supervisor']
+
+logger = logging.getLogger(__name__)
+
+SHARD_BY = ('topic', 'tenant', 'process_definition')
+
+
+class Supervisor:
+
+    def __init__(
+        self,
+        factory: typing.Callable[[], pycamunda.worker.Worker],
+        processes: int = None,
+        shard_by: str = None,
+        shard_values: typing.Sequence[str] = None,
+        max_polling: int = None,
+        restart_delay: float = 1.0,
+        stop_timeout: float = None,
+        kill_timeout: float = None,
+        start_method: str = None
+    ):
+        """Supervisor that runs a worker in each of multiple processes and restarts processes
+        that crash. The worker of each process is created by calling `factory` in that process.
+        Its worker id gets the index of the process appended.
+
+        The work can be split between the processes. With `shard_by='topic'` the subscribed
+        topics are distributed between the processes. With `shard_by='tenant'` or
+        `shard_by='process_definition'` every process subscribes to all topics, but fetches only
+        external tasks of its share of the tenant ids or process definition keys in
+        `shard_values`. Processes that get no share exit right away.
+
+        Processes fetching the same external tasks compete for them. The number of processes
+        long-polling at the same time is therefore limited. The supervisor hands out the polling
+        slots and takes back the slot of a process that exits while holding it.
+
+        :param factory: Picklable callable without arguments that creates the worker.
+        :param processes: Number of worker processes. Defaults to the number of processors.
+        :param shard_by: How the work is split between the processes. One of `topic`, `tenant`
+                         and `process_definition`. If `None`, every process fetches external
+                         tasks of all topics.
+        :param shard_values: Tenant ids or process definition keys to split between the
+                             processes. Required if `shard_by` is `tenant` or
+                             `process_definition`.
+        :param max_polling: Maximum number of processes long-polling at the same time. Defaults to
+                            1 if `shard_by` is `None`, otherwise it is not limited.
+        :param restart_delay: Time in seconds to wait before restarting a crashed process.
+        :param stop_timeout: Time in seconds each worker waits for its running handlers after
+                             `stop` was called. If `None`, workers wait until all handlers
+                             finished.
+        :param kill_timeout: Time in seconds to wait for the processes to exit after `stop` was
+                             called before they are killed. If `None`, the processes are waited
+                             for until they exit.
+        :param start_method: Start method of the processes, see `multiprocessing`. Defaults to
+                             the default start method of the platform.
+        """
+        if shard_by is not None and shard_by not in SHARD_BY:
+            raise ValueError(f'Unknown shard_by "{shard_by}".')
+        if shard_by in ('tenant', 'process_definition') and shard_values is None:
+            raise ValueError(f'shard_values are required to shard by "{shard_by}".')
+        self.factory = factory
+        self.processes = processes if processes is not None else os.cpu_count() or 1
+        self.shard_by = shard_by
+        self.shard_values = list(shard_values) if shard_values is not None else None
+        if max_polling is None and shard_by is None:
+            max_polling = 1
+        self.max_polling = max_polling
+        self.restart_delay = restart_delay
+        self.stop_timeout = stop_timeout
+        self.kill_timeout = kill_timeout
+
+        self._context = multiprocessing.get_context(start_method)
+        self._children = {}
+        self._connections = {}
+        self._holders = set()
+        self._waiting = collections.deque()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        """Start the worker processes and restart crashed ones until `stop` is called or all
+        processes exited without error. The processes are stopped before `run` returns.
+        """
+        self._stopped.clear()
+        restarts = {}
+        try:
+            for index in range(self.processes):
+                self._start(index)
+            while not self._stopped.is_set() and (self._children or restarts):
+                now = time.monotonic()
+                for index, due in list(restarts.items()):
+                    if due <= now:
+                        del restarts[index]
+                        self._start(index)
+                timeout = max(min([0.5, *(due - now for due in restarts.values())]), 0)
+                sentinels = {process.sentinel: index for index, process in self._children.items()}
+                connections = {
+                    connection: index for index, connection in self._connections.items()
+                }
+                ready = multiprocessing.connection.wait(
+                    [*connections, *sentinels], timeout=timeout
+                )
+                for connection in ready:
+                    if connection in connections:
+                        self._receive(connections[connection])
+                for sentinel in ready:
+                    if sentinel not in sentinels:
+                        continue
+                    index = sentinels[sentinel]
+                    process = self._children.pop(index)
+                    process.join()
+                    self._reclaim(index)
+                    if process.exitcode == 0 or self._stopped.is_set():
+                        continue
+                    logger.warning(
+                        'Worker process %s exited with code %s. Restarting it in %s seconds.',
+                        index,
+                        process.exitcode,
+                        self.restart_delay
+                    )
+                    restarts[index] = time.monotonic() + self.restart_delay
+        finally:
+            self._terminate()
+
+    def stop(self) -> None:
+        """Stop the worker processes. Each worker stops fetching and finishes its running handlers
+        before its process exits.
+        """
+        self._stopped.set()
+
+    def _start(self, index: int) -> None:
+        fetch_lock = connection = None
+        if self.max_polling is not None:
+            connection, child_connection = self._context.Pipe()
+            fetch_lock = _FetchLock(child_connection)
+        process = self._context.Process(
+            target=_run,
+            kwargs={
+                'factory': self.factory,
+                'index': index,
+                'processes': self.processes,
+                'shard_by': self.shard_by,
+                'shard_values': self.shard_values,
+                'fetch_lock': fetch_lock,
+                'stop_timeout': self.stop_timeout
+            },
+            name=f'{self.__class__.__name__}-{index}',
+            daemon=False
+        )
+        process.start()
+        self._children[index] = process
+        if connection is not None:
+            child_connection.close()
+            self._connections[index] = connection
+
+    def _receive(self, index: int) -> None:
+        """Handle a message of the fetch lock of a worker process."""
+        try:
+            message = self._connections[index].recv()
+        except (EOFError, OSError):
+            self._reclaim(index)
+            return
+        if message == 'acquire':
+            self._waiting.append(index)
+        elif message == 'release':
+            self._holders.discard(index)
+        self._grant()
+
+    def _grant(self) -> None:
+        """Hand out free polling slots to waiting worker processes."""
+        while self._waiting and len(self._holders) < self.max_polling:
+            index = self._waiting.popleft()
+            try:
+                self._connections[index].send('grant')
+            except (KeyError, OSError):
+                continue
+            self._holders.add(index)
+
+    def _reclaim(self, index: int) -> None:
+        """Take back the polling slot of a worker process that exited."""
+        connection = self._connections.pop(index, None)
+        if connection is None:
+            return
+        connection.close()
+        if index in self._holders:
+            logger.warning('Taking back the polling slot of worker process %s.', index)
+            self._holders.discard(index)
+        while index in self._waiting:
+            self._waiting.remove(index)
+        self._grant()
+
+    def _terminate(self) -> None:
+        for process in self._children.values():
+            process.terminate()
+        deadline = None if self.kill_timeout is None else time.monotonic() + self.kill_timeout
+        for index, process in self._children.items():
+            process.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                logger.warning('Killing worker process %s.', index)
+                process.kill()
+                process.join()
+        self._children.clear()
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+        self._holders.clear()
+        self._waiting.clear()
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__qualname__}(processes={self.processes!r}, '
+            f'shard_by={self.shard_by!r})'
+        )
+
+
+class _FetchLock:
+
+    def __init__(self, connection: multiprocessing.connection.Connection):
+        """Fetch lock of a worker process. Slots are requested from the supervisor, which takes
+        them back if the process exits while holding one, so a crashed process cannot block the
+        other processes.
+
+        :param connection: Connection to the supervisor.
+        """
+        self._connection = connection
+        self._requested = False
+
+    def acquire(self, timeout: float = None) -> bool:
+        if not self._requested:
+            self._connection.send('acquire')
+            self._requested = True
+        try:
+            if not self._connection.poll(timeout):
+                return False
+            self._connection.recv()
+        except (EOFError, OSError):
+            return False
+        self._requested = False
+        return True
+
+    def release(self) -> None:
+        self._connection.send('release')
+
+
+def _shard(
+    worker: pycamunda.worker.Worker,
+    index: int,
+    processes: int,
+    shard_by: str = None,
+    shard_values: typing.Sequence[str] = None
+) -> bool:
+    """Restrict a worker to its share of the work.
+
+    :param worker: The worker to restrict.
+    :param index: Index of the process the worker runs in.
+    :param processes: Number of processes the work is split between.
+    :param shard_by: How the work is split. One of `topic`, `tenant` and `process_definition`. If
+                     `None`, the worker is not restricted.
+    :param shard_values: Tenant ids or process definition keys to split.
+    :return: Whether the worker has any work left.
+    """
+    if shard_by == 'topic':
+        names = sorted(worker.topics)
+        for name in set(names) - set(names[index::processes]):
+            worker.unsubscribe(name)
+    elif shard_by is not None:
+        values = list(shard_values[index::processes])
+        if not values:
+            return False
+        attribute = 'tenant_id_in' if shard_by == 'tenant' else 'process_definition_key_in'
+        for topic in worker.topics.values():
+            setattr(topic, attribute, values)
+    return bool(worker.topics)
+
+
+def _run(
+    factory: typing.Callable[[], pycamunda.worker.Worker],
+    index: int,
+    processes: int,
+    shard_by: typing.Optional[str],
+    shard_values: typing.Optional[typing.Sequence[str]],
+    fetch_lock: typing.Any,
+    stop_timeout: typing.Optional[float]
+) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker = factory()
+    worker.worker_id = f'{worker.worker_id}-{index}'
+    if not _shard(worker, index, processes, shard_by=shard_by, shard_values=shard_values):
+        logger.info('Worker %s has no work assigned.', worker.worker_id)
+        return
+    worker.fetch_lock = fetch_lock
+    signal.signal(signal.SIGTERM, lambda signum, frame: worker.stop(timeout=stop_timeout))
+    worker.run()
@@ -23,6 +23,7 @@ __all__ = [
 ]
 
 
+@pycamunda.base._slotted
 @dataclasses.dataclass
 class Task:
     """Data class of task as returned by the REST api of Camunda."""
@@ -51,7 +52,7 @@ class Task:
     def load(cls, data: typing.Mapping[str, typing.Any]) -> Task:
         task = cls(
             assignee=data['assignee'],
-            case_definition_id=data['caseDefinitionId'],
+            case_definition_id=pycamunda.base._intern(data['caseDefinitionId']),
             case_execution_id=data['caseExecutionId'],
             case_instance_id=data['caseInstanceId'],
             delegation_state=data['delegationState'],
@@ -63,10 +64,10 @@ class Task:
             owner=data['owner'],
             parent_task_id=data['parentTaskId'],
             priority=data['priority'],
-            process_definition_id=data['processDefinitionId'],
+            process_definition_id=pycamunda.base._intern(data['processDefinitionId']),
             process_instance_id=data['processInstanceId'],
             suspended=data['suspended'],
-            task_definition_key=data['taskDefinitionKey'],
+            task_definition_key=pycamunda.base._intern(data['taskDefinitionKey']),
         )
         if data['created'] is not None:
             task.created = pycamunda.base.from_isoformat(data['created'])
@@ -163,7 +164,7 @@ class Get(pycamunda.base.CamundaRequest):
         return Task.load(response.json())
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     process_instance_id = QueryParameter('processInstanceId')
     process_instance_id_in = QueryParameter('processInstanceIdIn')
@@ -525,6 +526,8 @@ class Claim(pycamunda.base.CamundaRequest):
 
 class Unclaim(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     id_ = PathParameter('id')
 
     def __init__(self, url: str, id_: str):
@@ -621,6 +624,8 @@ class Resolve(pycamunda.base.CamundaRequest):
 
 class SetAssignee(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     id_ = PathParameter('id')
     user_id = BodyParameter('userId')
 
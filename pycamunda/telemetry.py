@@ -17,6 +17,8 @@ __all__ = ['Configure', 'Fetch']
 
 class Configure(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     enable_telemetry = BodyParameter('enableTelemetry')
 
     def __init__(self, url: str, enable_telemetry: bool):
@@ -160,7 +160,7 @@ class GroupMemberOptions(pycamunda.base.CamundaRequest):
         return pycamunda.resource.ResourceOptions.load(response.json())
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('id')
     name = QueryParameter('name')
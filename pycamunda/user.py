@@ -123,7 +123,7 @@ class Count(pycamunda.base.CamundaRequest):
         return response.json()['count']
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     id_ = QueryParameter('id')
     first_name = QueryParameter('firstName')
@@ -221,6 +221,7 @@ class GetProfile(pycamunda.base.CamundaRequest):
         super().__init__(url=url + URL_SUFFIX + '/{id}/profile')
         self.id_ = id_
 
+    @pycamunda.base._coalescing
     def __call__(self, *args, **kwargs) -> User:
         """Send the request"""
         response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
@@ -358,6 +359,8 @@ class UpdateProfile(pycamunda.base.CamundaRequest):
 
 class Unlock(pycamunda.base.CamundaRequest):
 
+    retry_safe = True
+
     id_ = PathParameter('id')
 
     def __init__(
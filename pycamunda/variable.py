@@ -15,6 +15,7 @@ URL_SUFFIX = '/variable-instance'
 __all__ = ['GetList', 'Get']
 
 
+@pycamunda.base._slotted
 @dataclasses.dataclass
 class Variable:
     """Data class of variable as returned by the REST api of Camunda."""
@@ -37,6 +38,7 @@ class Variable:
         return variable
 
 
+@pycamunda.base._slotted
 @dataclasses.dataclass
 class VariableInstance:
     """Data class of variable instance as returned by the REST api of Camunda."""
@@ -58,8 +60,8 @@ class VariableInstance:
     def load(cls, data: typing.Mapping[str, typing.Any]) -> VariableInstance:
         return cls(
             id_=data['id'],
-            name=data['name'],
-            type_=data['type'],
+            name=pycamunda.base._intern(data['name']),
+            type_=pycamunda.base._intern(data['type']),
             value=data['value'],
             value_info=data['valueInfo'],
             process_instance_id=data['processInstanceId'],
@@ -68,12 +70,12 @@ class VariableInstance:
             case_execution_id=data['caseExecutionId'],
             task_id=data['taskId'],
             activity_instance_id=data['activityInstanceId'],
-            tenant_id=data['tenantId'],
+            tenant_id=pycamunda.base._intern(data['tenantId']),
             error_message=data['errorMessage']
         )
 
 
-class GetList(pycamunda.base.CamundaRequest):
+class GetList(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
 
     name = QueryParameter('variableName')
     name_like = QueryParameter('variableNameLike')
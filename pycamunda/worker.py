@@ -0,0 +1,1760 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides workers that fetch and handle external tasks of Camunda."""
+
+from __future__ import annotations
+import asyncio
+import collections
+import concurrent.futures
+import contextvars
+import dataclasses
+import functools
+import heapq
+import itertools
+import logging
+import math
+import multiprocessing
+import threading
+import time
+import traceback
+import typing
+
+import pycamunda
+import pycamunda.asyncclient
+import pycamunda.base
+import pycamunda.externaltask
+import pycamunda.metrics
+
+
+__all__ = [
+    'AsyncLockExtender',
+    'AsyncReporter',
+    'AsyncWorker',
+    'BPMNError',
+    'FetchSizer',
+    'LockExtender',
+    'ReportCache',
+    'Reporter',
+    'Scheduler',
+    'Worker'
+]
+
+logger = logging.getLogger(__name__)
+
+Variables = typing.Optional[typing.Mapping[str, typing.Any]]
+Handler = typing.Callable[
+    [pycamunda.externaltask.ExternalTask], typing.Union[Variables, typing.Awaitable[Variables]]
+]
+
+
+class BPMNError(Exception):
+
+    def __init__(
+        self,
+        error_code: str,
+        error_message: str = None,
+        variables: typing.Mapping[str, typing.Any] = None
+    ):
+        """Exception that is raised by handlers to report a business error for an external task.
+
+        :param error_code: Error code that identifies the predefined error.
+        :param error_message: Error message that describes the error.
+        :param variables: Variables to send to the process instance.
+        """
+        super().__init__(error_code, error_message)
+        self.error_code = error_code
+        self.error_message = error_message
+        self.variables = variables or {}
+
+    def __reduce__(self):
+        return self.__class__, (self.error_code, self.error_message, self.variables)
+
+
+@dataclasses.dataclass
+class Topic:
+    """Topic a worker subscribed to."""
+    name: str
+    handler: Handler
+    lock_duration: int
+    variables: typing.Iterable[str] = None
+    deserialize_values: bool = False
+    cpu_bound: bool = False
+    max_running: int = None
+    weight: float = 1.0
+    priority: int = 0
+    tenant_id_in: typing.Iterable[str] = None
+    process_definition_key_in: typing.Iterable[str] = None
+
+
+@dataclasses.dataclass
+class _TopicQueue:
+    """Queued external tasks and scheduling state of a topic."""
+    weight: float
+    priority: int
+    max_running: typing.Optional[int]
+    heap: typing.List[tuple] = dataclasses.field(default_factory=list)
+    running: int = 0
+    pass_: float = 0.0
+
+    def is_full(self) -> bool:
+        return self.max_running is not None and self.running >= self.max_running
+
+
+class Scheduler:
+
+    def __init__(self, use_priority: bool = False):
+        """Scheduler that hands fetched external tasks to free handler slots. Every topic has
+        its own queue, so a burst on one topic does not starve the others. Topics with a higher
+        priority are served first. Topics with the same priority get handler slots in proportion
+        to their weight. The number of running handlers can be limited per topic.
+
+        :param use_priority: Whether external tasks of a topic are handled in the order of their
+                             priority instead of the order they were fetched in.
+        """
+        self.use_priority = use_priority
+
+        self._topics = {}
+        self._counter = itertools.count()
+        self._size = 0
+        self._virtual_time = 0.0
+
+    def add_topic(
+        self, name: str, weight: float = 1.0, priority: int = 0, max_running: int = None
+    ) -> None:
+        """Add a topic to schedule external tasks for.
+
+        :param name: Name of the topic.
+        :param weight: Share of the handler slots relative to other topics of the same priority.
+        :param priority: Priority of the topic. Topics with higher priority are served first.
+        :param max_running: Maximum number of handlers of the topic running at the same time.
+        """
+        assert weight > 0, 'The weight of a topic has to be positive.'
+        self._topics[name] = _TopicQueue(weight=weight, priority=priority, max_running=max_running)
+
+    def remove_topic(self, name: str) -> typing.List[pycamunda.externaltask.ExternalTask]:
+        """Remove a topic.
+
+        :param name: Name of the topic.
+        :return: The queued external tasks of the topic.
+        """
+        queue = self._topics.pop(name)
+        self._size -= len(queue.heap)
+        return [external_task for _, _, external_task in sorted(queue.heap)]
+
+    def push(self, external_task: pycamunda.externaltask.ExternalTask) -> None:
+        """Queue an external task.
+
+        :param external_task: The external task to queue.
+        """
+        queue = self._topics[external_task.topic_name]
+        if not queue.heap:
+            queue.pass_ = max(queue.pass_, self._virtual_time)
+        key = -(external_task.priority or 0) if self.use_priority else 0
+        heapq.heappush(queue.heap, (key, next(self._counter), external_task))
+        self._size += 1
+
+    def pop(self) -> typing.Optional[pycamunda.externaltask.ExternalTask]:
+        """Take the next external task to handle. It counts as running until `finish` is called.
+
+        :return: The external task or `None` if no external task can be started.
+        """
+        selected = None
+        for queue in self._topics.values():
+            if not queue.heap or queue.is_full():
+                continue
+            if selected is None or (-queue.priority, queue.pass_) < (
+                -selected.priority, selected.pass_
+            ):
+                selected = queue
+        if selected is None:
+            return None
+        _, _, external_task = heapq.heappop(selected.heap)
+        self._virtual_time = selected.pass_
+        selected.pass_ += 1 / selected.weight
+        selected.running += 1
+        self._size -= 1
+        return external_task
+
+    def finish(self, external_task: pycamunda.externaltask.ExternalTask) -> None:
+        """Mark an external task taken with `pop` as finished.
+
+        :param external_task: The finished external task.
+        """
+        self._topics[external_task.topic_name].running -= 1
+
+    def drain(self) -> typing.List[pycamunda.externaltask.ExternalTask]:
+        """Remove all queued external tasks.
+
+        :return: The removed external tasks.
+        """
+        external_tasks = []
+        for queue in self._topics.values():
+            external_tasks.extend(external_task for _, _, external_task in sorted(queue.heap))
+            queue.heap.clear()
+        self._size = 0
+        return external_tasks
+
+    def fetchable(self) -> typing.List[str]:
+        """Get the topics that have room for more external tasks.
+
+        :return: Names of the topics.
+        """
+        return [
+            name for name, queue in self._topics.items()
+            if queue.max_running is None or queue.running + len(queue.heap) < queue.max_running
+        ]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(use_priority={self.use_priority!r})'
+
+
+class LockExtender:
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: str,
+        margin: float = 0.25,
+        window: float = 1.0,
+        max_workers: int = 10,
+        metrics: pycamunda.metrics.MetricsSink = None
+    ):
+        """Scheduler that extends the locks of external tasks shortly before they expire. The due
+        extensions are kept in a heap, so a single thread serves any number of locked external
+        tasks. Extensions that are due within `window` seconds are sent together and
+        concurrently.
+
+        The expiration of a lock is measured with the local monotonic clock from the moment the
+        external task was fetched, so it does not depend on the clocks of the worker and the
+        engine being in sync.
+
+        :param url: Camunda Rest engine URL.
+        :param worker_id: Id of the worker the external tasks are locked for.
+        :param margin: Share of the lock duration that is left when the lock is extended.
+        :param window: Time in seconds extensions are brought forward to be sent together with
+                       other extensions.
+        :param max_workers: Maximum number of extensions sent at the same time.
+        :param metrics: Sink that receives the number of extended locks, failed extensions and
+                        locks that expired before they were extended.
+        """
+        self.url = url
+        self.worker_id = worker_id
+        self.margin = margin
+        self.window = window
+        self.max_workers = max_workers
+        self.metrics = metrics if metrics is not None else pycamunda.metrics.MetricsSink()
+        self.auth = None
+        self.session = None
+
+        self._heap = []
+        self._locks = {}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = True
+        self._thread = None
+
+    def start(self) -> None:
+        """Start extending locks in a background thread."""
+        with self._condition:
+            self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name=f'{self.worker_id}-lock-extender', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop extending locks and forget all tracked external tasks."""
+        with self._condition:
+            self._stopped = True
+            self._heap.clear()
+            self._locks.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def track(
+        self, id_: str, lock_duration: int, locked_at: float = None, received_at: float = None
+    ) -> None:
+        """Extend the lock of an external task until `untrack` is called.
+
+        :param id_: Id of the external task.
+        :param lock_duration: Duration the external task is locked for in milliseconds.
+        :param locked_at: Monotonic time when the external task was locked at the earliest, like
+                          the start of the fetch. Extensions are scheduled from it. Defaults to
+                          now.
+        :param received_at: Monotonic time when the lock was received, like the end of the fetch.
+                            Missed lock expirations are counted from it. Defaults to `locked_at`.
+        """
+        if locked_at is None:
+            locked_at = time.monotonic()
+        if received_at is None:
+            received_at = locked_at
+        with self._condition:
+            self._schedule(id_, lock_duration, locked_at, received_at)
+            self._condition.notify_all()
+
+    def untrack(self, id_: str) -> None:
+        """Stop extending the lock of an external task.
+
+        :param id_: Id of the external task.
+        """
+        with self._condition:
+            self._locks.pop(id_, None)
+
+    def extend(self, id_: str, lock_duration: int) -> bool:
+        """Extend the lock of an external task.
+
+        :param id_: Id of the external task.
+        :param lock_duration: New duration of the lock in milliseconds.
+        :return: Whether the lock was extended.
+        """
+        extend_lock = pycamunda.externaltask.ExtendLock(
+            url=self.url, id_=id_, new_duration=lock_duration, worker_id=self.worker_id
+        )
+        extend_lock.auth = self.auth
+        extend_lock.session = self.session
+        try:
+            extend_lock()
+        except pycamunda.PyCamundaException:
+            logger.exception('Extending the lock of external task %s failed.', id_)
+            return False
+        return True
+
+    def _schedule(
+        self, id_: str, lock_duration: int, locked_at: float, received_at: float
+    ) -> None:
+        key = next(self._counter)
+        due = locked_at + lock_duration / 1000 * (1 - self.margin)
+        self._locks[id_] = (key, lock_duration, received_at + lock_duration / 1000)
+        heapq.heappush(self._heap, (due, key, id_))
+
+    def _is_current(self, key: int, id_: str) -> bool:
+        return id_ in self._locks and self._locks[id_][0] == key
+
+    def _take_due(
+        self
+    ) -> typing.Tuple[typing.Optional[typing.List[typing.Tuple[str, int]]], typing.Optional[float]]:
+        """Take the due extensions from the heap. Has to be called with the condition held.
+
+        :return: Id and lock duration of the external tasks to extend or `None` if no extension is
+                 due yet, and the time in seconds until the next extension is due or `None` if
+                 no extension is scheduled.
+        """
+        while self._heap and not self._is_current(*self._heap[0][1:]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None, None
+        timeout = self._heap[0][0] - time.monotonic()
+        if timeout > 0:
+            return None, timeout
+        due = []
+        horizon = time.monotonic() + self.window
+        while self._heap and self._heap[0][0] <= horizon:
+            _, key, id_ = heapq.heappop(self._heap)
+            if self._is_current(key, id_):
+                due.append((id_, self._locks[id_][1]))
+        return due, None
+
+    def _pop_due(self) -> typing.List[typing.Tuple[str, int]]:
+        """Wait until extensions are due and take them from the heap.
+
+        :return: Id and lock duration of the external tasks to extend.
+        """
+        while not self._stopped:
+            due, timeout = self._take_due()
+            if due is not None:
+                return due
+            self._condition.wait(timeout)
+        return []
+
+    def _sending(self, due: typing.List[typing.Tuple[str, int]]) -> float:
+        """Count the locks that expired before their extension is sent. Has to be called with the
+        condition held.
+
+        :return: Monotonic time the extensions are sent at.
+        """
+        sent_at = time.monotonic()
+        missed = sum(self._locks[id_][2] <= sent_at for id_, _ in due)
+        if missed:
+            self.metrics.increment('missed_lock_expirations_total', missed)
+        return sent_at
+
+    def _sent(
+        self, due: typing.List[typing.Tuple[str, int]], extended: typing.List[bool], sent_at: float
+    ) -> None:
+        """Reschedule the extended locks and forget the ones that could not be extended."""
+        received_at = time.monotonic()
+        if any(extended):
+            self.metrics.increment('lock_extensions_total', sum(extended))
+        if not all(extended):
+            self.metrics.increment('lock_extension_errors_total', len(extended) - sum(extended))
+        with self._condition:
+            for (id_, lock_duration), success in zip(due, extended):
+                if id_ not in self._locks:
+                    continue
+                if success:
+                    self._schedule(id_, lock_duration, sent_at, received_at)
+                else:
+                    del self._locks[id_]
+
+    def _run(self) -> None:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f'{self.worker_id}-lock-extender'
+        ) as executor:
+            while True:
+                with self._condition:
+                    due = self._pop_due()
+                    if self._stopped:
+                        return
+                    sent_at = self._sending(due)
+                extended = list(executor.map(lambda lock: self.extend(*lock), due))
+                self._sent(due, extended, sent_at)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(url={self.url!r}, worker_id={self.worker_id!r})'
+
+
+class AsyncLockExtender(LockExtender):
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: str,
+        client: pycamunda.asyncclient.AsyncClient = None,
+        margin: float = 0.25,
+        window: float = 1.0,
+        max_workers: int = 10,
+        metrics: pycamunda.metrics.MetricsSink = None
+    ):
+        """Scheduler that extends the locks of external tasks shortly before they expire in a
+        task on the running event loop. The extensions are sent with an `AsyncClient`, so they
+        use its authentication, retries and limits. Otherwise it works like `LockExtender`.
+
+        :param url: Camunda Rest engine URL.
+        :param worker_id: Id of the worker the external tasks are locked for.
+        :param client: Asyncio client to send the extensions with.
+        :param margin: Share of the lock duration that is left when the lock is extended.
+        :param window: Time in seconds extensions are brought forward to be sent together with
+                       other extensions.
+        :param max_workers: Maximum number of extensions sent at the same time.
+        :param metrics: Sink that receives the number of extended locks, failed extensions and
+                        locks that expired before they were extended.
+        """
+        super().__init__(
+            url=url,
+            worker_id=worker_id,
+            margin=margin,
+            window=window,
+            max_workers=max_workers,
+            metrics=metrics
+        )
+        self.client = client
+        self._wakeup = None
+        self._task = None
+
+    def start(self) -> None:
+        """Start extending locks in a task on the running event loop."""
+        with self._condition:
+            self._stopped = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.ensure_future(self._arun())
+
+    def stop(self) -> None:
+        """Stop extending locks and forget all tracked external tasks."""
+        with self._condition:
+            self._stopped = True
+            self._heap.clear()
+            self._locks.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def track(
+        self, id_: str, lock_duration: int, locked_at: float = None, received_at: float = None
+    ) -> None:
+        super().track(id_, lock_duration, locked_at=locked_at, received_at=received_at)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def extend(self, id_: str, lock_duration: int) -> bool:
+        """Extend the lock of an external task.
+
+        :param id_: Id of the external task.
+        :param lock_duration: New duration of the lock in milliseconds.
+        :return: Whether the lock was extended.
+        """
+        extend_lock = pycamunda.externaltask.ExtendLock(
+            url=self.url, id_=id_, new_duration=lock_duration, worker_id=self.worker_id
+        )
+        extend_lock.auth = self.auth
+        try:
+            await extend_lock.acall(self.client)
+        except pycamunda.PyCamundaException:
+            logger.exception('Extending the lock of external task %s failed.', id_)
+            return False
+        return True
+
+    async def _pop_due_async(self) -> typing.List[typing.Tuple[str, int]]:
+        while True:
+            with self._condition:
+                if self._stopped:
+                    return []
+                due, timeout = self._take_due()
+                if due is not None:
+                    return due
+                self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _arun(self) -> None:
+        window = asyncio.Semaphore(self.max_workers)
+
+        async def extend(id_, lock_duration):
+            async with window:
+                return await self.extend(id_, lock_duration)
+
+        while True:
+            due = await self._pop_due_async()
+            with self._condition:
+                if self._stopped:
+                    return
+                sent_at = self._sending(due)
+            extended = list(await asyncio.gather(*(extend(*lock) for lock in due)))
+            self._sent(due, extended, sent_at)
+
+
+class FetchSizer:
+
+    def __init__(self, smoothing: float = 0.2, margin: float = 0.25):
+        """Estimator for the number of external tasks a worker fetches with one request. It is
+        based on the free handler capacity, the recent handler latency and the lock budget.
+
+        Free handler slots are always filled. On top of that, as many external tasks are fetched
+        in advance as the handlers finish during one fetch round trip, so no slot stays idle
+        while the next fetch is on its way. External tasks waiting for a slot must still be
+        finished before their lock expires, which limits the number fetched in advance.
+
+        :param smoothing: Weight of a new observation in the moving averages of the latencies.
+        :param margin: Share of the lock duration that is not used up by waiting and handling.
+        """
+        self.smoothing = smoothing
+        self.margin = margin
+        self.handler_latency = None
+        self.fetch_latency = None
+
+    def observe_handler(self, seconds: float) -> None:
+        """Record the duration of a handler.
+
+        :param seconds: Duration in seconds.
+        """
+        self.handler_latency = self._average(self.handler_latency, seconds)
+
+    def observe_fetch(self, seconds: float, fetched: int) -> None:
+        """Record the duration of a fetch. Fetches without external tasks are ignored, as their
+        duration is the long polling timeout rather than the round trip time.
+
+        :param seconds: Duration in seconds.
+        :param fetched: Number of fetched external tasks.
+        """
+        if fetched:
+            self.fetch_latency = self._average(self.fetch_latency, seconds)
+
+    def size(
+        self, max_workers: int, max_tasks: int, running: int, queued: int, lock_duration: int
+    ) -> int:
+        """Get the number of external tasks to fetch.
+
+        :param max_workers: Maximum number of handlers running at the same time.
+        :param max_tasks: Maximum number of external tasks to fetch with one request.
+        :param running: Number of running handlers.
+        :param queued: Number of fetched external tasks waiting for a handler.
+        :param lock_duration: Duration the external tasks are locked for in milliseconds.
+        :return: The number of external tasks to fetch.
+        """
+        free = max_workers - running - queued
+        if self.handler_latency is not None and self.fetch_latency is not None:
+            throughput = max_workers / max(self.handler_latency, 1e-6)
+            budget = lock_duration / 1000 * (1 - self.margin) - self.handler_latency
+            in_advance = min(
+                math.ceil(throughput * self.fetch_latency), math.floor(throughput * budget)
+            )
+            free += max(in_advance, 0)
+        return max(min(free, max_tasks), 0)
+
+    def _average(self, average: typing.Optional[float], value: float) -> float:
+        if average is None:
+            return value
+        return average + self.smoothing * (value - average)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__qualname__}(handler_latency={self.handler_latency!r}, '
+            f'fetch_latency={self.fetch_latency!r})'
+        )
+
+
+class ReportCache:
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 600.0):
+        """Bounded cache of external tasks whose result was reported recently. Ids are evicted in
+        least recently used order when the cache is full and expire after `ttl` seconds.
+
+        :param maxsize: Maximum number of ids kept in the cache.
+        :param ttl: Time in seconds an id is kept in the cache.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._ids = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def claim(self, id_: str) -> bool:
+        """Add an id to the cache unless it is already contained.
+
+        :param id_: Id of the external task.
+        :return: Whether the id was added.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expires = self._ids.get(id_)
+            if expires is not None and expires > now:
+                self._ids.move_to_end(id_)
+                return False
+            self._ids[id_] = now + self.ttl
+            self._ids.move_to_end(id_)
+            while len(self._ids) > self.maxsize:
+                self._ids.popitem(last=False)
+            return True
+
+    def discard(self, id_: str) -> None:
+        """Remove an id from the cache if it is contained.
+
+        :param id_: Id of the external task.
+        """
+        with self._lock:
+            self._ids.pop(id_, None)
+
+    def __contains__(self, id_: str) -> bool:
+        with self._lock:
+            expires = self._ids.get(id_)
+            return expires is not None and expires > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(maxsize={self.maxsize!r}, ttl={self.ttl!r})'
+
+
+def _is_transient(exc: pycamunda.PyCamundaException) -> bool:
+    """Whether sending a request again can succeed after it raised an exception.
+
+    :param exc: The raised exception.
+    """
+    return not isinstance(
+        exc, (pycamunda.BadRequest, pycamunda.Unauthorized, pycamunda.Forbidden, pycamunda.NotFound)
+    )
+
+
+def _is_reported(
+    exc: pycamunda.PyCamundaException, attempt: int, retried: bool = False
+) -> bool:
+    """Whether a failed retry shows that an earlier attempt already reported the result. In that
+    case the external task does not exist anymore.
+
+    :param exc: The raised exception.
+    :param attempt: Number of the attempt, starting with 0.
+    :param retried: Whether the retry policy of the client retried the http request after an
+                    attempt that may have reached Camunda.
+    """
+    return (attempt > 0 or retried) and isinstance(exc, pycamunda.NotFound)
+
+
+class Reporter:
+
+    def __init__(
+        self,
+        max_in_flight: int = 10,
+        retries: int = 3,
+        backoff: float = 0.5,
+        cache: ReportCache = None
+    ):
+        """Pipeline that reports the results of external tasks concurrently, so handler threads do
+        not wait for the round trip. Reports are acknowledged independently of each other. If
+        all reports of the window are in flight, submitting another one blocks until one of them
+        is finished.
+
+        Reports for external tasks whose result was reported recently are skipped. If a retry
+        fails because the external task does not exist anymore, an earlier attempt reached
+        Camunda and the report counts as successful. This includes retries of the retry policy of
+        the client after attempts that may have reached Camunda.
+
+        :param max_in_flight: Maximum number of reports sent at the same time.
+        :param retries: How often a report is sent again after a transient error.
+        :param backoff: Time in seconds to wait before the first retry. It doubles with every
+                        retry.
+        :param cache: Cache of recently reported external tasks.
+        """
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache if cache is not None else ReportCache()
+
+        self._window = None
+        self._executor = None
+
+    def start(self) -> None:
+        """Start sending reports in background threads."""
+        self._window = threading.BoundedSemaphore(self.max_in_flight)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix='reporter'
+        )
+
+    def stop(self) -> None:
+        """Wait until all submitted reports are sent and stop the background threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def submit(self, request: pycamunda.base.CamundaRequest) -> concurrent.futures.Future:
+        """Submit a request that reports the result of an external task. If the reporter is not
+        started, the request is sent right away.
+
+        :param request: The request to send.
+        :return: Future of whether the report was successful.
+        """
+        if self._executor is None:
+            future = concurrent.futures.Future()
+            future.set_result(self.send(request))
+            return future
+        self._window.acquire()
+        try:
+            future = self._executor.submit(self.send, request)
+        except BaseException:
+            self._window.release()
+            raise
+        future.add_done_callback(lambda _: self._window.release())
+        return future
+
+    def send(self, request: pycamunda.base.CamundaRequest) -> bool:
+        """Send a request that reports the result of an external task. Transient errors are
+        retried, remaining errors are logged.
+
+        :param request: The request to send.
+        :return: Whether the report was successful.
+        """
+        if not self.cache.claim(request.id_):
+            logger.debug('Skipping duplicate report for external task %s.', request.id_)
+            return True
+        for attempt in range(self.retries + 1):
+            try:
+                request()
+            except pycamunda.PyCamundaException as exc:
+                if _is_reported(exc, attempt=attempt, retried=request._retried):
+                    return True
+                if attempt == self.retries or not _is_transient(exc):
+                    self.cache.discard(request.id_)
+                    logger.exception(
+                        'Reporting the result of external task %s failed.', request.id_
+                    )
+                    return False
+                time.sleep(self.backoff * 2 ** attempt)
+            else:
+                return True
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(max_in_flight={self.max_in_flight!r})'
+
+
+class AsyncReporter:
+
+    def __init__(
+        self,
+        client: pycamunda.asyncclient.AsyncClient = None,
+        max_in_flight: int = 100,
+        retries: int = 3,
+        backoff: float = 0.5,
+        cache: ReportCache = None
+    ):
+        """Pipeline that reports the results of external tasks concurrently on the running event
+        loop. Reports are acknowledged independently of each other. If all reports of the window
+        are in flight, submitting another one waits until one of them is finished.
+
+        Reports for external tasks whose result was reported recently are skipped. If a retry
+        fails because the external task does not exist anymore, an earlier attempt reached
+        Camunda and the report counts as successful. This includes retries of the retry policy of
+        the client after attempts that may have reached Camunda.
+
+        :param client: Asyncio client to send the reports with.
+        :param max_in_flight: Maximum number of reports sent at the same time.
+        :param retries: How often a report is sent again after a transient error.
+        :param backoff: Time in seconds to wait before the first retry. It doubles with every
+                        retry.
+        :param cache: Cache of recently reported external tasks.
+        """
+        self.client = client
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache if cache is not None else ReportCache()
+
+        self._window = None
+        self._pending = set()
+
+    async def submit(self, request: pycamunda.base.CamundaRequest) -> asyncio.Future:
+        """Submit a request that reports the result of an external task.
+
+        :param request: The request to send.
+        :return: Future of whether the report was successful.
+        """
+        if self._window is None:
+            self._window = asyncio.Semaphore(self.max_in_flight)
+        await self._window.acquire()
+        future = asyncio.ensure_future(self.send(request))
+        self._pending.add(future)
+        future.add_done_callback(self._release)
+        return future
+
+    async def send(self, request: pycamunda.base.CamundaRequest) -> bool:
+        """Send a request that reports the result of an external task. Transient errors are
+        retried, remaining errors are logged.
+
+        :param request: The request to send.
+        :return: Whether the report was successful.
+        """
+        if not self.cache.claim(request.id_):
+            logger.debug('Skipping duplicate report for external task %s.', request.id_)
+            return True
+        for attempt in range(self.retries + 1):
+            try:
+                await request.acall(self.client)
+            except pycamunda.PyCamundaException as exc:
+                if _is_reported(exc, attempt=attempt, retried=request._retried):
+                    return True
+                if attempt == self.retries or not _is_transient(exc):
+                    self.cache.discard(request.id_)
+                    logger.exception(
+                        'Reporting the result of external task %s failed.', request.id_
+                    )
+                    return False
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+            else:
+                return True
+
+    async def join(self) -> None:
+        """Wait until all submitted reports are sent."""
+        while self._pending:
+            await asyncio.wait(set(self._pending))
+
+    def _release(self, future: asyncio.Future) -> None:
+        self._pending.discard(future)
+        self._window.release()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(max_in_flight={self.max_in_flight!r})'
+
+
+class _WorkerBase:
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: str,
+        max_workers: int,
+        max_tasks: int = None,
+        async_response_timeout: int = 30000,
+        use_priority: bool = False,
+        retries: int = 3,
+        retry_timeout: int = 0,
+        fetch_error_timeout: float = 5.0,
+        max_processes: int = None,
+        extend_locks: bool = True,
+        adaptive_fetch: bool = True,
+        max_reports: int = None,
+        report_retries: int = 3,
+        metrics: pycamunda.metrics.MetricsSink = None
+    ):
+        self.url = url
+        self.worker_id = worker_id
+        self.max_workers = max_workers
+        self.max_tasks = max_tasks if max_tasks is not None else max_workers
+        self.async_response_timeout = async_response_timeout
+        self.use_priority = use_priority
+        self.retries = retries
+        self.retry_timeout = retry_timeout
+        self.fetch_error_timeout = fetch_error_timeout
+        self.max_processes = max_processes
+        self.extend_locks = extend_locks
+        self.adaptive_fetch = adaptive_fetch
+        self.max_reports = max_reports if max_reports is not None else max_workers
+        self.report_retries = report_retries
+        self.metrics = metrics if metrics is not None else pycamunda.metrics.MetricsSink()
+        self.fetch_sizer = FetchSizer()
+        self.topics = {}
+        self.auth = None
+        self.session = None
+
+        self.scheduler = Scheduler(use_priority=use_priority)
+        self._running = 0
+        self._deadline = None
+        self._process_pool = None
+        self._lock_extender = None
+        self._locked_at = {}
+
+    def subscribe(
+        self,
+        topic: str,
+        handler: Handler,
+        lock_duration: int,
+        variables: typing.Iterable[str] = None,
+        deserialize_values: bool = False,
+        cpu_bound: bool = False,
+        max_running: int = None,
+        weight: float = 1.0,
+        priority: int = 0,
+        tenant_id_in: typing.Iterable[str] = None,
+        process_definition_key_in: typing.Iterable[str] = None
+    ) -> None:
+        """Subscribe to a topic.
+
+        :param topic: Name of the topic.
+        :param handler: Callable that handles an external task of the topic. It receives the
+                        external task and returns the variables to complete it with or `None`.
+                        Handlers of an `AsyncWorker` are coroutine functions.
+        :param lock_duration: Duration to lock the fetched external tasks for in milliseconds.
+        :param variables: Variables to request from the process instance the external task belongs
+                          to. If set to `None` all variables are requested.
+        :param deserialize_values: Whether serializable variable values are deserialized on server
+                                   side.
+        :param cpu_bound: Whether the handler runs in a separate process. Use this for handlers
+                          doing heavy computation. The processes are spawned, so the handler has
+                          to be a function defined at module level that is not a coroutine
+                          function, and its module is imported again in every process. Only the
+                          external task and the returned variables are sent between the
+                          processes.
+        :param max_running: Maximum number of handlers of the topic running at the same time.
+        :param weight: Share of the handler slots relative to other topics of the same priority.
+        :param priority: Priority of the topic. External tasks of topics with higher priority
+                         are handled first.
+        :param tenant_id_in: Fetch only external tasks of these tenants.
+        :param process_definition_key_in: Fetch only external tasks of process definitions with
+                                          these keys.
+        """
+        self.topics[topic] = Topic(
+            name=topic,
+            handler=handler,
+            lock_duration=lock_duration,
+            variables=variables,
+            deserialize_values=deserialize_values,
+            cpu_bound=cpu_bound,
+            max_running=max_running,
+            weight=weight,
+            priority=priority,
+            tenant_id_in=tenant_id_in,
+            process_definition_key_in=process_definition_key_in
+        )
+        self.scheduler.add_topic(
+            name=topic, weight=weight, priority=priority, max_running=max_running
+        )
+
+    def unsubscribe(self, topic: str) -> None:
+        """Unsubscribe from a topic. Must not be called while the worker runs.
+
+        :param topic: Name of the topic.
+        """
+        del self.topics[topic]
+        self.scheduler.remove_topic(topic)
+
+    def fetch_and_lock_request(
+        self, max_tasks: int, topics: typing.Iterable[str] = None
+    ) -> pycamunda.externaltask.FetchAndLock:
+        """Create the request that fetches and locks external tasks of the subscribed topics.
+
+        :param max_tasks: Maximum number of external tasks to fetch.
+        :param topics: Names of the topics to fetch external tasks of. Defaults to all subscribed
+                       topics.
+        """
+        fetch_and_lock = pycamunda.externaltask.FetchAndLock(
+            url=self.url,
+            worker_id=self.worker_id,
+            max_tasks=max_tasks,
+            async_response_timeout=self.async_response_timeout,
+            use_priority=self.use_priority
+        )
+        for topic in self.topics.values():
+            if topics is not None and topic.name not in topics:
+                continue
+            fetch_and_lock.add_topic(
+                name=topic.name,
+                lock_duration=topic.lock_duration,
+                variables=topic.variables,
+                deserialize_values=topic.deserialize_values,
+                tenant_id_in=topic.tenant_id_in,
+                process_definition_key_in=topic.process_definition_key_in
+            )
+        return self._prepare(fetch_and_lock)
+
+    def complete_request(
+        self,
+        external_task: pycamunda.externaltask.ExternalTask,
+        variables: typing.Mapping[str, typing.Any] = None
+    ) -> pycamunda.externaltask.Complete:
+        """Create the request that completes an external task.
+
+        :param external_task: The external task to complete.
+        :param variables: Variables to send to the process instance.
+        """
+        complete = pycamunda.externaltask.Complete(
+            url=self.url, id_=external_task.id_, worker_id=self.worker_id
+        )
+        for name, value in (variables or {}).items():
+            complete.add_variable(name=name, value=value)
+        return self._prepare(complete)
+
+    def failure_request(
+        self, external_task: pycamunda.externaltask.ExternalTask, exc: BaseException
+    ) -> pycamunda.externaltask.HandleFailure:
+        """Create the request that reports the failure of an external task.
+
+        :param external_task: The external task that failed.
+        :param exc: The exception the handler raised.
+        """
+        if external_task.retries is None:
+            retries = self.retries
+        else:
+            retries = max(external_task.retries - 1, 0)
+        return self._prepare(pycamunda.externaltask.HandleFailure(
+            url=self.url,
+            id_=external_task.id_,
+            worker_id=self.worker_id,
+            error_message=str(exc) or exc.__class__.__name__,
+            error_details=''.join(traceback.format_exception(type(exc), exc, exc.__traceback__)),
+            retries=retries,
+            retry_timeout=self.retry_timeout
+        ))
+
+    def bpmn_error_request(
+        self, external_task: pycamunda.externaltask.ExternalTask, error: BPMNError
+    ) -> pycamunda.externaltask.HandleBPMNError:
+        """Create the request that reports a business error of an external task.
+
+        :param external_task: The external task the error occurred for.
+        :param error: The error the handler raised.
+        """
+        bpmn_error = pycamunda.externaltask.HandleBPMNError(
+            url=self.url,
+            id_=external_task.id_,
+            worker_id=self.worker_id,
+            error_code=error.error_code,
+            error_message=error.error_message
+        )
+        for name, value in error.variables.items():
+            bpmn_error.add_variable(name=name, value=value)
+        return self._prepare(bpmn_error)
+
+    def unlock_request(
+        self, external_task: pycamunda.externaltask.ExternalTask
+    ) -> pycamunda.externaltask.Unlock:
+        """Create the request that unlocks an external task, so it can be fetched again right
+        away.
+
+        :param external_task: The external task to unlock.
+        """
+        return self._prepare(pycamunda.externaltask.Unlock(url=self.url, id_=external_task.id_))
+
+    def _prepare(self, request: pycamunda.base.CamundaRequest) -> pycamunda.base.CamundaRequest:
+        request.auth = self.auth
+        request.session = self.session
+        return request
+
+    def _setup(self) -> None:
+        if any(topic.cpu_bound for topic in self.topics.values()):
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_processes, mp_context=multiprocessing.get_context('spawn')
+            )
+        if self.extend_locks:
+            self._lock_extender = self._create_lock_extender()
+            self._lock_extender.start()
+
+    def _create_lock_extender(self) -> LockExtender:
+        lock_extender = LockExtender(
+            url=self.url,
+            worker_id=self.worker_id,
+            max_workers=self.max_workers,
+            metrics=self.metrics
+        )
+        lock_extender.auth = self.auth
+        lock_extender.session = self.session
+        return lock_extender
+
+    def _teardown(self, wait: bool = True) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+            self._process_pool = None
+        if self._lock_extender is not None:
+            self._lock_extender.stop()
+            self._lock_extender = None
+        self._locked_at.clear()
+
+    def _track(
+        self,
+        external_task: pycamunda.externaltask.ExternalTask,
+        locked_at: float,
+        received_at: float
+    ) -> None:
+        if self._lock_extender is not None:
+            lock_duration = self.topics[external_task.topic_name].lock_duration
+            self._lock_extender.track(
+                external_task.id_, lock_duration, locked_at=locked_at, received_at=received_at
+            )
+
+    def _untrack(self, external_task: pycamunda.externaltask.ExternalTask) -> None:
+        if self._lock_extender is not None:
+            self._lock_extender.untrack(external_task.id_)
+
+    def _observe_handler(
+        self, external_task: pycamunda.externaltask.ExternalTask, started: float
+    ) -> typing.Optional[float]:
+        """Record the duration of a finished handler.
+
+        :return: Monotonic time when the external task was locked.
+        """
+        finished = time.monotonic()
+        labels = {'topic': external_task.topic_name}
+        self.fetch_sizer.observe_handler(finished - started)
+        self.metrics.observe('handler_duration_seconds', finished - started, labels)
+        locked = self._locked_at.pop(external_task.id_, None)
+        if locked is None:
+            return None
+        locked_at, received_at = locked
+        if self._lock_extender is None:
+            lock_duration = self.topics[external_task.topic_name].lock_duration
+            if finished - received_at > lock_duration / 1000:
+                self.metrics.increment('missed_lock_expirations_total', labels=labels)
+        return locked_at
+
+    def _observe_report(
+        self,
+        external_task: pycamunda.externaltask.ExternalTask,
+        locked_at: typing.Optional[float],
+        future: typing.Union[concurrent.futures.Future, asyncio.Future]
+    ) -> None:
+        """Record the time from fetching an external task until its result was reported."""
+        def done(future):
+            if not future.cancelled() and future.exception() is None and future.result():
+                self.metrics.observe(
+                    'completion_latency_seconds',
+                    time.monotonic() - locked_at,
+                    {'topic': external_task.topic_name}
+                )
+
+        if locked_at is not None:
+            future.add_done_callback(done)
+
+    def _remaining(self) -> typing.Optional[float]:
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0)
+
+    def _fetch_size(self) -> int:
+        topics = self.scheduler.fetchable()
+        if not topics:
+            return 0
+        if not self.adaptive_fetch:
+            held = self._running + len(self.scheduler)
+            return max(min(self.max_workers - held, self.max_tasks), 0)
+        return self.fetch_sizer.size(
+            max_workers=self.max_workers,
+            max_tasks=self.max_tasks,
+            running=self._running,
+            queued=len(self.scheduler),
+            lock_duration=min(self.topics[topic].lock_duration for topic in topics)
+        )
+
+    def _enqueue(
+        self,
+        external_tasks: typing.Iterable[pycamunda.externaltask.ExternalTask],
+        locked_at: float
+    ) -> None:
+        received_at = time.monotonic()
+        duration = received_at - locked_at
+        self.fetch_sizer.observe_fetch(duration, len(external_tasks))
+        self.metrics.increment('fetches_total')
+        self.metrics.observe('fetch_duration_seconds', duration)
+        if not external_tasks:
+            self.metrics.increment('empty_fetches_total')
+        for topic, fetched in collections.Counter(
+            external_task.topic_name for external_task in external_tasks
+        ).items():
+            self.metrics.increment('fetched_tasks_total', fetched, {'topic': topic})
+        for external_task in external_tasks:
+            self._locked_at[external_task.id_] = (locked_at, received_at)
+            self.reporter.cache.discard(external_task.id_)
+            self._track(external_task, locked_at=locked_at, received_at=received_at)
+            self.scheduler.push(external_task)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(url={self.url!r}, worker_id={self.worker_id!r})'
+
+
+class Worker(_WorkerBase):
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: str,
+        max_workers: int = 10,
+        max_tasks: int = None,
+        async_response_timeout: int = 30000,
+        use_priority: bool = False,
+        retries: int = 3,
+        retry_timeout: int = 0,
+        fetch_error_timeout: float = 5.0,
+        max_processes: int = None,
+        extend_locks: bool = True,
+        adaptive_fetch: bool = True,
+        max_reports: int = None,
+        report_retries: int = 3,
+        metrics: pycamunda.metrics.MetricsSink = None
+    ):
+        """Worker that long-polls external tasks of the subscribed topics and handles them in a
+        thread pool. External tasks are completed with the variables returned by the handler. If
+        the handler raises `BPMNError` a business error is reported, any other exception is
+        reported as failure. Handlers of cpu bound topics run in a process pool, so they are not
+        limited by the global interpreter lock. Locks of external tasks are extended shortly
+        before they expire as long as their handler runs.
+
+        New external tasks are fetched as soon as a handler thread is free. A `FetchSizer`
+        additionally fetches a few external tasks in advance, as many as the handlers can finish
+        before their locks expire. Set `fetch_lock` to a lock or semaphore shared with other
+        workers to limit how many of them long-poll at the same time.
+
+        :param url: Camunda Rest engine URL.
+        :param worker_id: Id of the worker the external tasks are locked for.
+        :param max_workers: Maximum number of handlers running at the same time.
+        :param max_tasks: Maximum number of external tasks to fetch with one request. Defaults to
+                          `max_workers`.
+        :param async_response_timeout: Long polling timeout in milliseconds.
+        :param use_priority: Whether the external tasks are fetched based on their priority.
+        :param retries: Number of retries of an external task after its first failure.
+        :param retry_timeout: Timeout in milliseconds until a failed external task can be fetched
+                              again.
+        :param fetch_error_timeout: Time in seconds to wait after fetching failed.
+        :param max_processes: Number of processes running the handlers of cpu bound topics.
+                              Defaults to the number of processors.
+        :param extend_locks: Whether the locks of external tasks are extended by a
+                             `LockExtender` while their handler runs.
+        :param adaptive_fetch: Whether the number of fetched external tasks is adapted by a
+                               `FetchSizer` to the handler latency and the lock duration. If
+                               `False`, only free handler slots are fetched for.
+        :param max_reports: Maximum number of results reported to Camunda at the same time.
+                            Defaults to `max_workers`.
+        :param report_retries: How often reporting a result is retried after a transient error.
+        :param metrics: Sink that receives metrics of fetching, handling and reporting external
+                        tasks and of their locks. By default metrics are discarded.
+        """
+        super().__init__(
+            url=url,
+            worker_id=worker_id,
+            max_workers=max_workers,
+            max_tasks=max_tasks,
+            async_response_timeout=async_response_timeout,
+            use_priority=use_priority,
+            retries=retries,
+            retry_timeout=retry_timeout,
+            fetch_error_timeout=fetch_error_timeout,
+            max_processes=max_processes,
+            extend_locks=extend_locks,
+            adaptive_fetch=adaptive_fetch,
+            max_reports=max_reports,
+            report_retries=report_retries,
+            metrics=metrics
+        )
+        self.reporter = Reporter(max_in_flight=self.max_reports, retries=report_retries)
+        self.fetch_lock = None
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._executor = None
+        self._fetcher = None
+
+    def run(self) -> None:
+        """Fetch and handle external tasks until `stop` is called."""
+        assert self.topics, 'Cannot run a worker without subscribed topics.'
+        self._stopped.clear()
+        self._deadline = None
+        self._setup()
+        self.reporter.start()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=self.worker_id
+        )
+        self._fetcher = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f'{self.worker_id}-fetch'
+        )
+        drained = False
+        fetching = None
+        try:
+            while not self._stopped.is_set():
+                max_tasks, topics = self._wait_for_capacity()
+                if max_tasks == 0:
+                    continue
+                locked_at = time.monotonic()
+                fetching = self._fetcher.submit(
+                    contextvars.copy_context().run, self.fetch, max_tasks=max_tasks, topics=topics
+                )
+                fetching.add_done_callback(lambda future: self._notify())
+                with self._condition:
+                    self._condition.wait_for(lambda: fetching.done() or self._stopped.is_set())
+                if not fetching.done():
+                    break
+                try:
+                    external_tasks = fetching.result()
+                except pycamunda.PyCamundaException:
+                    logger.exception('Fetching external tasks failed.')
+                    self.metrics.increment('fetch_errors_total')
+                    self._stopped.wait(self.fetch_error_timeout)
+                    continue
+                finally:
+                    fetching = None
+                with self._condition:
+                    self._enqueue(external_tasks, locked_at=locked_at)
+                    self._dispatch()
+            with self._condition:
+                unstarted = self.scheduler.drain()
+            self.unlock(unstarted)
+            with self._condition:
+                drained = self._condition.wait_for(
+                    lambda: not self._running, timeout=self._remaining()
+                )
+                if not drained:
+                    logger.warning(
+                        'Stopped waiting for %s running handlers of worker %s.',
+                        self._running,
+                        self.worker_id
+                    )
+            if fetching is not None:
+                self._finish_fetch(fetching, locked_at=locked_at)
+        finally:
+            self._fetcher.shutdown(wait=False)
+            self._executor.shutdown(wait=drained)
+            self.reporter.stop()
+            self._teardown(wait=drained)
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop fetching external tasks. Fetched external tasks whose handler did not start yet
+        are unlocked, so other workers can fetch them right away. Running handlers are waited for
+        before `run` returns.
+
+        :param timeout: Time in seconds to wait for running handlers and a running fetch.
+                        Afterwards `run` returns and the locks of the external tasks are no longer
+                        extended. Their handlers keep running in the background. External tasks the
+                        abandoned fetch locks are fetched again once their locks expire. If `None`,
+                        `run` waits until all handlers and the fetch finished.
+        """
+        if timeout is not None:
+            self._deadline = time.monotonic() + timeout
+        self._stopped.set()
+        self._notify()
+
+    def unlock(self, external_tasks: typing.Iterable[pycamunda.externaltask.ExternalTask]) -> None:
+        """Unlock external tasks concurrently. Errors are logged.
+
+        :param external_tasks: The external tasks to unlock.
+        """
+        futures = []
+        for external_task in external_tasks:
+            self._untrack(external_task)
+            self._locked_at.pop(external_task.id_, None)
+            futures.append(self.reporter.submit(self.unlock_request(external_task)))
+        concurrent.futures.wait(futures)
+
+    def fetch(
+        self, max_tasks: int, topics: typing.Iterable[str] = None
+    ) -> typing.Tuple[pycamunda.externaltask.ExternalTask]:
+        """Fetch and lock external tasks of the subscribed topics. If `fetch_lock` is set, it is
+        held while fetching, so workers sharing it do not long-poll at the same time.
+
+        :param max_tasks: Maximum number of external tasks to fetch.
+        :param topics: Names of the topics to fetch external tasks of. Defaults to all subscribed
+                       topics.
+        :return: The locked external tasks. Empty if the worker was stopped while waiting for
+                 `fetch_lock`.
+        """
+        request = self.fetch_and_lock_request(max_tasks=max_tasks, topics=topics)
+        if self.fetch_lock is None:
+            return request()
+        while not self.fetch_lock.acquire(timeout=0.1):
+            if self._stopped.is_set():
+                return ()
+        try:
+            return request()
+        finally:
+            self.fetch_lock.release()
+
+    def execute(self, external_task: pycamunda.externaltask.ExternalTask) -> None:
+        """Handle an external task and report the result to Camunda.
+
+        :param external_task: The external task to handle.
+        """
+        topic = self.topics[external_task.topic_name]
+        started = time.monotonic()
+        try:
+            if topic.cpu_bound:
+                variables = self._process_pool.submit(topic.handler, external_task).result()
+            else:
+                variables = topic.handler(external_task)
+        except BPMNError as error:
+            request = self.bpmn_error_request(external_task, error=error)
+        except Exception as exc:
+            request = self.failure_request(external_task, exc=exc)
+        else:
+            request = self.complete_request(external_task, variables=variables)
+        finally:
+            self._untrack(external_task)
+            locked_at = self._observe_handler(external_task, started=started)
+        self._observe_report(external_task, locked_at, self.report(request))
+
+    def report(self, request: pycamunda.base.CamundaRequest) -> concurrent.futures.Future:
+        """Submit a request that reports the result of an external task to the reporter of the
+        worker. Errors are logged.
+
+        :param request: The request to send.
+        :return: Future of whether the report was successful.
+        """
+        return self.reporter.submit(request)
+
+    def _notify(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
+
+    def _finish_fetch(self, fetching: concurrent.futures.Future, locked_at: float) -> None:
+        try:
+            external_tasks = fetching.result(timeout=self._remaining())
+        except concurrent.futures.TimeoutError:
+            logger.warning(
+                'Stopped waiting for the fetch of worker %s. Its external tasks are fetched again '
+                'when their locks expire.',
+                self.worker_id
+            )
+        except pycamunda.PyCamundaException:
+            logger.exception('Fetching external tasks failed.')
+            self.metrics.increment('fetch_errors_total')
+        else:
+            with self._condition:
+                self._enqueue(external_tasks, locked_at=locked_at)
+                unstarted = self.scheduler.drain()
+            self.unlock(unstarted)
+
+    def _wait_for_capacity(self) -> typing.Tuple[int, typing.List[str]]:
+        with self._condition:
+            self._condition.wait_for(lambda: self._stopped.is_set() or self._fetch_size() > 0)
+            if self._stopped.is_set():
+                return 0, []
+            return self._fetch_size(), self.scheduler.fetchable()
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_workers and not self._stopped.is_set():
+            external_task = self.scheduler.pop()
+            if external_task is None:
+                break
+            self._running += 1
+            future = self._executor.submit(self.execute, external_task)
+            future.add_done_callback(functools.partial(self._finish, external_task))
+
+    def _finish(
+        self,
+        external_task: pycamunda.externaltask.ExternalTask,
+        future: concurrent.futures.Future
+    ) -> None:
+        with self._condition:
+            self._running -= 1
+            self.scheduler.finish(external_task)
+            self._dispatch()
+            self._condition.notify_all()
+        if not future.cancelled() and future.exception() is not None:
+            logger.error('Handling an external task failed.', exc_info=future.exception())
+
+
+class AsyncWorker(_WorkerBase):
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: str,
+        max_workers: int = 100,
+        max_tasks: int = None,
+        async_response_timeout: int = 30000,
+        use_priority: bool = False,
+        retries: int = 3,
+        retry_timeout: int = 0,
+        fetch_error_timeout: float = 5.0,
+        max_processes: int = None,
+        extend_locks: bool = True,
+        adaptive_fetch: bool = True,
+        max_reports: int = None,
+        report_retries: int = 3,
+        client: pycamunda.asyncclient.AsyncClient = None,
+        metrics: pycamunda.metrics.MetricsSink = None
+    ):
+        """Worker that long-polls external tasks of the subscribed topics and handles them with
+        coroutine handlers on the running event loop. Fetching and reporting is done with an
+        `AsyncClient`, so thousands of I/O-bound external tasks can be handled at the same time
+        in one process. Locks of external tasks are extended shortly before they expire as long as
+        their handler runs.
+
+        External tasks are completed with the variables returned by the handler. If the handler
+        raises `BPMNError` a business error is reported, any other exception is reported as
+        failure.
+
+        :param url: Camunda Rest engine URL.
+        :param worker_id: Id of the worker the external tasks are locked for.
+        :param max_workers: Maximum number of handlers running at the same time.
+        :param max_tasks: Maximum number of external tasks to fetch with one request. Defaults to
+                          `max_workers`.
+        :param async_response_timeout: Long polling timeout in milliseconds.
+        :param use_priority: Whether the external tasks are fetched based on their priority.
+        :param retries: Number of retries of an external task after its first failure.
+        :param retry_timeout: Timeout in milliseconds until a failed external task can be fetched
+                              again.
+        :param fetch_error_timeout: Time in seconds to wait after fetching failed.
+        :param max_processes: Number of processes running the handlers of cpu bound topics.
+                              Defaults to the number of processors.
+        :param extend_locks: Whether the locks of external tasks are extended by an
+                             `AsyncLockExtender` while their handler runs.
+        :param adaptive_fetch: Whether the number of fetched external tasks is adapted by a
+                               `FetchSizer` to the handler latency and the lock duration. If
+                               `False`, only free handler slots are fetched for.
+        :param max_reports: Maximum number of results reported to Camunda at the same time.
+                            Defaults to `max_workers`.
+        :param report_retries: How often reporting a result is retried after a transient error.
+        :param client: Asyncio client to send the requests with. If `None`, a client is created
+                       when the worker runs and closed afterwards.
+        :param metrics: Sink that receives metrics of fetching, handling and reporting external
+                        tasks and of their locks. By default metrics are discarded.
+        """
+        super().__init__(
+            url=url,
+            worker_id=worker_id,
+            max_workers=max_workers,
+            max_tasks=max_tasks,
+            async_response_timeout=async_response_timeout,
+            use_priority=use_priority,
+            retries=retries,
+            retry_timeout=retry_timeout,
+            fetch_error_timeout=fetch_error_timeout,
+            max_processes=max_processes,
+            extend_locks=extend_locks,
+            adaptive_fetch=adaptive_fetch,
+            max_reports=max_reports,
+            report_retries=report_retries,
+            metrics=metrics
+        )
+        self.client = client
+        self.reporter = AsyncReporter(max_in_flight=self.max_reports, retries=report_retries)
+        self._client = None
+        self._changed = None
+        self._stopped = None
+        self._handlers = {}
+
+    async def run(self) -> None:
+        """Fetch and handle external tasks until `stop` is called."""
+        assert self.topics, 'Cannot run a worker without subscribed topics.'
+        self._changed = asyncio.Event()
+        self._stopped = asyncio.Event()
+        self._deadline = None
+        self._client = self.client or pycamunda.asyncclient.AsyncClient()
+        self.reporter.client = self._client
+        self._setup()
+        fetching = None
+        try:
+            while not self._stopped.is_set():
+                max_tasks, topics = await self._wait_for_capacity()
+                if max_tasks == 0:
+                    continue
+                locked_at = time.monotonic()
+                fetching = asyncio.ensure_future(self.fetch(max_tasks=max_tasks, topics=topics))
+                stopped = asyncio.ensure_future(self._stopped.wait())
+                await asyncio.wait({fetching, stopped}, return_when=asyncio.FIRST_COMPLETED)
+                stopped.cancel()
+                if not fetching.done():
+                    break
+                try:
+                    external_tasks = fetching.result()
+                except pycamunda.PyCamundaException:
+                    logger.exception('Fetching external tasks failed.')
+                    self.metrics.increment('fetch_errors_total')
+                    try:
+                        await asyncio.wait_for(self._stopped.wait(), self.fetch_error_timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                finally:
+                    fetching = None
+                self._enqueue(external_tasks, locked_at=locked_at)
+                self._dispatch()
+            await self.unlock(self.scheduler.drain())
+            if self._handlers:
+                _, pending = await asyncio.wait(set(self._handlers), timeout=self._remaining())
+                if pending:
+                    logger.warning(
+                        'Cancelling %s running handlers of worker %s.', len(pending), self.worker_id
+                    )
+                    cancelled = [self._handlers[future] for future in pending]
+                    for future in pending:
+                        future.cancel()
+                    await asyncio.wait(pending)
+                    await self.unlock(cancelled)
+            if fetching is not None:
+                await self._finish_fetch(fetching, locked_at=locked_at)
+            await self.reporter.join()
+        finally:
+            if fetching is not None:
+                fetching.cancel()
+            self._teardown()
+            if self.client is None:
+                await self._client.close()
+            self._client = None
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop fetching external tasks. Fetched external tasks whose handler did not start yet
+        are unlocked, so other workers can fetch them right away. Running handlers are waited for
+        before `run` returns. Has to be called from the thread of the event loop the worker runs
+        in.
+
+        :param timeout: Time in seconds to wait for running handlers and a running fetch.
+                        Afterwards the remaining handlers are cancelled and their external tasks
+                        are unlocked. A running fetch is cancelled. If `None`, `run` waits until
+                        all handlers and the fetch finished.
+        """
+        if self._stopped is not None:
+            if timeout is not None:
+                self._deadline = time.monotonic() + timeout
+            self._stopped.set()
+            self._changed.set()
+
+    async def unlock(
+        self, external_tasks: typing.Iterable[pycamunda.externaltask.ExternalTask]
+    ) -> None:
+        """Unlock external tasks concurrently. Errors are logged.
+
+        :param external_tasks: The external tasks to unlock.
+        """
+        futures = []
+        for external_task in external_tasks:
+            self._untrack(external_task)
+            self._locked_at.pop(external_task.id_, None)
+            futures.append(await self.reporter.submit(self.unlock_request(external_task)))
+        if futures:
+            await asyncio.wait(futures)
+
+    async def fetch(
+        self, max_tasks: int, topics: typing.Iterable[str] = None
+    ) -> typing.Tuple[pycamunda.externaltask.ExternalTask]:
+        """Fetch and lock external tasks of the subscribed topics.
+
+        :param max_tasks: Maximum number of external tasks to fetch.
+        :param topics: Names of the topics to fetch external tasks of. Defaults to all subscribed
+                       topics.
+        :return: The locked external tasks.
+        """
+        request = self.fetch_and_lock_request(max_tasks=max_tasks, topics=topics)
+        return await request.acall(self._client)
+
+    async def execute(self, external_task: pycamunda.externaltask.ExternalTask) -> None:
+        """Handle an external task and report the result to Camunda.
+
+        :param external_task: The external task to handle.
+        """
+        topic = self.topics[external_task.topic_name]
+        started = time.monotonic()
+        try:
+            if topic.cpu_bound:
+                variables = await asyncio.get_event_loop().run_in_executor(
+                    self._process_pool, topic.handler, external_task
+                )
+            else:
+                variables = await topic.handler(external_task)
+        except BPMNError as error:
+            request = self.bpmn_error_request(external_task, error=error)
+        except Exception as exc:
+            request = self.failure_request(external_task, exc=exc)
+        else:
+            request = self.complete_request(external_task, variables=variables)
+        finally:
+            self._untrack(external_task)
+            locked_at = self._observe_handler(external_task, started=started)
+        self._observe_report(external_task, locked_at, await self.report(request))
+
+    async def report(self, request: pycamunda.base.CamundaRequest) -> asyncio.Future:
+        """Submit a request that reports the result of an external task to the reporter of the
+        worker. Errors are logged.
+
+        :param request: The request to send.
+        :return: Future of whether the report was successful.
+        """
+        return await self.reporter.submit(request)
+
+    def _create_lock_extender(self) -> AsyncLockExtender:
+        lock_extender = AsyncLockExtender(
+            url=self.url,
+            worker_id=self.worker_id,
+            client=self._client,
+            max_workers=self.max_workers,
+            metrics=self.metrics
+        )
+        lock_extender.auth = self.auth
+        return lock_extender
+
+    async def _finish_fetch(self, fetching: asyncio.Future, locked_at: float) -> None:
+        _, pending = await asyncio.wait({fetching}, timeout=self._remaining())
+        if pending:
+            logger.warning(
+                'Cancelling the fetch of worker %s. Its external tasks are fetched again when '
+                'their locks expire.',
+                self.worker_id
+            )
+            fetching.cancel()
+            await asyncio.wait({fetching})
+            return
+        try:
+            external_tasks = fetching.result()
+        except pycamunda.PyCamundaException:
+            logger.exception('Fetching external tasks failed.')
+            self.metrics.increment('fetch_errors_total')
+        else:
+            self._enqueue(external_tasks, locked_at=locked_at)
+            await self.unlock(self.scheduler.drain())
+
+    async def _wait_for_capacity(self) -> typing.Tuple[int, typing.List[str]]:
+        while not self._stopped.is_set() and self._fetch_size() == 0:
+            self._changed.clear()
+            await self._changed.wait()
+        if self._stopped.is_set():
+            return 0, []
+        return self._fetch_size(), self.scheduler.fetchable()
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_workers and not self._stopped.is_set():
+            external_task = self.scheduler.pop()
+            if external_task is None:
+                break
+            self._running += 1
+            future = asyncio.ensure_future(self.execute(external_task))
+            self._handlers[future] = external_task
+            future.add_done_callback(functools.partial(self._finish, external_task))
+
+    def _finish(
+        self, external_task: pycamunda.externaltask.ExternalTask, future: asyncio.Future
+    ) -> None:
+        self._running -= 1
+        self.scheduler.finish(external_task)
+        self._handlers.pop(future, None)
+        self._dispatch()
+        self._changed.set()
+        if not future.cancelled() and future.exception() is not None:
+            logger.error('Handling an external task failed.', exc_info=future.exception())
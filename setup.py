@@ -22,5 +22,10 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     python_requires='>=3.7',
-    install_requires=['requests>=2.0.0']
+    install_requires=['requests>=2.0.0'],
+    extras_require={
+        'async': ['aiohttp>=3.7.0'],
+        'orjson': ['orjson>=3.0.0'],
+        'ujson': ['ujson>=4.0.0']
+    }
 )
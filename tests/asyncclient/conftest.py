@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+
+@pytest.fixture
+def my_externaltask_json():
+    return {
+        'activityId': 'anActivityId',
+        'activityInstanceId': 'anActivityInstanceId',
+        'errorMessage': 'anErrorMessage',
+        'executionId': 'anExecutionId',
+        'id': 'anId',
+        'processDefinitionId': 'aProcessDefinitionId',
+        'processDefinitionKey': 'aProcessDefinitionKey',
+        'processInstanceId': 'aProcessInstanceId',
+        'tenantId': 'aTenantId',
+        'retries': 10,
+        'workerId': 'aWorkerId',
+        'priority': 50,
+        'topicName': 'aTopicName',
+        'lockExpirationTime': None
+    }
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+import requests
+import requests.auth
+
+import pycamunda.asyncclient
+import pycamunda.externaltask
+import pycamunda.version
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web, test_utils  # noqa: E402
+
+
+def serve(handler, coroutine):
+    async def run():
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', handler)
+        async with test_utils.TestServer(app) as server:
+            async with pycamunda.asyncclient.AsyncClient() as client:
+                return await coroutine(client, str(server.make_url('/engine-rest')))
+
+    return asyncio.run(run())
+
+
+def test_asyncclient_sends_query_body_and_auth():
+    received = {}
+
+    async def handler(request):
+        received['method'] = request.method
+        received['query'] = request.query.getall('tenantIdIn')
+        received['body'] = await request.json()
+        received['auth'] = request.headers['Authorization']
+        return web.json_response({'count': 1})
+
+    async def send(client, url):
+        return await client.request(
+            method='POST',
+            url=url,
+            params={'tenantIdIn': ['a', 'b']},
+            json={'key': 'value'},
+            auth=requests.auth.HTTPBasicAuth('Jane', 'password')
+        )
+
+    response = serve(handler, send)
+
+    assert isinstance(response, requests.Response)
+    assert response.json() == {'count': 1}
+    assert received['method'] == 'POST'
+    assert received['query'] == ['a', 'b']
+    assert received['body'] == {'key': 'value'}
+    assert received['auth'].startswith('Basic ')
+
+
+def test_asyncclient_sends_files():
+    received = {}
+
+    async def handler(request):
+        form = await request.post()
+        received['name'] = form['deployment-name']
+        received['file'] = form['resource-0'].file.read()
+        return web.json_response({})
+
+    async def send(client, url):
+        return await client.request(
+            method='POST',
+            url=url,
+            data={'deployment-name': 'aName'},
+            files={'resource-0': b'<xml/>'}
+        )
+
+    serve(handler, send)
+
+    assert received == {'name': 'aName', 'file': b'<xml/>'}
+
+
+def test_asyncclient_raises_pycamunda_exception():
+    async def send(client, url):
+        return await client.request(method='GET', url='http://127.0.0.1:1/engine-rest')
+
+    async def handler(request):
+        return web.json_response({})
+
+    with pytest.raises(pycamunda.PyCamundaException):
+        serve(handler, send)
+
+
+def test_acall_loads_result():
+    async def handler(request):
+        return web.json_response({'version': '7.15.0'})
+
+    async def send(client, url):
+        return await pycamunda.version.Get(url=url).acall(client)
+
+    assert serve(handler, send) == '7.15.0'
+
+
+def test_acall_raises_for_status():
+    async def handler(request):
+        return web.json_response({'message': 'an error message'}, status=404)
+
+    async def send(client, url):
+        return await pycamunda.version.Get(url=url).acall(client)
+
+    with pytest.raises(pycamunda.NotFound):
+        serve(handler, send)
+
+
+def test_acall_awaits_every_request(my_externaltask_json):
+    paths = []
+
+    async def handler(request):
+        paths.append(request.path)
+        if request.path.endswith('/errorDetails'):
+            return web.Response(text='details')
+        return web.json_response({**my_externaltask_json, 'errorDetails': None})
+
+    async def send(client, url):
+        return await pycamunda.externaltask.Get(url=url, id_='anId').acall(client)
+
+    external_task = serve(handler, send)
+
+    assert external_task.error_details == 'details'
+    assert paths == [
+        '/engine-rest/external-task/anId', '/engine-rest/external-task/anId/errorDetails'
+    ]
+
+
+def test_acall_gathers_concurrent_requests(my_externaltask_json):
+    async def handler(request):
+        if request.path.endswith('/errorDetails'):
+            return web.Response(text=request.path.split('/')[-2])
+        return web.json_response([
+            {**my_externaltask_json, 'id': 'first'}, {**my_externaltask_json, 'id': 'second'}
+        ])
+
+    async def send(client, url):
+        return await pycamunda.externaltask.GetList(url=url).acall(client)
+
+    external_tasks = serve(handler, send)
+
+    assert [task.error_details for task in external_tasks] == ['first', 'second']
+
+
+@pytest.mark.parametrize('keep_cookies, cookies', [
+    (False, [None, None]), (True, [None, 'aSession'])
+])
+def test_asyncclient_cookies(keep_cookies, cookies):
+    received = []
+
+    async def handler(request):
+        received.append(request.cookies.get('JSESSIONID'))
+        response = web.json_response({})
+        response.set_cookie('JSESSIONID', 'aSession')
+        return response
+
+    async def run():
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', handler)
+        async with test_utils.TestServer(app) as server:
+            url = str(server.make_url('/engine-rest'))
+            async with pycamunda.asyncclient.AsyncClient(
+                url=url, keep_cookies=keep_cookies
+            ) as client:
+                await client.request(method='GET', url='/version')
+                await client.request(method='GET', url=url + '/version')
+
+    asyncio.run(run())
+
+    assert received == cookies
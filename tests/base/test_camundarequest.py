@@ -1,10 +1,19 @@
 # -*- coding: utf-8 -*-
 
+import subprocess
+import sys
 import unittest.mock
 
+import pytest
 from requests.sessions import Session
 from requests.auth import HTTPBasicAuth
 
+import pycamunda
+import pycamunda.base
+import pycamunda.client
+import pycamunda.deadline
+import pycamunda.request
+
 
 def test_camundarequest_keeps_query_params(engine_url, MyRequest):
 
@@ -51,3 +60,105 @@ def test_camundarequest_session(mock, engine_url, MyRequest):
     assert mock.called
     assert request.session.auth.username == 'Jane'
     assert request.session.auth.password == 'password'
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_camundarequest_uses_default_client(mock, engine_url, MyRequest):
+    request = MyRequest(url=engine_url)
+
+    assert request.client is pycamunda.client.default_client()
+    request()
+    assert mock.called
+
+
+def test_camundarequest_uses_bound_client(engine_url, MyRequest):
+    request = MyRequest(url=engine_url)
+    client = pycamunda.client.Client(url=engine_url)
+    request.session = client
+
+    assert request.client is client
+
+
+def test_camundarequest_builds_parameter_plans(MyRequest):
+
+    assert MyRequest._query_plan == (('query_param', 'param', None), )
+    assert MyRequest._body_plan == (('body_param', 'param', None), )
+    assert MyRequest._path_plan == ()
+
+
+def test_camundarequest_skips_unset_params(engine_url, MyRequest):
+    request = MyRequest(url=engine_url)
+
+    assert request.query_parameters() == {}
+    assert request.body_parameters() == {}
+
+
+def test_camundarequest_formats_path_params(engine_url):
+    class PathRequest(pycamunda.base.CamundaRequest):
+
+        id_ = pycamunda.request.PathParameter('id')
+
+        def __init__(self, url, id_=None):
+            super().__init__(url=url + '/resource/{id}')
+            self.id_ = id_
+
+        def __call__(self, *args, **kwargs):
+            pass
+
+    assert PathRequest(url=engine_url, id_='anId').url == engine_url + '/resource/anId'
+    assert PathRequest(url=engine_url, id_=1).url == engine_url + '/resource/1'
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_camundarequest_sends_timeout(mock, engine_url, MyRequest):
+    request = MyRequest(url=engine_url)
+    request.session = Session()
+    request()
+
+    assert 'timeout' not in mock.call_args[1]
+
+    request.timeout = (1, 2)
+    request()
+
+    assert mock.call_args[1]['timeout'] == (1, 2)
+
+
+@unittest.mock.patch('requests.Session.request')
+@unittest.mock.patch('time.monotonic', return_value=100.0)
+def test_camundarequest_shortens_timeout_to_deadline(monotonic, mock, engine_url, MyRequest):
+    request = MyRequest(url=engine_url)
+    request.session = Session()
+    request.timeout = (1, 10)
+    with pycamunda.deadline.deadline(5):
+        request()
+
+    assert mock.call_args[1]['timeout'] == (1, 5)
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_camundarequest_raises_after_deadline(mock, engine_url, MyRequest):
+    request = MyRequest(url=engine_url)
+    with pycamunda.deadline.deadline(0):
+        with pytest.raises(pycamunda.DeadlineExceeded):
+            request()
+
+    assert not mock.called
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_camundarequest_propagates_deadline_to_concurrent_requests(mock, engine_url, MyRequest):
+    request = MyRequest(url=engine_url)
+    request.session = Session()
+    with pycamunda.deadline.deadline(5):
+        request._send_all([
+            dict(method=pycamunda.base.RequestMethod.GET, url=engine_url) for _ in range(2)
+        ])
+
+    assert all(0 < call[1]['timeout'] <= 5 for call in mock.call_args_list)
+
+
+def test_camundarequest_does_not_import_aiohttp():
+    code = 'import sys, pycamunda.task, pycamunda.worker; print("aiohttp" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+
+    assert result.stdout.strip() == 'False'
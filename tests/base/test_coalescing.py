@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest.mock
+
+import pytest
+import requests
+
+import pycamunda
+import pycamunda.base
+import pycamunda.deadline
+import pycamunda.request
+
+
+@pytest.fixture
+def MyGetRequest():
+    class _MyGetRequest(pycamunda.base.CamundaRequest):
+
+        query_param = pycamunda.request.QueryParameter('param')
+
+        def __init__(self, url, query_param=None):
+            super().__init__(url=url)
+            self.query_param = query_param
+
+        @pycamunda.base._coalescing
+        def __call__(self, *args, **kwargs):
+            response = super().__call__(pycamunda.base.RequestMethod.GET, *args, **kwargs)
+            return response.json()
+
+    return _MyGetRequest
+
+
+@pytest.fixture
+def blocking_engine():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def request(session, method, url, **kwargs):
+        calls.append((url, kwargs.get('params')))
+        started.set()
+        release.wait(5)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"id": "anId"}'
+        return response
+
+    with unittest.mock.patch('requests.Session.request', request):
+        yield started, release, calls
+
+
+def call_concurrently(requests_, started, release):
+    results = [None] * len(requests_)
+    errors = []
+
+    def call(index):
+        try:
+            results[index] = requests_[index]()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=call, args=(index,), daemon=True) for index in range(len(requests_))
+    ]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    threading.Event().wait(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+
+def test_coalescing_shares_in_flight_request(engine_url, MyGetRequest, blocking_engine):
+    started, release, calls = blocking_engine
+    results, errors = call_concurrently(
+        [MyGetRequest(url=engine_url, query_param='a') for _ in range(3)], started, release
+    )
+
+    assert not errors
+    assert len(calls) == 1
+    assert results == [{'id': 'anId'}] * 3
+    assert results[0] is results[1] is results[2]
+    assert not pycamunda.base._flights
+
+
+def test_coalescing_distinguishes_queries(engine_url, MyGetRequest, blocking_engine):
+    started, release, calls = blocking_engine
+    results, errors = call_concurrently(
+        [MyGetRequest(url=engine_url, query_param=param) for param in ('a', 'b')], started, release
+    )
+
+    assert not errors
+    assert sorted(params['param'] for url, params in calls) == ['a', 'b']
+
+
+def test_coalescing_sends_sequential_calls(engine_url, MyGetRequest, blocking_engine):
+    started, release, calls = blocking_engine
+    release.set()
+    MyGetRequest(url=engine_url)()
+    MyGetRequest(url=engine_url)()
+
+    assert len(calls) == 2
+
+
+def test_coalescing_shares_exceptions(engine_url, MyGetRequest):
+    started = threading.Event()
+    release = threading.Event()
+
+    def request(session, method, url, **kwargs):
+        started.set()
+        release.wait(5)
+        raise requests.exceptions.ConnectionError()
+
+    with unittest.mock.patch('requests.Session.request', request):
+        results, errors = call_concurrently(
+            [MyGetRequest(url=engine_url) for _ in range(2)], started, release
+        )
+
+    assert len(errors) == 2
+    assert all(isinstance(error, pycamunda.PyCamundaException) for error in errors)
+    assert not pycamunda.base._flights
+
+
+def test_coalescing_respects_deadline(engine_url, MyGetRequest, blocking_engine):
+    started, release, calls = blocking_engine
+    thread = threading.Thread(target=MyGetRequest(url=engine_url), daemon=True)
+    thread.start()
+    assert started.wait(5)
+    try:
+        with pycamunda.deadline.deadline(0.01):
+            with pytest.raises(pycamunda.DeadlineExceeded):
+                MyGetRequest(url=engine_url)()
+    finally:
+        release.set()
+        thread.join(5)
+
+    assert len(calls) == 1
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+import datetime as dt
+
+import pytest
+
+import pycamunda.base
+
+
+def test_isoformat(date, date_str, date_tz, date_tz_str):
+
+    assert pycamunda.base.isoformat(date) == date_str
+    assert pycamunda.base.isoformat(date_tz) == date_tz_str
+    assert pycamunda.base.isoformat(date.date()) == '2020-01-01'
+
+
+def test_isoformat_converts_utcoffset(date):
+    offset = dt.timezone(-dt.timedelta(hours=5, minutes=30))
+
+    assert pycamunda.base.isoformat(date.replace(tzinfo=offset)) == '2020-01-01T01:01:01.000-0530'
+
+
+@pytest.mark.parametrize('datetime_str', [
+    '2020-01-01T01:01:01.000+0000',
+    '2020-01-01T01:01:01.000+00:00',
+    '2020-01-01T01:01:01.0Z',
+    '2020-01-01T01:01:01Z'
+])
+def test_from_isoformat(date_tz, datetime_str):
+
+    assert pycamunda.base.from_isoformat(datetime_str) == date_tz
+
+
+def test_from_isoformat_keeps_utcoffset():
+    datetime_ = pycamunda.base.from_isoformat('2020-01-01T01:01:01.123-0230')
+
+    assert datetime_.microsecond == 123000
+    assert datetime_.utcoffset() == -dt.timedelta(hours=2, minutes=30)
+
+
+@pytest.mark.parametrize('parse', [
+    pycamunda.base.from_isoformat, pycamunda.base._parse_isoformat
+])
+def test_from_isoformat_shares_timezones(parse):
+    first = parse('2020-01-01T01:01:01.100+0100')
+    second = parse('2020-01-02T01:01:01.100+0100')
+
+    assert first.tzinfo is second.tzinfo
+    assert second == dt.datetime(2020, 1, 2, 0, 1, 1, 100000, tzinfo=dt.timezone.utc)
+
+
+def test_from_isoformat_raises_value_error():
+    with pytest.raises(ValueError):
+        pycamunda.base.from_isoformat('not a date')
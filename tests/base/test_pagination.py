@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import unittest.mock
+
+import pytest
+
+import pycamunda.base
+import pycamunda.request
+from tests.mock import count_response_mock
+
+
+@pytest.fixture
+def MyListRequest():
+    class _MyListRequest(pycamunda.base._PaginationMixin, pycamunda.base.CamundaRequest):
+
+        first_result = pycamunda.request.QueryParameter('firstResult')
+        max_results = pycamunda.request.QueryParameter('maxResults')
+
+        def __init__(self, url, results, first_result=None, max_results=None):
+            super().__init__(url=url)
+            self.results = results
+            self.first_result = first_result
+            self.max_results = max_results
+            self.calls = []
+
+        def __call__(self, *args, **kwargs):
+            self.calls.append((self.first_result, self.max_results))
+            first_result = self.first_result or 0
+            return tuple(self.results[first_result:first_result + self.max_results])
+
+    return _MyListRequest
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_iter_pages_yields_pages(engine_url, MyListRequest, prefetch):
+    request = MyListRequest(url=engine_url, results=list(range(7)))
+
+    pages = list(request.iter_pages(page_size=3, prefetch=prefetch))
+
+    assert pages == [(0, 1, 2), (3, 4, 5), (6, )]
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_iter_pages_respects_first_and_max_results(engine_url, MyListRequest, prefetch):
+    request = MyListRequest(url=engine_url, results=list(range(10)), first_result=2, max_results=5)
+
+    pages = list(request.iter_pages(page_size=2, prefetch=prefetch))
+
+    assert pages == [(2, 3), (4, 5), (6, )]
+
+
+def test_iter_pages_is_lazy(engine_url, MyListRequest):
+    request = MyListRequest(url=engine_url, results=list(range(10)))
+    pages = request.iter_pages(page_size=2)
+
+    assert request.calls == []
+    next(pages)
+    assert request.calls == [(0, 2)]
+
+
+def test_iter_pages_does_not_modify_request(engine_url, MyListRequest):
+    request = MyListRequest(url=engine_url, results=list(range(5)))
+    list(request.iter_pages(page_size=2))
+
+    assert request.first_result is None
+    assert request.max_results is None
+
+
+def test_iter_pages_yields_nothing_for_empty_result(engine_url, MyListRequest):
+    request = MyListRequest(url=engine_url, results=[])
+
+    assert list(request.iter_pages(page_size=2)) == []
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_iter_all_yields_results(engine_url, MyListRequest, prefetch):
+    request = MyListRequest(url=engine_url, results=list(range(5)))
+
+    assert list(request.iter_all(page_size=2, prefetch=prefetch)) == [0, 1, 2, 3, 4]
+
+
+@unittest.mock.patch('requests.Session.request', count_response_mock)
+def test_count_sends_count_request(engine_url, MyListRequest):
+    request = MyListRequest(url=engine_url, results=[])
+
+    assert request.count() == 1
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_count_ignores_pagination(mock, engine_url, MyListRequest):
+    request = MyListRequest(url=engine_url, results=[], first_result=1, max_results=2)
+    request.count()
+
+    assert mock.call_args[1]['url'] == engine_url + '/count'
+    assert mock.call_args[1]['params'] == {}
+
+
+def test_get_all_joins_pages_in_order(engine_url, MyListRequest):
+    request = MyListRequest(url=engine_url, results=list(range(10)))
+    request.count = lambda: 10
+
+    assert request.get_all(page_size=3, max_workers=3) == tuple(range(10))
+    assert sorted(request.calls) == [(0, 3), (3, 3), (6, 3), (9, 1)]
+
+
+def test_get_all_respects_first_and_max_results(engine_url, MyListRequest):
+    request = MyListRequest(url=engine_url, results=list(range(10)), first_result=2, max_results=5)
+    request.count = lambda: 10
+
+    assert request.get_all(page_size=2) == (2, 3, 4, 5, 6)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+import dataclasses
+import weakref
+
+import pytest
+
+import pycamunda.activityinst
+import pycamunda.base
+import pycamunda.externaltask
+import pycamunda.incident
+import pycamunda.processinst
+import pycamunda.task
+import pycamunda.variable
+
+
+@pytest.mark.parametrize('cls', [
+    pycamunda.activityinst.ActivityInstance,
+    pycamunda.externaltask.ExternalTask,
+    pycamunda.incident.Incident,
+    pycamunda.processinst.ProcessInstance,
+    pycamunda.task.Task,
+    pycamunda.variable.Variable,
+    pycamunda.variable.VariableInstance
+])
+def test_slotted_dataclass(cls):
+    instance = cls(**{field.name: None for field in dataclasses.fields(cls)})
+
+    assert not hasattr(instance, '__dict__')
+    assert weakref.ref(instance)() is instance
+    assert cls.__qualname__ == cls.__name__
+
+
+def test_intern():
+    first = pycamunda.base._intern(''.join(['an', 'Id']))
+    second = pycamunda.base._intern(''.join(['an', 'Id']))
+
+    assert first is second
+    assert pycamunda.base._intern(None) is None
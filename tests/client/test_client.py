@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+import http.server
+import threading
+import unittest.mock
+
+import pytest
+
+import pycamunda.client
+
+
+@pytest.fixture
+def cookie_server():
+    received = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            received.append(self.headers.get('Cookie'))
+            self.send_response(200)
+            self.send_header('Set-Cookie', 'JSESSIONID=aSession; Path=/')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/engine-rest', received
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_strips_url():
+    client = pycamunda.client.Client(url='http://localhost/engine-rest/')
+
+    assert client.url == 'http://localhost/engine-rest'
+
+
+def test_client_mounts_bounded_pool():
+    client = pycamunda.client.Client(pool_maxsize=3, pool_block=True)
+    adapter = client.get_adapter('http://localhost/engine-rest')
+
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_block is True
+    assert client.get_adapter('https://localhost/engine-rest') is adapter
+
+
+def test_client_disables_keep_alive():
+    client = pycamunda.client.Client(keep_alive=False)
+
+    assert client.headers['Connection'] == 'close'
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_client_sets_default_timeout(mock):
+    client = pycamunda.client.Client(timeout=5)
+    client.request(method='GET', url='http://localhost/engine-rest')
+
+    assert mock.call_args[1]['timeout'] == 5
+
+    client.request(method='GET', url='http://localhost/engine-rest', timeout=1)
+
+    assert mock.call_args[1]['timeout'] == 1
+
+
+def test_default_client_is_shared():
+    assert pycamunda.client.default_client() is pycamunda.client.default_client()
+    assert isinstance(pycamunda.client.default_client(), pycamunda.client.Client)
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_client_has_connect_and_read_timeout(mock):
+    client = pycamunda.client.Client(connect_timeout=3, read_timeout=30)
+    client.request(method='GET', url='http://localhost/engine-rest')
+
+    assert mock.call_args[1]['timeout'] == (3, 30)
+
+    client.request(method='GET', url='http://localhost/engine-rest', timeout=(None, 90))
+
+    assert mock.call_args[1]['timeout'] == (3, 90)
+
+
+def test_client_rejects_cookies(cookie_server):
+    url, received = cookie_server
+    client = pycamunda.client.Client()
+    client.request(method='GET', url=url)
+    client.request(method='GET', url=url)
+
+    assert received == [None, None]
+    assert not client.cookies
+
+
+def test_client_keeps_cookies(cookie_server):
+    url, received = cookie_server
+    client = pycamunda.client.Client(keep_cookies=True)
+    client.request(method='GET', url=url)
+    client.request(method='GET', url=url)
+
+    assert received == [None, 'JSESSIONID=aSession']
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_client_resolves_relative_urls(mock):
+    client = pycamunda.client.Client(url='http://localhost/engine-rest/')
+    client.request(method='GET', url='/version')
+    client.request(method='GET', url='http://otherhost/engine-rest/version')
+
+    assert [call[1]['url'] for call in mock.call_args_list] == [
+        'http://localhost/engine-rest/version', 'http://otherhost/engine-rest/version'
+    ]
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import pycamunda.codec
+
+
+@pytest.fixture(autouse=True)
+def reset_codec():
+    codec = pycamunda.codec.get_codec()
+    yield
+    pycamunda.codec.set_codec(codec)
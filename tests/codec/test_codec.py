@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+import requests
+
+import pycamunda.client
+import pycamunda.codec
+
+
+def test_get_codec_prefers_installed_codec():
+    pytest.importorskip('orjson')
+
+    assert pycamunda.codec.set_codec().name == 'orjson'
+
+
+def test_set_codec_by_name():
+    codec = pycamunda.codec.set_codec('json')
+
+    assert pycamunda.codec.get_codec() is codec
+    assert codec.dumps({'a': [1, True]}) == b'{"a": [1, true]}'
+    assert codec.loads(b'{"a": [1, true]}') == {'a': [1, True]}
+
+
+def test_set_codec_instance():
+    codec = pycamunda.codec.Codec(name='custom', dumps=lambda obj: b'{}', loads=lambda data: {})
+    pycamunda.codec.set_codec(codec)
+
+    assert pycamunda.codec.get_codec() is codec
+
+
+def test_set_codec_raises_value_error():
+    with pytest.raises(ValueError):
+        pycamunda.codec.set_codec('notACodec')
+
+
+@pytest.mark.parametrize('name', ['json', 'orjson', 'ujson'])
+def test_codec_raises_json_decode_error(name):
+    pytest.importorskip(name)
+    codec = pycamunda.codec.set_codec(name)
+
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'not json')
+
+
+def test_client_encodes_body_with_codec(engine_url):
+    pycamunda.codec.set_codec(
+        pycamunda.codec.Codec(name='custom', dumps=lambda obj: b'{"encoded": 1}', loads=json.loads)
+    )
+    request = requests.Request(method='POST', url=engine_url, json={'key': 'value'})
+    prepared = pycamunda.client.Client().prepare_request(request)
+
+    assert prepared.body == b'{"encoded": 1}'
+    assert prepared.headers['Content-Type'] == 'application/json'
+
+
+def test_response_decodes_with_codec():
+    pycamunda.codec.set_codec(
+        pycamunda.codec.Codec(name='custom', dumps=json.dumps, loads=lambda data: {'decoded': data})
+    )
+    response = pycamunda.client.Response()
+    response._content = b'{}'
+
+    assert response.json() == {'decoded': b'{}'}
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import unittest.mock
+
+import pytest
+
+import pycamunda
+import pycamunda.deadline
+
+
+def test_remaining_without_deadline():
+    assert pycamunda.deadline.remaining() is None
+    assert pycamunda.deadline.check() is None
+
+
+@unittest.mock.patch('time.monotonic', return_value=100.0)
+def test_deadline_sets_remaining_time(monotonic):
+    with pycamunda.deadline.deadline(5):
+        assert pycamunda.deadline.remaining() == 5
+        monotonic.return_value = 103.0
+        assert pycamunda.deadline.check() == 2
+
+    assert pycamunda.deadline.remaining() is None
+
+
+@unittest.mock.patch('time.monotonic', return_value=100.0)
+def test_nested_deadline_only_shortens(monotonic):
+    with pycamunda.deadline.deadline(5):
+        with pycamunda.deadline.deadline(10):
+            assert pycamunda.deadline.remaining() == 5
+        with pycamunda.deadline.deadline(1):
+            assert pycamunda.deadline.remaining() == 1
+        assert pycamunda.deadline.remaining() == 5
+
+
+@unittest.mock.patch('time.monotonic', return_value=100.0)
+def test_check_raises_after_deadline(monotonic):
+    with pycamunda.deadline.deadline(5):
+        monotonic.return_value = 105.0
+        with pytest.raises(pycamunda.DeadlineExceeded):
+            pycamunda.deadline.check()
@@ -16,6 +16,13 @@ def test_count_params(engine_url, getlist_input, getlist_output):
     assert count_tasks.body_parameters() == {}
 
 
+@pytest.mark.parametrize('method', ['iter_pages', 'iter_all', 'count', 'get_all'])
+def test_count_is_not_paginated(engine_url, method):
+    count_tasks = pycamunda.externaltask.Count(url=engine_url)
+
+    assert not hasattr(count_tasks, method)
+
+
 @unittest.mock.patch('requests.Session.request')
 def test_count_calls_requests(mock, engine_url):
     count_tasks = pycamunda.externaltask.Count(url=engine_url)
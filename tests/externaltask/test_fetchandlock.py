@@ -72,3 +72,52 @@ def test_fetchandlock_returns_tuple(engine_url):
 
     assert isinstance(tasks, tuple)
     assert all(isinstance(task, pycamunda.externaltask.ExternalTask) for task in tasks)
+
+
+def test_fetchandlock_add_topic_filters(engine_url):
+    fetch_and_lock = pycamunda.externaltask.FetchAndLock(
+        url=engine_url, worker_id='1', max_tasks=10
+    )
+    fetch_and_lock.add_topic(
+        name='aTopic',
+        lock_duration=10000,
+        business_key='aBusinessKey',
+        process_definition_id='aProcessDefinitionId',
+        process_definition_id_in=['aProcessDefinitionId'],
+        process_definition_key='aProcessDefinitionKey',
+        process_definition_key_in=['aProcessDefinitionKey'],
+        tenant_id_in=['aTenantId'],
+        without_tenant_id=False
+    )
+
+    assert fetch_and_lock.body_parameters()['topics'] == [{
+        'topicName': 'aTopic',
+        'lockDuration': 10000,
+        'deserializeValues': False,
+        'businessKey': 'aBusinessKey',
+        'processDefinitionId': 'aProcessDefinitionId',
+        'processDefinitionIdIn': ['aProcessDefinitionId'],
+        'processDefinitionKey': 'aProcessDefinitionKey',
+        'processDefinitionKeyIn': ['aProcessDefinitionKey'],
+        'tenantIdIn': ['aTenantId'],
+        'withoutTenantId': False
+    }]
+
+
+def test_fetchandlock_read_timeout_covers_long_polling(engine_url):
+    fetch_and_lock = pycamunda.externaltask.FetchAndLock(
+        url=engine_url, worker_id='1', max_tasks=10, async_response_timeout=30000
+    )
+
+    assert fetch_and_lock._timeout(remaining=None) == (None, 35.0)
+
+    fetch_and_lock.timeout = 5
+    assert fetch_and_lock._timeout(remaining=None) == 5
+
+
+def test_fetchandlock_without_long_polling_uses_client_timeout(engine_url):
+    fetch_and_lock = pycamunda.externaltask.FetchAndLock(
+        url=engine_url, worker_id='1', max_tasks=10
+    )
+
+    assert fetch_and_lock._timeout(remaining=None) is None
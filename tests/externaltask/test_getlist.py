@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import threading
 import unittest.mock
 
 import pytest
@@ -52,3 +53,23 @@ def test_getlist_returns_tuple(engine_url):
     tasks = get_tasks()
 
     assert isinstance(tasks, tuple)
+
+
+def test_getlist_requests_error_details_concurrently(engine_url, my_externaltask_json):
+    task_json = {**my_externaltask_json, 'errorDetails': None}
+    threads = set()
+
+    def request_mock(self, method, url, **kwargs):
+        response = unittest.mock.MagicMock()
+        if url.endswith('/errorDetails'):
+            threads.add(threading.get_ident())
+            response.text = url.split('/')[-2]
+        else:
+            response.json.return_value = [{**task_json, 'id': str(i)} for i in range(20)]
+        return response
+
+    with unittest.mock.patch('requests.Session.request', request_mock):
+        external_tasks = pycamunda.externaltask.GetList(url=engine_url)()
+
+    assert [task.error_details for task in external_tasks] == [str(i) for i in range(20)]
+    assert threading.get_ident() not in threads
@@ -53,7 +53,7 @@ def test_execute_raises_pycamunda_exception(engine_url):
 @unittest.mock.patch('requests.Session.request', not_ok_response_mock)
 @unittest.mock.patch('pycamunda.task.Task')
 @unittest.mock.patch('pycamunda.base._raise_for_status')
-def test_execute_raises_for_status(mock, engine_url):
+def test_execute_raises_for_status(mock, task_mock, engine_url):
     execute_filter = pycamunda.filter.Execute(url=engine_url, id_='anId')
     execute_filter()
 
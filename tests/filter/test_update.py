@@ -43,7 +43,7 @@ def test_update_raises_pycamunda_exception(engine_url):
 @unittest.mock.patch('requests.Session.request', not_ok_response_mock)
 @unittest.mock.patch('pycamunda.filter.Filter')
 @unittest.mock.patch('pycamunda.base._raise_for_status')
-def test_update_raises_for_status(mock, engine_url):
+def test_update_raises_for_status(mock, filter_mock, engine_url):
     update_filter = pycamunda.filter.Update(
         url=engine_url, id_='anId', name='aName', owner='anOwner'
     )
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+
+import pytest
+
+import pycamunda.limit
+
+
+def test_concurrencylimit_limits_inflight_requests():
+    limit = pycamunda.limit.ConcurrencyLimit(initial=2)
+
+    assert limit.acquire(timeout=0)
+    assert limit.acquire(timeout=0)
+    assert not limit.acquire(timeout=0)
+    assert limit.inflight == 2
+
+
+def test_concurrencylimit_release_wakes_waiters():
+    limit = pycamunda.limit.ConcurrencyLimit(initial=1)
+    limit.acquire()
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(limit.acquire(timeout=5)), daemon=True)
+    thread.start()
+    limit.release(started=0.0, measure=False)
+    thread.join(5)
+
+    assert acquired == [True]
+
+
+def test_concurrencylimit_aacquire():
+    limit = pycamunda.limit.ConcurrencyLimit(initial=1)
+
+    async def main():
+        assert await limit.aacquire()
+        assert not await limit.aacquire(timeout=0.01)
+        waiter = asyncio.ensure_future(limit.aacquire(timeout=5))
+        await asyncio.sleep(0.01)
+        limit.release(started=0.0, measure=False)
+        return await waiter
+
+    assert asyncio.run(main())
+    assert limit.inflight == 1
+
+
+def test_concurrencylimit_increases_on_fast_requests(monkeypatch):
+    limit = pycamunda.limit.ConcurrencyLimit(initial=2)
+    monkeypatch.setattr('time.monotonic', lambda: 100.1)
+    for _ in range(4):
+        limit.acquire()
+        limit.release(started=100.0)
+
+    assert limit.limit > 2
+
+
+def test_concurrencylimit_does_not_increase_when_idle(monkeypatch):
+    limit = pycamunda.limit.ConcurrencyLimit(initial=10)
+    monkeypatch.setattr('time.monotonic', lambda: 100.1)
+    for _ in range(4):
+        limit.acquire()
+        limit.release(started=100.0)
+
+    assert limit.limit == 10
+
+
+@pytest.mark.parametrize('failure, latency', [(True, 0.1), (False, 1.0)])
+def test_concurrencylimit_decreases(monkeypatch, failure, latency):
+    limit = pycamunda.limit.ConcurrencyLimit(initial=10, backoff=0.5)
+    monkeypatch.setattr('time.monotonic', lambda: 100.1)
+    limit.acquire()
+    limit.release(started=100.0)
+    monkeypatch.setattr('time.monotonic', lambda: 100.0 + latency)
+    limit.acquire()
+    limit.release(started=100.0, failure=failure)
+
+    assert limit.limit == 5
+
+
+def test_concurrencylimit_decreases_once_per_window(monkeypatch):
+    limit = pycamunda.limit.ConcurrencyLimit(initial=10, backoff=0.5, min_limit=2)
+    monkeypatch.setattr('time.monotonic', lambda: 101.0)
+    for _ in range(3):
+        limit.acquire()
+    for _ in range(3):
+        limit.release(started=100.0, failure=True)
+
+    assert limit.limit == 5
+    monkeypatch.setattr('time.monotonic', lambda: 102.0)
+    for _ in range(2):
+        limit.acquire()
+    for _ in range(2):
+        limit.release(started=101.5, failure=True)
+
+    assert limit.limit == 2.5
+
+
+def test_concurrencylimit_respects_min_limit(monkeypatch):
+    limit = pycamunda.limit.ConcurrencyLimit(initial=2, min_limit=2, backoff=0.5)
+    monkeypatch.setattr('time.monotonic', lambda: 101.0)
+    limit.acquire()
+    limit.release(started=100.0, failure=True)
+
+    assert limit.limit == 2
+
+
+def test_concurrencylimit_compares_latencies_per_kind(monkeypatch):
+    limit = pycamunda.limit.ConcurrencyLimit(initial=50)
+    now = 100.0
+    monkeypatch.setattr('time.monotonic', lambda: now)
+    for index in range(200):
+        now += 1.0
+        slow = index % 10 == 0
+        limit.acquire()
+        limit.release(
+            started=now - (0.2 if slow else 0.002), kind='GetList' if slow else 'Complete'
+        )
+
+    assert limit.limit == 50
+
+
+def test_concurrencylimit_decreases_on_slow_requests_of_a_kind(monkeypatch):
+    limit = pycamunda.limit.ConcurrencyLimit(initial=50, backoff=0.5)
+    monkeypatch.setattr('time.monotonic', lambda: 101.0)
+    limit.acquire()
+    limit.release(started=100.998, kind='Complete')
+    limit.acquire()
+    limit.release(started=100.8, kind='GetList')
+
+    assert limit.limit == 50
+    limit.acquire()
+    limit.release(started=100.9, kind='Complete')
+
+    assert limit.limit == 25
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import unittest.mock
+
+import pytest
+
+import pycamunda.limit
+
+
+@pytest.mark.parametrize('method, path, family', [
+    ('POST', '/external-task/fetchAndLock', 'external-task'),
+    ('POST', '/external-task/anId/complete', 'external-task'),
+    ('GET', '/external-task', 'external-task'),
+    ('POST', '/message', 'message'),
+    ('POST', '/process-definition/key/aKey/start', 'process-instance-start'),
+    ('POST', '/process-definition/anId/submit-form', 'process-instance-start'),
+    ('GET', '/process-definition/anId/start', None),
+    ('GET', '/process-definition/anId', None),
+    ('GET', '/external-task-other', None),
+    ('POST', '/message-other', None)
+])
+def test_family(engine_url, method, path, family):
+    assert pycamunda.limit.family(method, engine_url + path) == family
+
+
+@unittest.mock.patch('time.monotonic', return_value=100.0)
+def test_ratelimit_allows_burst(monotonic):
+    limit = pycamunda.limit.RateLimit(rate=2, burst=3)
+
+    assert [limit.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limit.reserve() == 0.5
+    assert limit.reserve() == 1.0
+
+
+@unittest.mock.patch('time.monotonic', return_value=100.0)
+def test_ratelimit_refills(monotonic):
+    limit = pycamunda.limit.RateLimit(rate=2)
+    limit.reserve()
+    limit.reserve()
+    monotonic.return_value = 100.5
+
+    assert limit.reserve() == 0.0
+    assert limit.reserve() == 0.5
+
+
+@unittest.mock.patch('time.monotonic', return_value=100.0)
+def test_ratelimit_respects_max_delay(monotonic):
+    limit = pycamunda.limit.RateLimit(rate=1)
+    limit.reserve()
+
+    assert limit.reserve(max_delay=0.5) is None
+    assert limit.reserve(max_delay=1.0) == 1.0
+
+
+def test_ratelimiter_limits_families(engine_url):
+    limiter = pycamunda.limit.RateLimiter({'message': pycamunda.limit.RateLimit(rate=1)})
+
+    assert limiter.reserve('POST', engine_url + '/message') == 0.0
+    assert limiter.reserve('POST', engine_url + '/message') > 0.0
+    assert limiter.reserve('POST', engine_url + '/external-task/fetchAndLock') == 0.0
+
+
+def test_ratelimiter_rejects_unknown_families():
+    with pytest.raises(ValueError):
+        pycamunda.limit.RateLimiter({'messages': pycamunda.limit.RateLimit(rate=1)})
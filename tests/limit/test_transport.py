@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import unittest.mock
+
+import pytest
+import requests
+
+import pycamunda
+import pycamunda.client
+import pycamunda.deadline
+import pycamunda.externaltask
+import pycamunda.limit
+import pycamunda.message
+import pycamunda.version
+from tests.mock import status_response_mock
+
+
+@unittest.mock.patch('time.sleep')
+@unittest.mock.patch('requests.Session.request')
+def test_requests_wait_for_rate_limit(mock, sleep, engine_url):
+    mock.return_value = status_response_mock(204)
+    client = pycamunda.client.Client(rate_limiter=pycamunda.limit.RateLimiter(
+        {'message': pycamunda.limit.RateLimit(rate=1)}
+    ))
+    for _ in range(2):
+        correlate = pycamunda.message.CorrelateSingle(url=engine_url, message_name='aMessage')
+        correlate.session = client
+        correlate()
+
+    assert mock.call_count == 2
+    assert sleep.call_count == 1
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_rate_limit_respects_deadline(mock, engine_url):
+    mock.return_value = status_response_mock(204)
+    client = pycamunda.client.Client(rate_limiter=pycamunda.limit.RateLimiter(
+        {'message': pycamunda.limit.RateLimit(rate=0.1)}
+    ))
+    correlate = pycamunda.message.CorrelateSingle(url=engine_url, message_name='aMessage')
+    correlate.session = client
+    correlate()
+
+    with pycamunda.deadline.deadline(1):
+        with pytest.raises(pycamunda.DeadlineExceeded):
+            correlate()
+    assert mock.call_count == 1
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_concurrency_limit_adapts_to_responses(mock, engine_url):
+    mock.side_effect = [status_response_mock(200, b'{"version": "7"}'), status_response_mock(503)]
+    concurrency_limit = pycamunda.limit.ConcurrencyLimit(initial=4, backoff=0.5)
+    get_version = pycamunda.version.Get(url=engine_url)
+    get_version.session = pycamunda.client.Client(concurrency_limit=concurrency_limit)
+    get_version()
+    with pytest.raises(pycamunda.NoSuccess):
+        get_version()
+
+    assert concurrency_limit.limit == 2
+    assert concurrency_limit.inflight == 0
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_concurrency_limit_is_released_after_errors(mock, engine_url):
+    mock.side_effect = requests.exceptions.ConnectionError()
+    concurrency_limit = pycamunda.limit.ConcurrencyLimit(initial=1)
+    get_version = pycamunda.version.Get(url=engine_url)
+    get_version.session = pycamunda.client.Client(concurrency_limit=concurrency_limit)
+    with pytest.raises(pycamunda.PyCamundaException):
+        get_version()
+
+    assert concurrency_limit.inflight == 0
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_concurrency_limit_blocks_requests(mock, engine_url):
+    started = threading.Event()
+    release = threading.Event()
+
+    def request(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return status_response_mock(200, b'{"version": "7"}')
+
+    mock.side_effect = request
+    client = pycamunda.client.Client(
+        concurrency_limit=pycamunda.limit.ConcurrencyLimit(initial=1)
+    )
+    get_version = pycamunda.version.Get(url=engine_url)
+    get_version.session = client
+    thread = threading.Thread(target=get_version, daemon=True)
+    thread.start()
+    assert started.wait(5)
+    try:
+        with pycamunda.deadline.deadline(0.05):
+            with pytest.raises(pycamunda.DeadlineExceeded):
+                get_version()
+    finally:
+        release.set()
+        thread.join(5)
+    assert mock.call_count == 1
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_long_polling_bypasses_concurrency_limit(mock, engine_url):
+    mock.return_value = status_response_mock(200, b'[]')
+    concurrency_limit = pycamunda.limit.ConcurrencyLimit(initial=1)
+    concurrency_limit.acquire()
+    fetch_and_lock = pycamunda.externaltask.FetchAndLock(
+        url=engine_url, worker_id='aWorkerId', max_tasks=1, async_response_timeout=10000
+    )
+    fetch_and_lock.session = pycamunda.client.Client(concurrency_limit=concurrency_limit)
+
+    assert fetch_and_lock() == ()
+    assert concurrency_limit.limit == 1
+
+
+def test_acall_uses_limits(engine_url):
+    class AsyncClient:
+        retry = None
+        circuit_breaker = None
+        rate_limiter = None
+        concurrency_limit = pycamunda.limit.ConcurrencyLimit(initial=2, backoff=0.5)
+
+        async def request(self, **kwargs):
+            assert self.concurrency_limit.inflight == 1
+            return status_response_mock(429)
+
+    async_client = AsyncClient()
+    get_version = pycamunda.version.Get(url=engine_url)
+
+    with pytest.raises(pycamunda.NoSuccess):
+        asyncio.run(get_version.acall(async_client))
+    assert async_client.concurrency_limit.inflight == 0
+    assert async_client.concurrency_limit.limit == 1
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_concurrency_limit_compares_latencies_per_request_class(mock, engine_url):
+    mock.return_value = status_response_mock(200, b'{"version": "7"}')
+    concurrency_limit = pycamunda.limit.ConcurrencyLimit()
+    get_version = pycamunda.version.Get(url=engine_url)
+    get_version.session = pycamunda.client.Client(concurrency_limit=concurrency_limit)
+    get_version()
+
+    assert list(concurrency_limit._min_latencies) == ['pycamunda.version.Get']
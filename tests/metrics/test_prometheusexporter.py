@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+import requests
+
+import pycamunda.metrics
+
+
+def test_prometheusexporter_serves_exposition():
+    registry = pycamunda.metrics.Registry()
+    registry.increment('fetches_total')
+    exporter = pycamunda.metrics.PrometheusExporter(registry, port=0, host='127.0.0.1')
+    exporter.start()
+    try:
+        response = requests.get(f'http://127.0.0.1:{exporter.port}/metrics', timeout=5)
+    finally:
+        exporter.stop()
+
+    assert response.status_code == 200
+    assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+    assert response.text == registry.exposition()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+import pycamunda.metrics
+
+
+def test_metricssink_discards_metrics():
+    sink = pycamunda.metrics.MetricsSink()
+    sink.increment('fetches_total')
+    sink.observe('fetch_duration_seconds', 1.0)
+
+
+def test_registry_counts():
+    registry = pycamunda.metrics.Registry()
+    registry.increment('fetched_tasks_total', 2, {'topic': 'aTopic'})
+    registry.increment('fetched_tasks_total', labels={'topic': 'aTopic'})
+
+    assert registry.value('fetched_tasks_total', {'topic': 'aTopic'}) == 3
+    assert registry.value('fetched_tasks_total', {'topic': 'anotherTopic'}) == 0
+
+
+def test_registry_observes():
+    registry = pycamunda.metrics.Registry(buckets=[1, 2])
+    registry.observe('handler_duration_seconds', 0.5)
+    registry.observe('handler_duration_seconds', 3)
+
+    assert registry.count('handler_duration_seconds') == 2
+    assert registry.count('fetch_duration_seconds') == 0
+
+
+def test_registry_exposition():
+    registry = pycamunda.metrics.Registry(buckets=[1, 2])
+    registry.increment('fetches_total')
+    registry.increment('fetched_tasks_total', 2, {'topic': 'a"Topic'})
+    registry.observe('handler_duration_seconds', 0.5, {'topic': 'aTopic'})
+    registry.observe('handler_duration_seconds', 1.5, {'topic': 'aTopic'})
+    registry.observe('handler_duration_seconds', 3, {'topic': 'aTopic'})
+
+    assert registry.exposition() == (
+        '# HELP pycamunda_worker_fetched_tasks_total Number of fetched external tasks.\n'
+        '# TYPE pycamunda_worker_fetched_tasks_total counter\n'
+        'pycamunda_worker_fetched_tasks_total{topic="a\\"Topic"} 2.0\n'
+        '# HELP pycamunda_worker_fetches_total Number of FetchAndLock round trips.\n'
+        '# TYPE pycamunda_worker_fetches_total counter\n'
+        'pycamunda_worker_fetches_total 1.0\n'
+        '# HELP pycamunda_worker_handler_duration_seconds Duration of handlers.\n'
+        '# TYPE pycamunda_worker_handler_duration_seconds histogram\n'
+        'pycamunda_worker_handler_duration_seconds_bucket{topic="aTopic",le="1.0"} 1\n'
+        'pycamunda_worker_handler_duration_seconds_bucket{topic="aTopic",le="2.0"} 2\n'
+        'pycamunda_worker_handler_duration_seconds_bucket{topic="aTopic",le="+Inf"} 3\n'
+        'pycamunda_worker_handler_duration_seconds_sum{topic="aTopic"} 5.0\n'
+        'pycamunda_worker_handler_duration_seconds_count{topic="aTopic"} 3\n'
+    )
+
+
+def test_registry_exposition_without_namespace():
+    registry = pycamunda.metrics.Registry(namespace='')
+    registry.increment('custom_total')
+
+    assert registry.exposition() == '# TYPE custom_total counter\ncustom_total 1.0\n'
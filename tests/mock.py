@@ -84,3 +84,11 @@ def fetch_response_mock(*args, **kwargs):
             return {'enableTelemetry': True}
 
     return Response()
+
+
+def status_response_mock(status_code=200, content=b'{}', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
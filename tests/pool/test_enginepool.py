@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest.mock
+
+import pytest
+import requests
+
+import pycamunda.pool
+import pycamunda.retry
+import pycamunda.version
+from tests.mock import status_response_mock
+
+URLS = ['http://node1/engine-rest', 'http://node2/engine-rest']
+VERSION = b'{"version": "7.15.0"}'
+
+
+@pytest.fixture
+def sent():
+    urls = []
+
+    def request(session, method, url, **kwargs):
+        urls.append(url)
+        return status_response_mock(content=VERSION)
+
+    with unittest.mock.patch('requests.Session.request', request):
+        yield urls
+
+
+def send(pool, count=1):
+    for _ in range(count):
+        get_version = pycamunda.version.Get(url=pool.url)
+        get_version.session = pool
+        get_version()
+
+
+def test_enginepool_rejects_unknown_balancing():
+    with pytest.raises(ValueError):
+        pycamunda.pool.EnginePool(urls=URLS, balancing='random')
+
+
+def test_enginepool_round_robin(sent):
+    pool = pycamunda.pool.EnginePool(urls=URLS, balancing='round_robin')
+    send(pool, count=4)
+
+    assert sent == [
+        'http://node1/engine-rest/version',
+        'http://node2/engine-rest/version',
+        'http://node1/engine-rest/version',
+        'http://node2/engine-rest/version'
+    ]
+
+
+def test_enginepool_routes_urls_of_any_node(sent):
+    pool = pycamunda.pool.EnginePool(urls=URLS, balancing='round_robin')
+    pool.request('GET', 'http://node2/engine-rest/version')
+    pool.request('GET', 'http://node2/engine-rest/version')
+
+    assert sent == ['http://node1/engine-rest/version', 'http://node2/engine-rest/version']
+
+
+def test_enginepool_keeps_foreign_urls(sent):
+    pool = pycamunda.pool.EnginePool(urls=URLS)
+    pool.request('GET', 'http://node1/engine-rest-other/version')
+    pool.request('GET', 'http://elsewhere/engine-rest/version')
+
+    assert sent == [
+        'http://node1/engine-rest-other/version', 'http://elsewhere/engine-rest/version'
+    ]
+
+
+def test_enginepool_least_outstanding():
+    pool = pycamunda.pool.EnginePool(urls=URLS)
+    pool.nodes[0].outstanding = 2
+    pool.nodes[1].outstanding = 1
+
+    assert all(pool.pick() is pool.nodes[1] for _ in range(4))
+
+
+def test_enginepool_counts_outstanding_requests():
+    pool = pycamunda.pool.EnginePool(urls=URLS)
+    started = threading.Event()
+    release = threading.Event()
+
+    def request(session, method, url, **kwargs):
+        started.set()
+        release.wait(5)
+        return status_response_mock(content=VERSION)
+
+    with unittest.mock.patch('requests.Session.request', request):
+        thread = threading.Thread(target=send, args=(pool,), daemon=True)
+        thread.start()
+        assert started.wait(5)
+        assert sorted(node.outstanding for node in pool.nodes) == [0, 1]
+        release.set()
+        thread.join(5)
+
+    assert [node.outstanding for node in pool.nodes] == [0, 0]
+
+
+@unittest.mock.patch('time.monotonic', return_value=100.0)
+def test_enginepool_ejects_failing_nodes(monotonic):
+    pool = pycamunda.pool.EnginePool(
+        urls=URLS, balancing='round_robin', max_failures=2, ejection_time=10
+    )
+    sent = []
+
+    def request(session, method, url, **kwargs):
+        sent.append(url)
+        if url.startswith(URLS[0]):
+            raise requests.exceptions.ConnectionError()
+        return status_response_mock(content=VERSION)
+
+    with unittest.mock.patch('requests.Session.request', request):
+        for _ in range(4):
+            try:
+                send(pool)
+            except pycamunda.PyCamundaException:
+                pass
+        assert not pool.nodes[0].is_available(100.0)
+        sent.clear()
+        send(pool, count=2)
+        assert all(url.startswith(URLS[1]) for url in sent)
+
+        monotonic.return_value = 111.0
+        sent.clear()
+        for _ in range(2):
+            try:
+                send(pool)
+            except pycamunda.PyCamundaException:
+                pass
+        assert sorted(url.startswith(URLS[0]) for url in sent) == [False, True]
+
+
+@unittest.mock.patch('time.monotonic', return_value=100.0)
+def test_enginepool_uses_all_nodes_if_all_are_ejected(monotonic, sent):
+    pool = pycamunda.pool.EnginePool(urls=URLS, balancing='round_robin')
+    for node in pool.nodes:
+        node.ejected_until = 200.0
+    send(pool, count=2)
+
+    assert len(sent) == 2
+
+
+def test_enginepool_check_health():
+    pool = pycamunda.pool.EnginePool(urls=URLS)
+    pool.nodes[1].ejected_until = float('inf')
+
+    def request(session, method, url, **kwargs):
+        if url.startswith(URLS[0]):
+            raise requests.exceptions.ConnectionError()
+        return status_response_mock(content=VERSION)
+
+    with unittest.mock.patch('requests.Session.request', request):
+        pool.check_health()
+
+    assert pool.nodes[0].ejected_until > 0
+    assert pool.nodes[1].ejected_until == 0
+
+
+def test_enginepool_runs_health_checks(sent):
+    pool = pycamunda.pool.EnginePool(urls=URLS, health_interval=0.01)
+    pool.start()
+    try:
+        for _ in range(500):
+            if len(sent) >= 4:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        pool.close()
+
+    assert len(sent) >= 4
+    assert pool._thread is None
+
+
+def test_enginepool_has_a_circuit_per_node():
+    pool = pycamunda.pool.EnginePool(
+        urls=URLS,
+        balancing='round_robin',
+        max_failures=100,
+        circuit_breaker=pycamunda.retry.CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    )
+    sent = []
+
+    def request(session, method, url, **kwargs):
+        sent.append(url)
+        if url.startswith(URLS[0]):
+            raise requests.exceptions.ConnectionError()
+        return status_response_mock(content=VERSION)
+
+    with unittest.mock.patch('requests.Session.request', request):
+        for _ in range(4):
+            try:
+                send(pool)
+            except pycamunda.PyCamundaException:
+                pass
+        assert pool.node_circuit_breaker.state(URLS[0]) == 'open'
+        assert pool.node_circuit_breaker.state(URLS[1]) == 'closed'
+        sent.clear()
+        send(pool, count=4)
+
+    assert all(url.startswith(URLS[1]) for url in sent)
+
+
+def test_enginepool_raises_if_all_circuits_are_open(sent):
+    circuit_breaker = pycamunda.retry.CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    pool = pycamunda.pool.EnginePool(urls=URLS, circuit_breaker=circuit_breaker)
+    for url in URLS:
+        circuit_breaker.record(url, success=False)
+
+    with pytest.raises(pycamunda.CircuitOpen):
+        send(pool)
+    assert sent == []
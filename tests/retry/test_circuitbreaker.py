@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import unittest.mock
+
+import pytest
+
+import pycamunda
+import pycamunda.retry
+
+URL = 'http://localhost/engine-rest/process-definition'
+
+
+def test_circuitbreaker_opens_after_consecutive_failures():
+    breaker = pycamunda.retry.CircuitBreaker(failure_threshold=2)
+    breaker.record(URL, success=False)
+    breaker.allow(URL)
+    breaker.record(URL, success=False)
+
+    assert breaker.state(URL) == 'open'
+    with pytest.raises(pycamunda.CircuitOpen):
+        breaker.allow(URL)
+
+
+def test_circuitbreaker_resets_on_success():
+    breaker = pycamunda.retry.CircuitBreaker(failure_threshold=2)
+    breaker.record(URL, success=False)
+    breaker.record(URL, success=True)
+    breaker.record(URL, success=False)
+
+    assert breaker.state(URL) == 'closed'
+
+
+def test_circuitbreaker_separates_engines():
+    breaker = pycamunda.retry.CircuitBreaker(failure_threshold=1)
+    breaker.record(URL, success=False)
+
+    breaker.allow('http://anotherhost/engine-rest/process-definition')
+    assert breaker.state('http://localhost') == 'open'
+
+
+@unittest.mock.patch('time.monotonic')
+def test_circuitbreaker_lets_single_trial_through(monotonic):
+    monotonic.return_value = 100.0
+    breaker = pycamunda.retry.CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    breaker.record(URL, success=False)
+    monotonic.return_value = 111.0
+    breaker.allow(URL)
+
+    assert breaker.state(URL) == 'half-open'
+    with pytest.raises(pycamunda.CircuitOpen):
+        breaker.allow(URL)
+
+    breaker.record(URL, success=True)
+    breaker.allow(URL)
+    assert breaker.state(URL) == 'closed'
+
+
+@unittest.mock.patch('time.monotonic')
+def test_circuitbreaker_reopens_after_failed_trial(monotonic):
+    monotonic.return_value = 100.0
+    breaker = pycamunda.retry.CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    breaker.record(URL, success=False)
+    monotonic.return_value = 111.0
+    breaker.allow(URL)
+    breaker.record(URL, success=False)
+
+    assert breaker.state(URL) == 'open'
+    with pytest.raises(pycamunda.CircuitOpen):
+        breaker.allow(URL)
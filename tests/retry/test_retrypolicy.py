@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import unittest.mock
+
+import pytest
+import requests
+
+import pycamunda.retry
+from tests.mock import status_response_mock
+
+
+@pytest.mark.parametrize('method, safe, retryable', [
+    ('GET', False, True),
+    ('DELETE', False, True),
+    ('POST', False, False),
+    ('POST', True, True)
+])
+def test_retrypolicy_retries_idempotent_or_safe_requests(method, safe, retryable):
+    policy = pycamunda.retry.RetryPolicy()
+
+    assert policy.is_retryable(method, safe, response=status_response_mock(503)) is retryable
+    assert policy.is_retryable(
+        method, safe, exc=requests.exceptions.ReadTimeout()
+    ) is retryable
+
+
+def test_retrypolicy_retries_only_configured_statuses():
+    policy = pycamunda.retry.RetryPolicy(statuses=[503])
+
+    assert policy.is_retryable('GET', response=status_response_mock(503))
+    assert not policy.is_retryable('GET', response=status_response_mock(500))
+    assert not policy.is_retryable('GET', response=status_response_mock(200))
+
+
+def test_retrypolicy_retries_unsent_posts():
+    policy = pycamunda.retry.RetryPolicy()
+
+    assert policy.is_retryable('POST', exc=requests.exceptions.ConnectTimeout())
+    assert not policy.is_retryable('POST', exc=requests.exceptions.ConnectionError())
+
+
+def test_retrypolicy_backs_off_exponentially():
+    policy = pycamunda.retry.RetryPolicy(backoff=0.1, max_backoff=0.3, jitter=False)
+
+    assert [policy.delay(attempt) for attempt in range(3)] == [0.1, 0.2, 0.3]
+
+
+@unittest.mock.patch('random.uniform', return_value=0.05)
+def test_retrypolicy_jitters(uniform):
+    policy = pycamunda.retry.RetryPolicy(backoff=0.1)
+
+    assert policy.delay(1) == 0.05
+    uniform.assert_called_once_with(0, 0.2)
+
+
+def test_retrypolicy_respects_retry_after():
+    policy = pycamunda.retry.RetryPolicy(max_backoff=5)
+
+    assert policy.delay(0, response=status_response_mock(429, headers={'Retry-After': '2'})) == 2
+    assert policy.delay(0, response=status_response_mock(429, headers={'Retry-After': '20'})) == 5
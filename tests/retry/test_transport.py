@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest.mock
+
+import pytest
+import requests
+
+import pycamunda
+import pycamunda.client
+import pycamunda.deadline
+import pycamunda.externaltask
+import pycamunda.retry
+import pycamunda.version
+from tests.mock import status_response_mock
+
+
+def client(**kwargs):
+    return pycamunda.client.Client(
+        retry=pycamunda.retry.RetryPolicy(backoff=0, jitter=False), **kwargs
+    )
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_get_is_retried(mock, engine_url):
+    mock.side_effect = [
+        status_response_mock(503),
+        requests.exceptions.ConnectionError(),
+        status_response_mock(200, b'{"version": "7"}')
+    ]
+    get_version = pycamunda.version.Get(url=engine_url)
+    get_version.session = client()
+
+    assert get_version() == '7'
+    assert mock.call_count == 3
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_retries_are_limited(mock, engine_url):
+    mock.return_value = status_response_mock(503)
+    get_version = pycamunda.version.Get(url=engine_url)
+    get_version.session = pycamunda.client.Client(
+        retry=pycamunda.retry.RetryPolicy(retries=2, backoff=0)
+    )
+
+    with pytest.raises(pycamunda.NoSuccess):
+        get_version()
+    assert mock.call_count == 3
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_unsafe_post_is_not_retried(mock, engine_url):
+    mock.return_value = status_response_mock(503)
+    complete = pycamunda.externaltask.Complete(url=engine_url, id_='anId', worker_id='aWorkerId')
+    complete.session = client()
+
+    with pytest.raises(pycamunda.NoSuccess):
+        complete()
+    assert mock.call_count == 1
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_safe_post_is_retried(mock, engine_url):
+    mock.side_effect = [status_response_mock(503), status_response_mock(204, b'')]
+    unlock = pycamunda.externaltask.Unlock(url=engine_url, id_='anId')
+    unlock.session = client()
+    unlock()
+
+    assert mock.call_count == 2
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_circuit_breaker_fails_fast(mock, engine_url):
+    mock.side_effect = requests.exceptions.ConnectionError()
+    get_version = pycamunda.version.Get(url=engine_url)
+    get_version.session = pycamunda.client.Client(
+        circuit_breaker=pycamunda.retry.CircuitBreaker(failure_threshold=2)
+    )
+
+    for _ in range(2):
+        with pytest.raises(pycamunda.PyCamundaException):
+            get_version()
+    with pytest.raises(pycamunda.CircuitOpen):
+        get_version()
+    assert mock.call_count == 2
+
+
+def test_acall_is_retried(engine_url):
+    class AsyncClient:
+        retry = pycamunda.retry.RetryPolicy(backoff=0)
+        circuit_breaker = None
+
+        def __init__(self):
+            self.responses = [
+                pycamunda.PyCamundaException(),
+                status_response_mock(503),
+                status_response_mock(200, b'{"version": "7"}')
+            ]
+
+        async def request(self, **kwargs):
+            result = self.responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+    async_client = AsyncClient()
+    get_version = pycamunda.version.Get(url=engine_url)
+
+    assert asyncio.run(get_version.acall(async_client)) == '7'
+    assert not async_client.responses
+
+
+@unittest.mock.patch('requests.Session.request')
+def test_retries_stop_at_deadline(mock, engine_url):
+    mock.return_value = status_response_mock(503)
+    get_version = pycamunda.version.Get(url=engine_url)
+    get_version.session = pycamunda.client.Client(
+        retry=pycamunda.retry.RetryPolicy(backoff=10, jitter=False)
+    )
+
+    with pycamunda.deadline.deadline(1):
+        with pytest.raises(pycamunda.NoSuccess):
+            get_version()
+    assert mock.call_count == 1
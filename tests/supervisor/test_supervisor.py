@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+import pycamunda.supervisor
+import pycamunda.worker
+
+
+class RecordingWorker(pycamunda.worker.Worker):
+    """Worker that records how it was configured instead of fetching external tasks."""
+
+    def __init__(self, path, crash, block):
+        super().__init__(url='http://localhost/engine-rest', worker_id='aWorkerId')
+        self.path = path
+        self.crash = crash
+        self.block = block
+
+    def run(self):
+        with open(self.path, 'a') as file:
+            file.write(json.dumps({
+                'worker_id': self.worker_id,
+                'topics': sorted(self.topics),
+                'fetch_lock': self.fetch_lock is not None
+            }) + '\n')
+        with open(self.path) as file:
+            starts = len(file.readlines())
+        if self.crash and starts == 1:
+            sys.exit(1)
+        if self.block:
+            self._stopped.wait(10)
+
+
+class LockHoldingWorker(RecordingWorker):
+    """Worker that dies while holding the fetch lock on its first start."""
+
+    def run(self):
+        with open(self.path, 'a') as file:
+            file.write(json.dumps({'acquired': self.fetch_lock.acquire(timeout=5)}) + '\n')
+        if len(records(self.path)) == 1:
+            os._exit(137)
+        self.fetch_lock.release()
+
+
+def make_worker(path, crash=False, block=False, topics=('aTopic',)):
+    worker = RecordingWorker(path=str(path), crash=crash, block=block)
+    for topic in topics:
+        worker.subscribe(topic=topic, handler=lambda task: None, lock_duration=10000)
+    return worker
+
+
+def make_lock_holding_worker(path):
+    worker = LockHoldingWorker(path=path, crash=False, block=False)
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    return worker
+
+
+def records(path):
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+
+def test_shard_topic():
+    worker = make_worker('aPath', topics=('a', 'b', 'c'))
+
+    assert pycamunda.supervisor._shard(worker, index=1, processes=2, shard_by='topic')
+    assert list(worker.topics) == ['b']
+    assert worker.scheduler.fetchable() == ['b']
+
+
+def test_shard_topic_without_topics_left():
+    worker = make_worker('aPath', topics=('a',))
+
+    assert not pycamunda.supervisor._shard(worker, index=1, processes=2, shard_by='topic')
+
+
+@pytest.mark.parametrize('shard_by, attribute', [
+    ('tenant', 'tenant_id_in'), ('process_definition', 'process_definition_key_in')
+])
+def test_shard_values(shard_by, attribute):
+    worker = make_worker('aPath', topics=('a', 'b'))
+
+    assert pycamunda.supervisor._shard(
+        worker, index=0, processes=2, shard_by=shard_by, shard_values=['1', '2', '3']
+    )
+    assert [getattr(topic, attribute) for topic in worker.topics.values()] == [
+        ['1', '3'], ['1', '3']
+    ]
+
+
+def test_shard_values_without_values_left():
+    worker = make_worker('aPath')
+
+    assert not pycamunda.supervisor._shard(
+        worker, index=1, processes=2, shard_by='tenant', shard_values=['1']
+    )
+
+
+def test_supervisor_rejects_unknown_shard_by():
+    with pytest.raises(ValueError):
+        pycamunda.supervisor.Supervisor(factory=make_worker, shard_by='anything')
+
+
+def test_supervisor_requires_shard_values():
+    with pytest.raises(ValueError):
+        pycamunda.supervisor.Supervisor(factory=make_worker, shard_by='tenant')
+
+
+def test_supervisor_limits_polling_only_without_sharding():
+    assert pycamunda.supervisor.Supervisor(factory=make_worker).max_polling == 1
+    assert pycamunda.supervisor.Supervisor(
+        factory=make_worker, shard_by='topic'
+    ).max_polling is None
+
+
+def test_supervisor_restarts_crashed_processes(tmp_path):
+    path = tmp_path / 'records'
+    supervisor = pycamunda.supervisor.Supervisor(
+        factory=functools.partial(make_worker, path, crash=True), processes=1, restart_delay=0
+    )
+    supervisor.run()
+
+    assert [record['worker_id'] for record in records(path)] == ['aWorkerId-0', 'aWorkerId-0']
+
+
+def test_supervisor_shards_topics_between_processes(tmp_path):
+    path = tmp_path / 'records'
+    supervisor = pycamunda.supervisor.Supervisor(
+        factory=functools.partial(make_worker, path, topics=('a', 'b', 'c')),
+        processes=2,
+        shard_by='topic'
+    )
+    supervisor.run()
+
+    assert sorted((record['worker_id'], record['topics']) for record in records(path)) == [
+        ('aWorkerId-0', ['a', 'c']), ('aWorkerId-1', ['b'])
+    ]
+    assert not any(record['fetch_lock'] for record in records(path))
+
+
+def test_supervisor_shares_fetch_lock(tmp_path):
+    path = tmp_path / 'records'
+    supervisor = pycamunda.supervisor.Supervisor(
+        factory=functools.partial(make_worker, path), processes=2
+    )
+    supervisor.run()
+
+    assert [record['fetch_lock'] for record in records(path)] == [True, True]
+
+
+def test_supervisor_stop_stops_workers(tmp_path):
+    path = tmp_path / 'records'
+    supervisor = pycamunda.supervisor.Supervisor(
+        factory=functools.partial(make_worker, path, block=True), processes=2, kill_timeout=5
+    )
+    thread = threading.Thread(target=supervisor.run, daemon=True)
+    thread.start()
+    for _ in range(50):
+        if path.exists() and len(records(path)) == 2:
+            break
+        threading.Event().wait(0.1)
+    supervisor.stop()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert not supervisor._children
+
+
+def test_supervisor_reclaims_fetch_lock_of_crashed_processes(tmp_path):
+    path = tmp_path / 'records'
+    supervisor = pycamunda.supervisor.Supervisor(
+        factory=functools.partial(make_lock_holding_worker, str(path)),
+        processes=1,
+        restart_delay=0
+    )
+    supervisor.run()
+
+    assert records(path) == [{'acquired': True}, {'acquired': True}]
@@ -45,7 +45,7 @@ def test_get_raises_for_status(mock, engine_url):
 
 @unittest.mock.patch('requests.Session.request', unittest.mock.MagicMock())
 @unittest.mock.patch('pycamunda.base.from_isoformat')
-def test_get_returns_task(engine_url):
+def test_get_returns_task(from_isoformat_mock, engine_url):
     get_task = pycamunda.task.Get(url=engine_url, id_='anId')
     task = get_task()
 
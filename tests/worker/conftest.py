@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+
+import pytest
+
+
+def external_task_json(id_, topic_name='aTopic', retries=None, priority=0):
+    return {
+        'activityId': 'anActivityId',
+        'activityInstanceId': 'anActivityInstanceId',
+        'errorMessage': None,
+        'executionId': 'anExecutionId',
+        'id': id_,
+        'processDefinitionId': 'aProcessDefinitionId',
+        'processDefinitionKey': 'aProcessDefinitionKey',
+        'processInstanceId': 'aProcessInstanceId',
+        'tenantId': None,
+        'retries': retries,
+        'workerId': 'aWorkerId',
+        'priority': priority,
+        'topicName': topic_name,
+        'lockExpirationTime': '2000-01-01T01:01:00.000+0000',
+        'variables': {'aVar': {'value': 'aVal', 'type': 'String', 'valueInfo': {}}}
+    }
+
+
+class Response:
+
+    def __init__(self, data=None, ok=True):
+        self.data = data
+        self.ok = ok
+
+    def __bool__(self):
+        return self.ok
+
+    def json(self):
+        return self.data
+
+
+class Engine:
+    """Fake Camunda engine that hands out queued external tasks and records the reports."""
+
+    def __init__(self):
+        self.tasks = []
+        self.fetches = []
+        self.reports = []
+        self.lock = threading.Lock()
+        self.reported = threading.Condition(self.lock)
+
+    def add_tasks(self, *tasks):
+        with self.lock:
+            self.tasks.extend(tasks)
+
+    def request(self, method, url, json=None, **kwargs):
+        return self.respond(url=url, json=json, delay=True)
+
+    def respond(self, url, json, delay):
+        with self.lock:
+            if url.endswith('/fetchAndLock'):
+                self.fetches.append(json)
+                self.reported.notify_all()
+                topics = {topic['topicName'] for topic in json['topics']}
+                fetched = [task for task in self.tasks if task['topicName'] in topics]
+                fetched = fetched[:json['maxTasks']]
+                for task in fetched:
+                    self.tasks.remove(task)
+                if not fetched and delay:
+                    self.reported.wait(0.01)  # emulates long polling
+                return Response(fetched)
+            id_, action = url.split('/')[-2:]
+            self.reports.append((action, id_, json))
+            self.reported.notify_all()
+            return Response()
+
+    def wait_for_fetches(self, count, timeout=5):
+        with self.lock:
+            return self.reported.wait_for(lambda: len(self.fetches) >= count, timeout=timeout)
+
+    def wait_for_reports(self, count, timeout=5):
+        with self.lock:
+            return self.reported.wait_for(lambda: len(self.reports) >= count, timeout=timeout)
+
+
+@pytest.fixture
+def engine():
+    return Engine()
+
+
+class AsyncClient:
+    """Asyncio client that sends the requests to a fake engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def request(self, method, url, json=None, **kwargs):
+        response = self.engine.respond(url=url, json=json, delay=False)
+        if url.endswith('/fetchAndLock') and not response.data:
+            await asyncio.sleep(0.01)  # emulates long polling
+        return response
+
+
+@pytest.fixture
+def async_client(engine):
+    return AsyncClient(engine)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import unittest.mock
+
+import pytest
+
+import pycamunda
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def cpu_bound_handler(task):
+    return {'pid': os.getpid()}
+
+
+def run(worker, until):
+    async def main():
+        task = asyncio.ensure_future(worker.run())
+        while not until():
+            await asyncio.sleep(0.001)
+        worker.stop()
+        await asyncio.wait_for(task, timeout=5)
+
+    asyncio.run(asyncio.wait_for(main(), timeout=30))
+
+
+def test_asyncworker_run_requires_topics(engine_url):
+    worker = pycamunda.worker.AsyncWorker(url=engine_url, worker_id='aWorkerId')
+    with pytest.raises(AssertionError):
+        asyncio.run(worker.run())
+
+
+def test_asyncworker_fetches_subscribed_topics(engine_url, engine, async_client):
+    async def handler(task):
+        pass
+
+    worker = pycamunda.worker.AsyncWorker(
+        url=engine_url, worker_id='aWorkerId', async_response_timeout=5000, client=async_client
+    )
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    run(worker, until=lambda: engine.fetches)
+
+    assert engine.fetches[0] == {
+        'workerId': 'aWorkerId',
+        'maxTasks': 100,
+        'usePriority': False,
+        'asyncResponseTimeout': 5000,
+        'topics': [{'topicName': 'aTopic', 'lockDuration': 10000, 'deserializeValues': False}]
+    }
+
+
+def test_asyncworker_completes_tasks(engine_url, engine, async_client):
+    engine.add_tasks(external_task_json('1'), external_task_json('2'))
+
+    async def handler(task):
+        await asyncio.sleep(0)
+        return {'result': task.variables['aVar'].value}
+
+    worker = pycamunda.worker.AsyncWorker(
+        url=engine_url, worker_id='aWorkerId', client=async_client
+    )
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    run(worker, until=lambda: len(engine.reports) == 2)
+
+    assert sorted(id_ for _, id_, _ in engine.reports) == ['1', '2']
+    for action, _, body in engine.reports:
+        assert action == 'complete'
+        assert body['variables'] == {'result': {'value': 'aVal', 'type': None, 'valueInfo': None}}
+
+
+def test_asyncworker_handles_failure_and_bpmn_error(engine_url, engine, async_client):
+    engine.add_tasks(
+        external_task_json('1', topic_name='aTopic', retries=3),
+        external_task_json('2', topic_name='anotherTopic')
+    )
+
+    async def fail(task):
+        raise ValueError('anErrorMessage')
+
+    async def bpmn_error(task):
+        raise pycamunda.worker.BPMNError('anErrorCode')
+
+    worker = pycamunda.worker.AsyncWorker(
+        url=engine_url, worker_id='aWorkerId', client=async_client
+    )
+    worker.subscribe(topic='aTopic', handler=fail, lock_duration=10000)
+    worker.subscribe(topic='anotherTopic', handler=bpmn_error, lock_duration=10000)
+    run(worker, until=lambda: len(engine.reports) == 2)
+
+    reports = {id_: (action, body) for action, id_, body in engine.reports}
+    assert reports['1'][0] == 'failure'
+    assert reports['1'][1]['errorMessage'] == 'anErrorMessage'
+    assert reports['1'][1]['retries'] == 2
+    assert reports['2'][0] == 'bpmnError'
+    assert reports['2'][1]['errorCode'] == 'anErrorCode'
+
+
+def test_asyncworker_runs_handlers_concurrently(engine_url, engine, async_client):
+    engine.add_tasks(*(external_task_json(str(i)) for i in range(50)))
+    running = []
+    peak = []
+
+    async def handler(task):
+        running.append(task.id_)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(task.id_)
+
+    worker = pycamunda.worker.AsyncWorker(
+        url=engine_url, worker_id='aWorkerId', max_workers=20, client=async_client
+    )
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    run(worker, until=lambda: len(engine.reports) == 50)
+
+    assert max(peak) == 20
+    assert all(fetch['maxTasks'] <= 20 for fetch in engine.fetches)
+
+
+def test_asyncworker_stop_waits_for_running_handlers(engine_url, engine, async_client):
+    engine.add_tasks(external_task_json('1'))
+
+    async def handler(task):
+        await asyncio.sleep(0.05)
+
+    worker = pycamunda.worker.AsyncWorker(
+        url=engine_url, worker_id='aWorkerId', client=async_client
+    )
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    run(worker, until=lambda: worker._running == 1)
+
+    assert [id_ for _, id_, _ in engine.reports] == ['1']
+
+
+def test_asyncworker_keeps_running_after_fetch_error(engine_url, engine, async_client):
+    engine.add_tasks(external_task_json('1'))
+    request = async_client.request
+    calls = []
+
+    async def flaky_request(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise pycamunda.PyCamundaException
+        return await request(**kwargs)
+
+    async def handler(task):
+        pass
+
+    async_client.request = flaky_request
+    worker = pycamunda.worker.AsyncWorker(
+        url=engine_url, worker_id='aWorkerId', fetch_error_timeout=0.01, client=async_client
+    )
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    run(worker, until=lambda: engine.reports)
+
+    assert engine.reports[0][:2] == ('complete', '1')
+
+
+def test_asyncworker_logs_report_errors(engine_url, caplog):
+    worker = pycamunda.worker.AsyncWorker(url=engine_url, worker_id='aWorkerId')
+    request = unittest.mock.MagicMock(id_='anId', _retried=False)
+    request.acall = unittest.mock.AsyncMock(side_effect=pycamunda.NotFound)
+
+    async def report():
+        return await (await worker.report(request))
+
+    assert not asyncio.run(report())
+    assert 'anId' in caplog.text
+
+
+def test_asyncworker_runs_cpu_bound_handlers_in_processes(engine_url, engine, async_client):
+    engine.add_tasks(external_task_json('1'))
+    worker = pycamunda.worker.AsyncWorker(
+        url=engine_url, worker_id='aWorkerId', max_processes=1, client=async_client
+    )
+    worker.subscribe(
+        topic='aTopic', handler=cpu_bound_handler, lock_duration=10000, cpu_bound=True
+    )
+    run(worker, until=lambda: engine.reports)
+
+    action, _, body = engine.reports[0]
+    assert action == 'complete'
+    assert body['variables']['pid']['value'] != os.getpid()
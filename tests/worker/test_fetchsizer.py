@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest.mock
+
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def test_fetchsizer_fills_free_slots_without_observations():
+    sizer = pycamunda.worker.FetchSizer()
+
+    assert sizer.size(
+        max_workers=10, max_tasks=10, running=3, queued=2, lock_duration=10000
+    ) == 5
+
+
+def test_fetchsizer_fetches_in_advance():
+    sizer = pycamunda.worker.FetchSizer()
+    sizer.observe_handler(0.1)
+    sizer.observe_fetch(0.05, fetched=10)
+
+    # 10 workers finishing 100 tasks per second fill 5 tasks during a fetch round trip
+    assert sizer.size(
+        max_workers=10, max_tasks=100, running=10, queued=0, lock_duration=10000
+    ) == 5
+    assert sizer.size(
+        max_workers=10, max_tasks=100, running=10, queued=5, lock_duration=10000
+    ) == 0
+    assert sizer.size(
+        max_workers=10, max_tasks=3, running=5, queued=0, lock_duration=10000
+    ) == 3
+
+
+def test_fetchsizer_respects_lock_budget():
+    sizer = pycamunda.worker.FetchSizer(margin=0)
+    sizer.observe_handler(1)
+    sizer.observe_fetch(10, fetched=1)
+
+    # handlers need 1 second, so only 1 second of the lock duration is left for waiting
+    assert sizer.size(
+        max_workers=2, max_tasks=100, running=2, queued=0, lock_duration=2000
+    ) == 2
+    assert sizer.size(
+        max_workers=2, max_tasks=100, running=1, queued=0, lock_duration=500
+    ) == 1
+
+
+def test_fetchsizer_ignores_empty_fetches():
+    sizer = pycamunda.worker.FetchSizer()
+    sizer.observe_fetch(30, fetched=0)
+
+    assert sizer.fetch_latency is None
+
+
+def test_fetchsizer_averages_observations():
+    sizer = pycamunda.worker.FetchSizer(smoothing=0.5)
+    sizer.observe_handler(1)
+    sizer.observe_handler(2)
+
+    assert sizer.handler_latency == 1.5
+
+
+def test_worker_queues_tasks_fetched_in_advance(engine_url, engine):
+    engine.add_tasks(*(external_task_json(str(i)) for i in range(4)))
+    release = threading.Event()
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', max_workers=1, max_tasks=4
+    )
+    worker.fetch_sizer.observe_handler(0.1)
+    worker.fetch_sizer.observe_fetch(0.3, fetched=1)
+    worker.subscribe(
+        topic='aTopic', handler=lambda task: release.wait(5) and None, lock_duration=10000
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert engine.wait_for_fetches(1)
+        assert engine.fetches[0]['maxTasks'] == 4
+        release.set()
+        assert engine.wait_for_reports(4)
+        worker.stop()
+        thread.join(timeout=5)
+
+    assert sorted(id_ for _, id_, _ in engine.reports) == ['0', '1', '2', '3']
+
+
+def test_worker_without_adaptive_fetch(engine_url, engine):
+    release = threading.Event()
+    engine.add_tasks(*(external_task_json(str(i)) for i in range(4)))
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', max_workers=2, adaptive_fetch=False
+    )
+    worker.fetch_sizer.observe_handler(0.1)
+    worker.fetch_sizer.observe_fetch(0.3, fetched=1)
+    worker.subscribe(
+        topic='aTopic', handler=lambda task: release.wait(5) and None, lock_duration=10000
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert engine.wait_for_fetches(1)
+        release.set()
+        assert engine.wait_for_reports(4)
+        worker.stop()
+        thread.join(timeout=5)
+
+    assert all(fetch['maxTasks'] <= 2 for fetch in engine.fetches)
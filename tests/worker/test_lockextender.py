@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import unittest.mock
+
+import pycamunda
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def test_lockextender_extends_before_expiration(engine_url, engine):
+    extender = pycamunda.worker.LockExtender(
+        url=engine_url, worker_id='aWorkerId', margin=0.5, window=0
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        extender.start()
+        start = time.monotonic()
+        extender.track('anId', lock_duration=200, locked_at=start)
+        assert engine.wait_for_reports(1)
+        elapsed = time.monotonic() - start
+        extender.stop()
+
+    assert 0.09 <= elapsed < 0.2
+    assert engine.reports[0] == (
+        'extendLock', 'anId', {'newDuration': 200, 'workerId': 'aWorkerId'}
+    )
+
+
+def test_lockextender_keeps_extending(engine_url, engine):
+    extender = pycamunda.worker.LockExtender(
+        url=engine_url, worker_id='aWorkerId', margin=0.5, window=0
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        extender.start()
+        extender.track('anId', lock_duration=100)
+        assert engine.wait_for_reports(3)
+        extender.stop()
+
+    assert all(report[:2] == ('extendLock', 'anId') for report in engine.reports)
+
+
+def test_lockextender_coalesces_extensions(engine_url):
+    extended = []
+    extender = pycamunda.worker.LockExtender(
+        url=engine_url, worker_id='aWorkerId', margin=0.5, window=1
+    )
+    extender.extend = lambda id_, lock_duration: extended.append((time.monotonic(), id_)) or True
+    extender.start()
+    now = time.monotonic()
+    extender.track('anId', lock_duration=100, locked_at=now)
+    extender.track('anotherId', lock_duration=1000, locked_at=now)
+    time.sleep(0.08)
+    extender.stop()
+
+    assert sorted(id_ for _, id_ in extended[:2]) == ['anId', 'anotherId']
+    assert abs(extended[0][0] - extended[1][0]) < 0.05
+
+
+def test_lockextender_untrack(engine_url):
+    extend = unittest.mock.MagicMock(return_value=True)
+    extender = pycamunda.worker.LockExtender(
+        url=engine_url, worker_id='aWorkerId', margin=0.5, window=0
+    )
+    extender.extend = extend
+    extender.start()
+    extender.track('anId', lock_duration=100)
+    extender.untrack('anId')
+    time.sleep(0.1)
+    extender.stop()
+
+    assert not extend.called
+
+
+def test_lockextender_stops_tracking_after_failed_extension(engine_url):
+    extend = unittest.mock.MagicMock(return_value=False)
+    extender = pycamunda.worker.LockExtender(
+        url=engine_url, worker_id='aWorkerId', margin=0.9, window=0
+    )
+    extender.extend = extend
+    extender.start()
+    extender.track('anId', lock_duration=100)
+    time.sleep(0.1)
+    extender.stop()
+
+    assert extend.call_count == 1
+
+
+@unittest.mock.patch('requests.Session.request', side_effect=pycamunda.PyCamundaException)
+def test_lockextender_extend_logs_errors(mock, engine_url, caplog):
+    extender = pycamunda.worker.LockExtender(url=engine_url, worker_id='aWorkerId')
+
+    assert not extender.extend('anId', lock_duration=100)
+    assert 'anId' in caplog.text
+
+
+def test_worker_extends_locks_of_running_handlers(engine_url, engine):
+    engine.add_tasks(external_task_json('1'))
+    release = threading.Event()
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(
+        topic='aTopic', handler=lambda task: release.wait(5) and None, lock_duration=100
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert engine.wait_for_reports(2)
+        release.set()
+        assert engine.wait_for_reports(3)
+        worker.stop()
+        thread.join(timeout=5)
+
+    actions = [action for action, _, _ in engine.reports]
+    assert actions[:2] == ['extendLock', 'extendLock']
+    assert 'complete' in actions
+
+
+def test_worker_without_lock_extension(engine_url, engine):
+    engine.add_tasks(external_task_json('1'))
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', extend_locks=False)
+    worker.subscribe(topic='aTopic', handler=lambda task: time.sleep(0.2), lock_duration=100)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert engine.wait_for_reports(1)
+        worker.stop()
+        thread.join(timeout=5)
+
+    assert [action for action, _, _ in engine.reports] == ['complete']
+
+
+def test_asynclockextender_extends_with_client(engine_url, engine, async_client):
+    async def main():
+        extender = pycamunda.worker.AsyncLockExtender(
+            url=engine_url, worker_id='aWorkerId', client=async_client, margin=0.5, window=0
+        )
+        extender.start()
+        extender.track('anId', lock_duration=100)
+        while len(engine.reports) < 2:
+            await asyncio.sleep(0.001)
+        extender.stop()
+
+    with unittest.mock.patch('requests.Session.request') as mock:
+        asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+    assert not mock.called
+    assert [report[:2] for report in engine.reports[:2]] == [('extendLock', 'anId')] * 2
+
+
+def test_asyncworker_extends_locks_with_client(engine_url, engine, async_client):
+    engine.add_tasks(external_task_json('1'))
+    sent = []
+    request = async_client.request
+
+    async def record(method, url, **kwargs):
+        sent.append((url.split('/')[-1], kwargs.get('auth')))
+        return await request(method, url, **kwargs)
+
+    async_client.request = record
+
+    async def handler(task):
+        while len(engine.reports) < 2:
+            await asyncio.sleep(0.001)
+
+    async def main():
+        worker = pycamunda.worker.AsyncWorker(
+            url=engine_url, worker_id='aWorkerId', client=async_client
+        )
+        worker.auth = ('demo', 'demo')
+        worker.subscribe(topic='aTopic', handler=handler, lock_duration=100)
+        task = asyncio.ensure_future(worker.run())
+        while 'complete' not in [action for action, _, _ in engine.reports]:
+            await asyncio.sleep(0.001)
+        worker.stop()
+        await asyncio.wait_for(task, timeout=5)
+
+    with unittest.mock.patch('requests.Session.request') as mock:
+        asyncio.run(asyncio.wait_for(main(), timeout=10))
+
+    assert not mock.called
+    actions = [action for action, _, _ in engine.reports]
+    assert actions[:2] == ['extendLock', 'extendLock']
+    assert ('extendLock', ('demo', 'demo')) in sent
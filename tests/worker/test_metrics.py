@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import unittest.mock
+
+import pytest
+
+import pycamunda
+import pycamunda.metrics
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def test_worker_records_metrics(engine_url, engine):
+    engine.add_tasks(external_task_json('1'), external_task_json('2', topic_name='anotherTopic'))
+    registry = pycamunda.metrics.Registry()
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', metrics=registry)
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    worker.subscribe(topic='anotherTopic', handler=lambda task: None, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert engine.wait_for_reports(2)
+        assert engine.wait_for_fetches(2)
+        worker.stop()
+        thread.join(timeout=5)
+
+    assert registry.value('fetches_total') >= 2
+    assert registry.value('empty_fetches_total') >= 1
+    assert registry.count('fetch_duration_seconds') == registry.value('fetches_total')
+    for topic in ('aTopic', 'anotherTopic'):
+        labels = {'topic': topic}
+        assert registry.value('fetched_tasks_total', labels) == 1
+        assert registry.count('handler_duration_seconds', labels) == 1
+        assert registry.count('completion_latency_seconds', labels) == 1
+    assert registry.value('missed_lock_expirations_total', {'topic': 'aTopic'}) == 0
+
+
+def test_worker_counts_fetch_errors(engine_url):
+    registry = pycamunda.metrics.Registry()
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', fetch_error_timeout=5, metrics=registry
+    )
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    failed = threading.Event()
+
+    def request(*args, **kwargs):
+        failed.set()
+        raise pycamunda.PyCamundaException()
+
+    with unittest.mock.patch.object(worker, 'fetch', request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert failed.wait(5)
+        worker.stop()
+        thread.join(timeout=5)
+
+    assert registry.value('fetch_errors_total') == 1
+
+
+def test_worker_counts_missed_lock_expirations(engine_url, engine):
+    engine.add_tasks(external_task_json('1'))
+    registry = pycamunda.metrics.Registry()
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', extend_locks=False, metrics=registry
+    )
+    worker.subscribe(
+        topic='aTopic', handler=lambda task: time.sleep(0.05), lock_duration=10
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert engine.wait_for_reports(1)
+        worker.stop()
+        thread.join(timeout=5)
+
+    assert registry.value('missed_lock_expirations_total', {'topic': 'aTopic'}) == 1
+
+
+@pytest.mark.parametrize('extend_locks', [False, True])
+def test_worker_counts_lock_expirations_from_end_of_long_poll(engine_url, engine, extend_locks):
+    registry = pycamunda.metrics.Registry()
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', extend_locks=extend_locks, metrics=registry
+    )
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=200)
+
+    def request(session, method, url, json=None, **kwargs):
+        if url.endswith('/fetchAndLock') and not engine.fetches:
+            time.sleep(0.3)  # the task is locked late in a long poll
+            engine.add_tasks(external_task_json('1'))
+        return engine.request(method, url, json=json, **kwargs)
+
+    with unittest.mock.patch('requests.Session.request', request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        with engine.lock:
+            assert engine.reported.wait_for(
+                lambda: any(report[0] == 'complete' for report in engine.reports), timeout=5
+            )
+        worker.stop()
+        thread.join(timeout=5)
+
+    assert registry.value('missed_lock_expirations_total', {'topic': 'aTopic'}) == 0
+    assert registry.value('missed_lock_expirations_total') == 0
+
+
+def test_lockextender_counts_missed_locks_from_receipt(engine_url, engine):
+    registry = pycamunda.metrics.Registry()
+    extender = pycamunda.worker.LockExtender(
+        url=engine_url, worker_id='aWorkerId', margin=0.5, window=0, metrics=registry
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        extender.start()
+        now = time.monotonic()
+        extender.track('anId', lock_duration=200, locked_at=now - 1, received_at=now)
+        assert engine.wait_for_reports(1)
+        extender.stop()
+
+    assert registry.value('lock_extensions_total') >= 1
+    assert registry.value('missed_lock_expirations_total') == 0
+
+
+def test_lockextender_records_metrics(engine_url, engine):
+    registry = pycamunda.metrics.Registry()
+    extender = pycamunda.worker.LockExtender(
+        url=engine_url, worker_id='aWorkerId', margin=0.5, window=0, metrics=registry
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        extender.start()
+        extender.track('anId', lock_duration=200)
+        extender.track('anotherId', lock_duration=200, locked_at=time.monotonic() - 1)
+        assert engine.wait_for_reports(2)
+        extender.stop()
+
+    assert registry.value('lock_extensions_total') >= 2
+    assert registry.value('missed_lock_expirations_total') == 1
+
+
+def test_lockextender_counts_errors(engine_url):
+    registry = pycamunda.metrics.Registry()
+    extender = pycamunda.worker.LockExtender(
+        url=engine_url, worker_id='aWorkerId', margin=0.5, window=0, metrics=registry
+    )
+    extended = threading.Event()
+
+    def extend(id_, lock_duration):
+        extended.set()
+        return False
+
+    extender.extend = extend
+    extender.start()
+    extender.track('anId', lock_duration=100)
+    assert extended.wait(5)
+    extender.stop()
+
+    assert registry.value('lock_extension_errors_total') == 1
+    assert registry.value('lock_extensions_total') == 0
+
+
+def test_asyncworker_records_metrics(engine_url, engine, async_client):
+    engine.add_tasks(external_task_json('1'))
+    registry = pycamunda.metrics.Registry()
+    worker = pycamunda.worker.AsyncWorker(
+        url=engine_url, worker_id='aWorkerId', client=async_client, metrics=registry
+    )
+
+    async def handler(task):
+        return None
+
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+
+    async def main():
+        task = asyncio.ensure_future(worker.run())
+        while not engine.reports:
+            await asyncio.sleep(0.01)
+        worker.stop()
+        await task
+
+    asyncio.run(main())
+
+    labels = {'topic': 'aTopic'}
+    assert registry.value('fetched_tasks_total', labels) == 1
+    assert registry.count('handler_duration_seconds', labels) == 1
+    assert registry.count('completion_latency_seconds', labels) == 1
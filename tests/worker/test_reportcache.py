@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import time
+import unittest.mock
+
+import requests
+
+import pycamunda
+import pycamunda.client
+import pycamunda.externaltask
+import pycamunda.retry
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def test_reportcache_claim():
+    cache = pycamunda.worker.ReportCache()
+
+    assert cache.claim('anId')
+    assert not cache.claim('anId')
+    assert 'anId' in cache
+    assert len(cache) == 1
+
+
+def test_reportcache_discard():
+    cache = pycamunda.worker.ReportCache()
+    cache.claim('anId')
+    cache.discard('anId')
+    cache.discard('anotherId')
+
+    assert 'anId' not in cache
+    assert cache.claim('anId')
+
+
+def test_reportcache_evicts_least_recently_used():
+    cache = pycamunda.worker.ReportCache(maxsize=2)
+    cache.claim('1')
+    cache.claim('2')
+    cache.claim('1')
+    cache.claim('3')
+
+    assert '1' in cache
+    assert '2' not in cache
+    assert '3' in cache
+    assert len(cache) == 2
+
+
+def test_reportcache_expires():
+    cache = pycamunda.worker.ReportCache(ttl=0.01)
+    cache.claim('anId')
+    time.sleep(0.02)
+
+    assert 'anId' not in cache
+    assert cache.claim('anId')
+
+
+def test_reporter_skips_duplicate_reports():
+    request = unittest.mock.MagicMock(id_='anId')
+    reporter = pycamunda.worker.Reporter()
+
+    assert reporter.send(request)
+    assert reporter.send(request)
+    assert request.call_count == 1
+
+
+def test_reporter_sends_again_after_failure():
+    request = unittest.mock.MagicMock(id_='anId', side_effect=[pycamunda.BadRequest, None])
+    reporter = pycamunda.worker.Reporter()
+
+    assert not reporter.send(request)
+    assert reporter.send(request)
+    assert request.call_count == 2
+
+
+def test_reporter_recognizes_reported_task_on_retry():
+    request = unittest.mock.MagicMock(
+        id_='anId', side_effect=[pycamunda.PyCamundaException, pycamunda.NotFound]
+    )
+    reporter = pycamunda.worker.Reporter(backoff=0)
+
+    assert reporter.send(request)
+    assert 'anId' in reporter.cache
+
+
+def test_asyncreporter_skips_duplicate_reports():
+    request = unittest.mock.MagicMock(id_='anId')
+    request.acall = unittest.mock.AsyncMock()
+    reporter = pycamunda.worker.AsyncReporter()
+
+    async def main():
+        return [await reporter.send(request), await reporter.send(request)]
+
+    assert asyncio.run(main()) == [True, True]
+    assert request.acall.call_count == 1
+
+
+def test_asyncreporter_recognizes_reported_task_on_retry():
+    request = unittest.mock.MagicMock(id_='anId')
+    request.acall = unittest.mock.AsyncMock(
+        side_effect=[pycamunda.PyCamundaException, pycamunda.NotFound]
+    )
+    reporter = pycamunda.worker.AsyncReporter(backoff=0)
+
+    assert asyncio.run(reporter.send(request))
+
+
+def test_reporter_recognizes_reported_task_after_transport_retry():
+    responses = [
+        unittest.mock.MagicMock(status_code=503, ok=False),
+        unittest.mock.MagicMock(status_code=404, ok=False, **{'__bool__.return_value': False})
+    ]
+    request = pycamunda.externaltask.Unlock(url='http://localhost/engine-rest', id_='anId')
+    request.session = pycamunda.client.Client(retry=pycamunda.retry.RetryPolicy(backoff=0))
+    reporter = pycamunda.worker.Reporter(retries=0)
+
+    with unittest.mock.patch('requests.Session.request', side_effect=responses):
+        assert reporter.send(request)
+    assert 'anId' in reporter.cache
+
+
+def test_reporter_fails_on_not_found_after_connect_error(caplog):
+    responses = [
+        requests.exceptions.ConnectTimeout(),
+        unittest.mock.MagicMock(status_code=404, ok=False, **{'__bool__.return_value': False})
+    ]
+    request = pycamunda.externaltask.Complete(
+        url='http://localhost/engine-rest', id_='anId', worker_id='aWorkerId'
+    )
+    request.session = pycamunda.client.Client(retry=pycamunda.retry.RetryPolicy(backoff=0))
+    reporter = pycamunda.worker.Reporter(retries=0)
+
+    with unittest.mock.patch('requests.Session.request', side_effect=responses):
+        assert not reporter.send(request)
+    assert 'anId' not in reporter.cache
+    assert 'anId' in caplog.text
+
+
+def test_asyncreporter_fails_on_not_found_after_connect_error(caplog):
+    class Client:
+        retry = pycamunda.retry.RetryPolicy(backoff=0)
+
+        def __init__(self):
+            self.attempts = 0
+
+        async def request(self, method, url, **kwargs):
+            self.attempts += 1
+            if self.attempts == 1:
+                raise pycamunda.PyCamundaException() from requests.exceptions.ConnectTimeout()
+            return unittest.mock.MagicMock(
+                status_code=404, ok=False, **{'__bool__.return_value': False}
+            )
+
+    request = pycamunda.externaltask.Complete(
+        url='http://localhost/engine-rest', id_='anId', worker_id='aWorkerId'
+    )
+    client = Client()
+    reporter = pycamunda.worker.AsyncReporter(client=client, retries=0)
+
+    assert not asyncio.run(reporter.send(request))
+    assert client.attempts == 2
+    assert 'anId' not in reporter.cache
+    assert 'anId' in caplog.text
+
+
+def test_worker_reports_refetched_tasks_again(engine_url, engine):
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    worker.reporter.cache.claim('1')
+    external_task = pycamunda.externaltask.ExternalTask.load(external_task_json('1'))
+
+    worker._enqueue([external_task], locked_at=time.monotonic())
+
+    assert '1' not in worker.reporter.cache
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import unittest.mock
+
+import pycamunda
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def test_reporter_sends_right_away_when_not_started():
+    request = unittest.mock.MagicMock()
+    reporter = pycamunda.worker.Reporter()
+
+    future = reporter.submit(request)
+
+    assert future.result()
+    assert request.called
+
+
+def test_reporter_retries_transient_errors():
+    request = unittest.mock.MagicMock(side_effect=[pycamunda.PyCamundaException, None])
+    reporter = pycamunda.worker.Reporter(retries=2, backoff=0)
+
+    assert reporter.send(request)
+    assert request.call_count == 2
+
+
+def test_reporter_gives_up_after_retries(caplog):
+    request = unittest.mock.MagicMock(side_effect=pycamunda.NoSuccess, id_='anId')
+    reporter = pycamunda.worker.Reporter(retries=2, backoff=0)
+
+    assert not reporter.send(request)
+    assert request.call_count == 3
+    assert 'anId' in caplog.text
+
+
+def test_reporter_does_not_retry_client_errors():
+    for exception in (
+        pycamunda.BadRequest, pycamunda.Unauthorized, pycamunda.Forbidden, pycamunda.NotFound
+    ):
+        request = unittest.mock.MagicMock(side_effect=exception, _retried=False)
+        reporter = pycamunda.worker.Reporter(retries=2, backoff=0)
+
+        assert not reporter.send(request)
+        assert request.call_count == 1
+
+
+def test_reporter_sends_concurrently_within_window():
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+    release = threading.Event()
+
+    def send():
+        with lock:
+            in_flight.append(None)
+            peak.append(len(in_flight))
+        release.wait(5)
+        with lock:
+            in_flight.pop()
+
+    reporter = pycamunda.worker.Reporter(max_in_flight=3)
+    reporter.start()
+    futures = [reporter.submit(unittest.mock.MagicMock(side_effect=send)) for _ in range(3)]
+    blocked = threading.Thread(
+        target=lambda: futures.append(reporter.submit(unittest.mock.MagicMock()))
+    )
+    blocked.start()
+    blocked.join(timeout=0.1)
+    assert blocked.is_alive()
+    release.set()
+    blocked.join(timeout=5)
+    reporter.stop()
+
+    assert max(peak) == 3
+    assert all(future.result() for future in futures)
+    assert len(futures) == 4
+
+
+def test_asyncreporter_sends_concurrently_within_window():
+    in_flight = []
+    peak = []
+
+    async def send(client):
+        in_flight.append(None)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+
+    async def main():
+        reporter = pycamunda.worker.AsyncReporter(max_in_flight=3)
+        futures = []
+        for _ in range(10):
+            request = unittest.mock.MagicMock()
+            request.acall = send
+            futures.append(await reporter.submit(request))
+        await reporter.join()
+        return futures
+
+    futures = asyncio.run(main())
+
+    assert max(peak) == 3
+    assert all(future.result() for future in futures)
+
+
+def test_asyncreporter_retries_transient_errors():
+    request = unittest.mock.MagicMock()
+    request.acall = unittest.mock.AsyncMock(side_effect=[pycamunda.PyCamundaException, None])
+    reporter = pycamunda.worker.AsyncReporter(retries=2, backoff=0)
+
+    assert asyncio.run(reporter.send(request))
+    assert request.acall.call_count == 2
+
+
+def test_worker_frees_handler_slot_before_report_is_sent(engine_url, engine):
+    engine.add_tasks(external_task_json('1'), external_task_json('2'))
+    release = threading.Event()
+    handled = []
+
+    def request(session, method, url, **kwargs):
+        if url.endswith('/complete'):
+            release.wait(5)
+        return engine.request(method=method, url=url, **kwargs)
+
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', max_workers=1, adaptive_fetch=False
+    )
+    worker.subscribe(topic='aTopic', handler=handled.append, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        for _ in range(500):
+            if len(handled) == 2:
+                break
+            release.wait(0.01)
+        handled_before_release = len(handled)
+        release.set()
+        assert engine.wait_for_reports(2)
+        worker.stop()
+        thread.join(timeout=5)
+
+    assert handled_before_release == 2
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest.mock
+
+import pycamunda.externaltask
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def external_task(id_, topic_name='aTopic', priority=0):
+    return pycamunda.externaltask.ExternalTask.load(
+        external_task_json(id_, topic_name=topic_name, priority=priority)
+    )
+
+
+def pop_all(scheduler):
+    external_tasks = []
+    while True:
+        task = scheduler.pop()
+        if task is None:
+            return external_tasks
+        external_tasks.append(task)
+        scheduler.finish(task)
+
+
+def test_scheduler_keeps_fetch_order():
+    scheduler = pycamunda.worker.Scheduler()
+    scheduler.add_topic('aTopic')
+    for id_, priority in (('1', 0), ('2', 10), ('3', 5)):
+        scheduler.push(external_task(id_, priority=priority))
+
+    assert len(scheduler) == 3
+    assert [task.id_ for task in pop_all(scheduler)] == ['1', '2', '3']
+    assert len(scheduler) == 0
+
+
+def test_scheduler_uses_priority():
+    scheduler = pycamunda.worker.Scheduler(use_priority=True)
+    scheduler.add_topic('aTopic')
+    for id_, priority in (('1', 0), ('2', 10), ('3', 5), ('4', 10)):
+        scheduler.push(external_task(id_, priority=priority))
+
+    assert [task.id_ for task in pop_all(scheduler)] == ['2', '4', '3', '1']
+
+
+def test_scheduler_shares_slots_by_weight():
+    scheduler = pycamunda.worker.Scheduler()
+    scheduler.add_topic('aTopic', weight=3)
+    scheduler.add_topic('anotherTopic', weight=1)
+    for i in range(8):
+        scheduler.push(external_task(f'a{i}', topic_name='aTopic'))
+        scheduler.push(external_task(f'b{i}', topic_name='anotherTopic'))
+
+    first = [scheduler.pop().topic_name for _ in range(8)]
+
+    assert first.count('aTopic') == 6
+    assert first.count('anotherTopic') == 2
+
+
+def test_scheduler_does_not_starve_topics_after_burst():
+    scheduler = pycamunda.worker.Scheduler()
+    scheduler.add_topic('aTopic')
+    scheduler.add_topic('anotherTopic')
+    for i in range(100):
+        scheduler.push(external_task(f'a{i}', topic_name='aTopic'))
+    for _ in range(50):
+        scheduler.finish(scheduler.pop())
+    scheduler.push(external_task('b', topic_name='anotherTopic'))
+
+    assert [scheduler.pop().id_ for _ in range(2)].count('b') == 1
+
+
+def test_scheduler_serves_higher_topic_priority_first():
+    scheduler = pycamunda.worker.Scheduler()
+    scheduler.add_topic('aTopic')
+    scheduler.add_topic('anotherTopic', priority=1)
+    scheduler.push(external_task('1', topic_name='aTopic'))
+    scheduler.push(external_task('2', topic_name='anotherTopic'))
+    scheduler.push(external_task('3', topic_name='anotherTopic'))
+
+    assert [task.id_ for task in pop_all(scheduler)] == ['2', '3', '1']
+
+
+def test_scheduler_limits_running_per_topic():
+    scheduler = pycamunda.worker.Scheduler()
+    scheduler.add_topic('aTopic', max_running=1)
+    scheduler.add_topic('anotherTopic')
+    scheduler.push(external_task('1'))
+    scheduler.push(external_task('2'))
+
+    first = scheduler.pop()
+    assert scheduler.pop() is None
+    assert scheduler.fetchable() == ['anotherTopic']
+    scheduler.finish(first)
+    assert scheduler.pop().id_ == '2'
+
+
+def test_scheduler_remove_topic():
+    scheduler = pycamunda.worker.Scheduler()
+    scheduler.add_topic('aTopic')
+    scheduler.add_topic('anotherTopic')
+    scheduler.push(external_task('1'))
+    scheduler.push(external_task('2', topic_name='anotherTopic'))
+
+    assert [external_task.id_ for external_task in scheduler.remove_topic('aTopic')] == ['1']
+    assert len(scheduler) == 1
+    assert scheduler.pop().id_ == '2'
+
+
+def test_worker_fetches_only_topics_with_room(engine_url, engine):
+    engine.add_tasks(external_task_json('1'), external_task_json('2'))
+    release = threading.Event()
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', adaptive_fetch=False)
+    worker.subscribe(
+        topic='aTopic',
+        handler=lambda task: release.wait(5) and None,
+        lock_duration=10000,
+        max_running=1
+    )
+    worker.subscribe(topic='anotherTopic', handler=lambda task: None, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert engine.wait_for_fetches(2)
+        release.set()
+        assert engine.wait_for_reports(2)
+        worker.stop()
+        thread.join(timeout=5)
+
+    assert engine.fetches[0]['maxTasks'] == 10
+    assert [topic['topicName'] for topic in engine.fetches[1]['topics']] == ['anotherTopic']
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import unittest.mock
+
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def test_worker_unlocks_unstarted_tasks_on_stop(engine_url, engine):
+    engine.add_tasks(*(external_task_json(str(i)) for i in range(3)))
+    started = threading.Event()
+    release = threading.Event()
+
+    def handler(task):
+        started.set()
+        release.wait(5)
+
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', max_workers=1, max_tasks=3
+    )
+    worker.fetch_sizer.observe_handler(0.1)
+    worker.fetch_sizer.observe_fetch(1, fetched=1)
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert started.wait(5)
+        worker.stop()
+        assert engine.wait_for_reports(2)
+        assert thread.is_alive()
+        release.set()
+        thread.join(timeout=5)
+
+    assert sorted(engine.reports[:2]) == [('unlock', '1', {}), ('unlock', '2', {})]
+    assert engine.reports[2][:2] == ('complete', '0')
+
+
+def test_worker_stop_with_deadline(engine_url, engine):
+    engine.add_tasks(external_task_json('1'))
+    started = threading.Event()
+    release = threading.Event()
+
+    def handler(task):
+        started.set()
+        release.wait(5)
+
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert started.wait(5)
+        start = time.monotonic()
+        worker.stop(timeout=0.05)
+        thread.join(timeout=5)
+        assert time.monotonic() - start < 1
+        assert not engine.reports
+        release.set()
+        assert engine.wait_for_reports(1)
+
+    assert engine.reports[0][:2] == ('complete', '1')
+
+
+def test_worker_stop_bounds_inflight_fetch(engine_url, engine):
+    release = threading.Event()
+
+    def request(session, method, url, json=None, **kwargs):
+        if url.endswith('/fetchAndLock'):
+            engine.respond(url=url, json=json, delay=False)
+            release.wait(5)  # emulates a long poll without tasks
+        return engine.request(method, url, json=json, **kwargs)
+
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert engine.wait_for_fetches(1)
+        start = time.monotonic()
+        worker.stop(timeout=0.05)
+        thread.join(timeout=5)
+        assert time.monotonic() - start < 1
+        release.set()
+
+
+def test_worker_unlocks_tasks_of_inflight_fetch_on_stop(engine_url, engine):
+    release = threading.Event()
+
+    def request(session, method, url, json=None, **kwargs):
+        if url.endswith('/fetchAndLock'):
+            engine.respond(url=url, json=json, delay=False)
+            release.wait(5)
+            engine.add_tasks(external_task_json('1'))
+        return engine.request(method, url, json=json, **kwargs)
+
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', request):
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        assert engine.wait_for_fetches(1)
+        worker.stop(timeout=5)
+        release.set()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    assert engine.reports == [('unlock', '1', {})]
+
+
+def test_asyncworker_stop_cancels_inflight_fetch(engine_url, engine, async_client):
+    cancelled = []
+
+    class LongPollingClient:
+
+        async def request(self, method, url, json=None, **kwargs):
+            if url.endswith('/fetchAndLock'):
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(url)
+                    raise
+            return await async_client.request(method, url, json=json, **kwargs)
+
+    async def main():
+        worker = pycamunda.worker.AsyncWorker(
+            url=engine_url, worker_id='aWorkerId', client=LongPollingClient()
+        )
+        worker.subscribe(topic='aTopic', handler=asyncio.sleep, lock_duration=10000)
+        task = asyncio.ensure_future(worker.run())
+        await asyncio.sleep(0.05)
+        start = time.monotonic()
+        worker.stop(timeout=0.05)
+        await asyncio.wait_for(task, timeout=5)
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) < 1
+    assert len(cancelled) == 1
+
+
+def test_asyncworker_unlocks_unstarted_and_cancelled_tasks(engine_url, engine, async_client):
+    engine.add_tasks(*(external_task_json(str(i)) for i in range(3)))
+    cancelled = []
+
+    async def handler(task):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(task.id_)
+            raise
+
+    async def main():
+        worker = pycamunda.worker.AsyncWorker(
+            url=engine_url,
+            worker_id='aWorkerId',
+            max_workers=1,
+            max_tasks=3,
+            client=async_client
+        )
+        worker.fetch_sizer.observe_handler(0.1)
+        worker.fetch_sizer.observe_fetch(1, fetched=1)
+        worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+        task = asyncio.ensure_future(worker.run())
+        while not worker._running:
+            await asyncio.sleep(0.001)
+        worker.stop(timeout=0.05)
+        await asyncio.wait_for(task, timeout=5)
+
+    asyncio.run(main())
+
+    assert cancelled == ['0']
+    assert sorted(engine.reports) == [
+        ('unlock', '0', {}), ('unlock', '1', {}), ('unlock', '2', {})
+    ]
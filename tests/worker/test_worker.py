@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import threading
+import unittest.mock
+
+import pytest
+
+import pycamunda
+import pycamunda.worker
+from tests.worker.conftest import external_task_json
+
+
+def cpu_bound_handler(task):
+    return {'pid': os.getpid(), 'result': task.variables['aVar'].value}
+
+
+def cpu_bound_bpmn_error_handler(task):
+    raise pycamunda.worker.BPMNError('anErrorCode', 'anErrorMessage', {'aVar': 'aVal'})
+
+
+def start(worker):
+    thread = threading.Thread(target=worker.run, daemon=True)
+    thread.start()
+    return thread
+
+
+def stop(worker, thread):
+    worker.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_worker_subscribe(engine_url):
+    handler = unittest.mock.MagicMock()
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000, variables=['aVar'])
+
+    assert worker.topics['aTopic'].handler is handler
+    assert worker.topics['aTopic'].lock_duration == 10000
+    assert worker.topics['aTopic'].variables == ['aVar']
+
+
+def test_worker_max_tasks_defaults_to_max_workers(engine_url):
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', max_workers=4)
+
+    assert worker.max_tasks == 4
+
+
+def test_worker_run_requires_topics(engine_url):
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    with pytest.raises(AssertionError):
+        worker.run()
+
+
+def test_worker_fetches_subscribed_topics(engine_url, engine):
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', async_response_timeout=5000, use_priority=True
+    )
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = start(worker)
+        assert engine.wait_for_fetches(1)
+        stop(worker, thread)
+
+    assert engine.fetches[0] == {
+        'workerId': 'aWorkerId',
+        'maxTasks': 10,
+        'usePriority': True,
+        'asyncResponseTimeout': 5000,
+        'topics': [{'topicName': 'aTopic', 'lockDuration': 10000, 'deserializeValues': False}]
+    }
+
+
+def test_worker_fetches_with_filters(engine_url):
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(
+        topic='aTopic',
+        handler=lambda task: None,
+        lock_duration=10000,
+        tenant_id_in=['aTenantId'],
+        process_definition_key_in=['aProcessDefinitionKey']
+    )
+
+    assert worker.fetch_and_lock_request(max_tasks=1).topics == [{
+        'topicName': 'aTopic',
+        'lockDuration': 10000,
+        'deserializeValues': False,
+        'tenantIdIn': ['aTenantId'],
+        'processDefinitionKeyIn': ['aProcessDefinitionKey']
+    }]
+
+
+def test_worker_unsubscribe(engine_url):
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    worker.subscribe(topic='anotherTopic', handler=lambda task: None, lock_duration=10000)
+    worker.unsubscribe('aTopic')
+
+    assert list(worker.topics) == ['anotherTopic']
+    assert worker.scheduler.fetchable() == ['anotherTopic']
+
+
+def test_worker_fetch_holds_fetch_lock(engine_url, engine):
+    engine.add_tasks(external_task_json('1'))
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    worker.fetch_lock = unittest.mock.MagicMock(wraps=threading.Lock())
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        external_tasks = worker.fetch(max_tasks=1)
+
+    assert [external_task.id_ for external_task in external_tasks] == ['1']
+    worker.fetch_lock.acquire.assert_called_once()
+    worker.fetch_lock.release.assert_called_once()
+
+
+def test_worker_stops_waiting_for_fetch_lock(engine_url, engine):
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    worker.fetch_lock = threading.Semaphore(0)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = start(worker)
+        stop(worker, thread)
+
+    assert engine.fetches == []
+
+
+def test_worker_completes_tasks(engine_url, engine):
+    engine.add_tasks(external_task_json('1'), external_task_json('2'))
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(
+        topic='aTopic',
+        handler=lambda task: {'result': task.variables['aVar'].value},
+        lock_duration=10000
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = start(worker)
+        assert engine.wait_for_reports(2)
+        stop(worker, thread)
+
+    assert sorted(id_ for _, id_, _ in engine.reports) == ['1', '2']
+    for action, _, body in engine.reports:
+        assert action == 'complete'
+        assert body['workerId'] == 'aWorkerId'
+        assert body['variables'] == {'result': {'value': 'aVal', 'type': None, 'valueInfo': None}}
+
+
+def test_worker_handles_failure(engine_url, engine):
+    engine.add_tasks(external_task_json('1', retries=2), external_task_json('2'))
+
+    def handler(task):
+        raise ValueError('anErrorMessage')
+
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', retries=5, retry_timeout=1000
+    )
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = start(worker)
+        assert engine.wait_for_reports(2)
+        stop(worker, thread)
+
+    reports = {id_: (action, body) for action, id_, body in engine.reports}
+    assert reports['1'][0] == 'failure'
+    assert reports['1'][1]['errorMessage'] == 'anErrorMessage'
+    assert 'ValueError' in reports['1'][1]['errorDetails']
+    assert reports['1'][1]['retries'] == 1
+    assert reports['1'][1]['retryTimeout'] == 1000
+    assert reports['2'][1]['retries'] == 5
+
+
+def test_worker_handles_bpmn_error(engine_url, engine):
+    engine.add_tasks(external_task_json('1'))
+
+    def handler(task):
+        raise pycamunda.worker.BPMNError('anErrorCode', 'anErrorMessage', {'aVar': 'aVal'})
+
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = start(worker)
+        assert engine.wait_for_reports(1)
+        stop(worker, thread)
+
+    action, id_, body = engine.reports[0]
+    assert action == 'bpmnError'
+    assert body['errorCode'] == 'anErrorCode'
+    assert body['errorMessage'] == 'anErrorMessage'
+    assert body['variables'] == {'aVar': {'value': 'aVal', 'type': None, 'valueInfo': None}}
+
+
+def test_worker_fetches_only_free_capacity(engine_url, engine):
+    engine.add_tasks(*(external_task_json(str(i)) for i in range(5)))
+    release = threading.Event()
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', max_workers=2)
+    worker.subscribe(
+        topic='aTopic', handler=lambda task: release.wait(5) and None, lock_duration=10000
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = start(worker)
+        release.set()
+        assert engine.wait_for_reports(5)
+        stop(worker, thread)
+
+    assert all(fetch['maxTasks'] <= 2 for fetch in engine.fetches)
+    assert len(engine.reports) == 5
+
+
+def test_worker_does_not_fetch_without_capacity(engine_url, engine):
+    engine.add_tasks(*(external_task_json(str(i)) for i in range(3)))
+    started = threading.Semaphore(0)
+    release = threading.Event()
+
+    def handler(task):
+        started.release()
+        release.wait(5)
+
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', max_workers=2)
+    worker.subscribe(topic='aTopic', handler=handler, lock_duration=10000)
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = start(worker)
+        assert started.acquire(timeout=5) and started.acquire(timeout=5)
+        fetches = len(engine.fetches)
+        assert not started.acquire(timeout=0.1)
+        assert len(engine.fetches) == fetches
+        release.set()
+        assert engine.wait_for_reports(3)
+        stop(worker, thread)
+
+
+def test_worker_keeps_running_after_fetch_error(engine_url, engine):
+    engine.add_tasks(external_task_json('1'))
+    calls = []
+
+    def request(self, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise pycamunda.PyCamundaException
+        return engine.request(**kwargs)
+
+    worker = pycamunda.worker.Worker(
+        url=engine_url, worker_id='aWorkerId', fetch_error_timeout=0.01
+    )
+    worker.subscribe(topic='aTopic', handler=lambda task: None, lock_duration=10000)
+    with unittest.mock.patch('pycamunda.base.CamundaRequest._request', request):
+        thread = start(worker)
+        assert engine.wait_for_reports(1)
+        stop(worker, thread)
+
+    assert engine.reports[0][:2] == ('complete', '1')
+
+
+def test_worker_logs_report_errors(engine_url, caplog):
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId')
+    request = unittest.mock.MagicMock(side_effect=pycamunda.NotFound, id_='anId', _retried=False)
+
+    assert not worker.report(request).result()
+    assert 'anId' in caplog.text
+
+
+def test_bpmnerror_is_picklable():
+    error = pickle.loads(pickle.dumps(
+        pycamunda.worker.BPMNError('anErrorCode', 'anErrorMessage', {'aVar': 'aVal'})
+    ))
+
+    assert error.error_code == 'anErrorCode'
+    assert error.error_message == 'anErrorMessage'
+    assert error.variables == {'aVar': 'aVal'}
+
+
+def test_worker_runs_cpu_bound_handlers_in_processes(engine_url, engine):
+    engine.add_tasks(
+        external_task_json('1'), external_task_json('2', topic_name='anotherTopic')
+    )
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', max_processes=2)
+    worker.subscribe(
+        topic='aTopic', handler=cpu_bound_handler, lock_duration=10000, cpu_bound=True
+    )
+    worker.subscribe(
+        topic='anotherTopic',
+        handler=cpu_bound_bpmn_error_handler,
+        lock_duration=10000,
+        cpu_bound=True
+    )
+    with unittest.mock.patch('requests.Session.request', engine.request):
+        thread = start(worker)
+        assert engine.wait_for_reports(2, timeout=30)
+        stop(worker, thread)
+
+    reports = {id_: (action, body) for action, id_, body in engine.reports}
+    assert reports['1'][0] == 'complete'
+    assert reports['1'][1]['variables']['pid']['value'] != os.getpid()
+    assert reports['1'][1]['variables']['result']['value'] == 'aVal'
+    assert reports['2'][0] == 'bpmnError'
+    assert reports['2'][1]['variables'] == {
+        'aVar': {'value': 'aVal', 'type': None, 'valueInfo': None}
+    }
+    assert worker._process_pool is None
+
+
+def test_worker_spawns_handler_processes(engine_url):
+    worker = pycamunda.worker.Worker(url=engine_url, worker_id='aWorkerId', extend_locks=False)
+    worker.subscribe(
+        topic='aTopic', handler=cpu_bound_handler, lock_duration=10000, cpu_bound=True
+    )
+    worker._setup()
+    try:
+        assert worker._process_pool._mp_context.get_start_method() == 'spawn'
+    finally:
+        worker._teardown(wait=True)